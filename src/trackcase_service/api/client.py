@@ -1,9 +1,10 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.trackcase_service.db.session import get_db_session
+from src.trackcase_service.db.session import get_async_db_session, get_db_session
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.client import get_client_service
 from src.trackcase_service.utils.commons import parse_request_metadata
@@ -29,10 +30,10 @@ def insert_client(
     response_model=schemas.ClientResponse,
     status_code=HTTPStatus.OK,
 )
-def find_client(
+async def find_client(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -40,7 +41,9 @@ def find_client(
                 column="name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_client_service(db_session).read_client(request, request_metadata)
+    return await get_client_service(db_session).read_client_async(
+        request, request_metadata
+    )
 
 
 @router.put(
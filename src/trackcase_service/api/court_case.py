@@ -1,9 +1,10 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.trackcase_service.db.session import get_db_session
+from src.trackcase_service.db.session import get_async_db_session, get_db_session
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.court_case import get_court_case_service
 from src.trackcase_service.utils.commons import parse_request_metadata
@@ -31,12 +32,14 @@ def insert_court_case(
     response_model=schemas.CourtCaseResponse,
     status_code=HTTPStatus.OK,
 )
-def find_court_case(
+async def find_court_case(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
-    return get_court_case_service(db_session).read_court_case(request, request_metadata)
+    return await get_court_case_service(db_session).read_court_case_async(
+        request, request_metadata
+    )
 
 
 @router.put(
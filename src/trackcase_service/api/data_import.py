@@ -1,36 +1,90 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Query, Request, Response
 
-from src.trackcase_service.db.session import get_db_session
-from src.trackcase_service.service.data_import import (
-    get_courts_import_service,
-    get_judges_import_service,
-)
+from src.trackcase_service.service import schemas
+from src.trackcase_service.service.data_import import get_import_job_runner
+from src.trackcase_service.utils.commons import has_permission, raise_http_exception
 
 router = APIRouter(prefix="/import", tags=["Import Data from Various Web Sources"])
+# imports create and update rows, their jobs and reports need the same permission
+IMPORT_JOB_PERMISSIONS = {
+    schemas.ImportJobTypes.COURTS: "COURTS_CREATE",
+    schemas.ImportJobTypes.JUDGES: "JUDGES_CREATE",
+}
+
+
+def check_import_job_permission(request: Request, job_type: schemas.ImportJobTypes):
+    if not has_permission(IMPORT_JOB_PERMISSIONS[job_type], request):
+        raise_http_exception(
+            request, HTTPStatus.FORBIDDEN, "Insufficient permissions..."
+        )
 
 
 @router.get(
     "/courts",
-    status_code=HTTPStatus.OK,
+    response_model=schemas.ImportJob,
+    status_code=HTTPStatus.ACCEPTED,
 )
 def import_courts(
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    is_force: bool = Query(default=False),
 ):
-    get_courts_import_service(db_session, request).import_courts()
-    return {"scrape": "successful"}
+    check_import_job_permission(request, schemas.ImportJobTypes.COURTS)
+    return get_import_job_runner().submit(
+        schemas.ImportJobTypes.COURTS, request, is_force
+    )
 
 
 @router.get(
     "/judges",
-    status_code=HTTPStatus.OK,
+    response_model=schemas.ImportJob,
+    status_code=HTTPStatus.ACCEPTED,
 )
 def import_judges(
     request: Request,
-    db_session: Session = Depends(get_db_session),
+    is_force: bool = Query(default=False),
 ):
-    get_judges_import_service(db_session, request).import_judges()
-    return {"scrape": "successful"}
+    check_import_job_permission(request, schemas.ImportJobTypes.JUDGES)
+    return get_import_job_runner().submit(
+        schemas.ImportJobTypes.JUDGES, request, is_force
+    )
+
+
+@router.get(
+    "/jobs/{job_id}/",
+    response_model=schemas.ImportJob,
+    status_code=HTTPStatus.OK,
+)
+def find_import_job(job_id: str, request: Request):
+    import_job = get_import_job_runner().get_job(job_id)
+    if not import_job:
+        raise_http_exception(
+            request, HTTPStatus.NOT_FOUND, f"Import Job Not Found By Id: {job_id}!!!"
+        )
+    check_import_job_permission(request, import_job.job_type)
+    return import_job
+
+
+@router.get(
+    "/jobs/{job_id}/{report_name}/",
+    status_code=HTTPStatus.OK,
+)
+def download_import_job_report(job_id: str, report_name: str, request: Request):
+    import_job_runner = get_import_job_runner()
+    import_job = import_job_runner.get_job(job_id)
+    if import_job:
+        check_import_job_permission(request, import_job.job_type)
+    csv_report = import_job_runner.get_csv_report(job_id, report_name)
+    if not import_job or csv_report is None:
+        raise_http_exception(
+            request,
+            HTTPStatus.NOT_FOUND,
+            f"Import Job Report Not Found By Id: {job_id} and Name: {report_name}!!!",
+        )
+    file_name = f"{import_job.job_type.lower()}_import_{report_name}.csv"
+    return Response(
+        content=csv_report,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
+    )
@@ -1,9 +1,10 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.trackcase_service.db.session import get_db_session
+from src.trackcase_service.db.session import get_async_db_session, get_db_session
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.ref_types import get_ref_types_service
 from src.trackcase_service.utils.commons import parse_request_metadata
@@ -12,10 +13,10 @@ router = APIRouter(prefix="/types", tags=["Ref Types"])
 
 
 @router.get("/ref_types/", summary="Get All Ref Types")
-def get_all_ref_types(
+async def get_all_ref_types(
     request: Request,
     components: str = Query(default=""),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     ref_types_response_data = schemas.RefTypesResponseData()
     if components:
@@ -38,34 +39,34 @@ def get_all_ref_types(
         )
 
         if component == schemas.RefTypesServiceRegistry.COLLECTION_METHOD:
-            ref_types_response_data.collection_methods = get_ref_types_service(
+            ref_types_response_data.collection_methods = await get_ref_types_service(
                 schemas.RefTypesServiceRegistry.COLLECTION_METHOD, db_session
-            ).read_collection_method(request, request_metadata)
+            ).read_collection_method_async(request, request_metadata)
         if component == schemas.RefTypesServiceRegistry.CASE_TYPE:
-            ref_types_response_data.case_types = get_ref_types_service(
+            ref_types_response_data.case_types = await get_ref_types_service(
                 schemas.RefTypesServiceRegistry.CASE_TYPE, db_session
-            ).read_case_type(request, request_metadata)
+            ).read_case_type_async(request, request_metadata)
         if component == schemas.RefTypesServiceRegistry.FILING_TYPE:
-            ref_types_response_data.filing_types = get_ref_types_service(
+            ref_types_response_data.filing_types = await get_ref_types_service(
                 schemas.RefTypesServiceRegistry.FILING_TYPE, db_session
-            ).read_filing_type(request, request_metadata)
+            ).read_filing_type_async(request, request_metadata)
         if component == schemas.RefTypesServiceRegistry.HEARING_TYPE:
-            ref_types_response_data.hearing_types = get_ref_types_service(
+            ref_types_response_data.hearing_types = await get_ref_types_service(
                 schemas.RefTypesServiceRegistry.HEARING_TYPE, db_session
-            ).read_hearing_type(request, request_metadata)
+            ).read_hearing_type_async(request, request_metadata)
         if component == schemas.RefTypesServiceRegistry.TASK_TYPE:
-            ref_types_response_data.task_types = get_ref_types_service(
+            ref_types_response_data.task_types = await get_ref_types_service(
                 schemas.RefTypesServiceRegistry.TASK_TYPE, db_session
-            ).read_task_type(request, request_metadata)
+            ).read_task_type_async(request, request_metadata)
         if component == schemas.RefTypesServiceRegistry.COMPONENT_STATUS:
             request_metadata = schemas.RequestMetadata(
                 sort_config=schemas.SortConfig(
                     column="component_name", direction=schemas.SortDirection.ASC
                 )
             )
-            ref_types_response_data.component_statuses = get_ref_types_service(
+            ref_types_response_data.component_statuses = await get_ref_types_service(
                 schemas.RefTypesServiceRegistry.COMPONENT_STATUS, db_session
-            ).read_component_status(request, request_metadata)
+            ).read_component_status_async(request, request_metadata)
     return schemas.RefTypesResponse(data=ref_types_response_data)
 
 
@@ -90,10 +91,10 @@ def insert_component_status(
     response_model=schemas.ComponentStatusResponse,
     status_code=HTTPStatus.OK,
 )
-def find_component_status(
+async def find_component_status(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -101,9 +102,9 @@ def find_component_status(
                 column="component_name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_ref_types_service(
+    return await get_ref_types_service(
         schemas.RefTypesServiceRegistry.COMPONENT_STATUS, db_session
-    ).read_component_status(request, request_metadata)
+    ).read_component_status_async(request, request_metadata)
 
 
 @router.put(
@@ -162,10 +163,10 @@ def insert_collection_method(
     response_model=schemas.CollectionMethodResponse,
     status_code=HTTPStatus.OK,
 )
-def find_collection_method(
+async def find_collection_method(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -173,9 +174,9 @@ def find_collection_method(
                 column="name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_ref_types_service(
+    return await get_ref_types_service(
         schemas.RefTypesServiceRegistry.COLLECTION_METHOD, db_session
-    ).read_collection_method(request, request_metadata)
+    ).read_collection_method_async(request, request_metadata)
 
 
 @router.put(
@@ -232,10 +233,10 @@ def insert_case_type(
 @router.get(
     "/case_type/", response_model=schemas.CaseTypeResponse, status_code=HTTPStatus.OK
 )
-def find_case_type(
+async def find_case_type(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -243,9 +244,9 @@ def find_case_type(
                 column="name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_ref_types_service(
+    return await get_ref_types_service(
         schemas.RefTypesServiceRegistry.CASE_TYPE, db_session
-    ).read_case_type(request, request_metadata)
+    ).read_case_type_async(request, request_metadata)
 
 
 @router.put(
@@ -302,10 +303,10 @@ def insert_filing_type(
     response_model=schemas.FilingTypeResponse,
     status_code=HTTPStatus.OK,
 )
-def find_filing_type(
+async def find_filing_type(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -313,9 +314,9 @@ def find_filing_type(
                 column="name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_ref_types_service(
+    return await get_ref_types_service(
         schemas.RefTypesServiceRegistry.FILING_TYPE, db_session
-    ).read_filing_type(request, request_metadata)
+    ).read_filing_type_async(request, request_metadata)
 
 
 @router.put(
@@ -372,10 +373,10 @@ def insert_hearing_type(
     response_model=schemas.HearingTypeResponse,
     status_code=HTTPStatus.OK,
 )
-def find_hearing_type(
+async def find_hearing_type(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -383,9 +384,9 @@ def find_hearing_type(
                 column="name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_ref_types_service(
+    return await get_ref_types_service(
         schemas.RefTypesServiceRegistry.HEARING_TYPE, db_session
-    ).read_hearing_type(request, request_metadata)
+    ).read_hearing_type_async(request, request_metadata)
 
 
 @router.put(
@@ -440,10 +441,10 @@ def insert_task_type(
 @router.get(
     "/task_type/", response_model=schemas.TaskTypeResponse, status_code=HTTPStatus.OK
 )
-def find_task_type(
+async def find_task_type(
     request: Request,
     request_metadata: schemas.RequestMetadata = Depends(parse_request_metadata),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ):
     if not request_metadata:
         request_metadata = schemas.RequestMetadata(
@@ -451,9 +452,9 @@ def find_task_type(
                 column="name", direction=schemas.SortDirection.ASC
             )
         )
-    return get_ref_types_service(
+    return await get_ref_types_service(
         schemas.RefTypesServiceRegistry.TASK_TYPE, db_session
-    ).read_task_type(request, request_metadata)
+    ).read_task_type_async(request, request_metadata)
 
 
 @router.put(
@@ -1,12 +1,16 @@
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from src.trackcase_service.db.session import get_db_session
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.user_management import get_user_management_service
-from src.trackcase_service.utils.commons import parse_request_metadata
+from src.trackcase_service.utils.commons import (
+    parse_request_metadata,
+    revoke_auth_credentials,
+)
 
 router = APIRouter(
     prefix="/users",
@@ -16,6 +20,14 @@ router = APIRouter(
 
 # app users
 # create_app_user is in main.py
+@router.post("/app_users/logout/", status_code=HTTPStatus.NO_CONTENT)
+def logout_app_user(
+    request: Request,
+    http_auth_credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+):
+    revoke_auth_credentials(request, http_auth_credentials)
+
+
 @router.get(
     "/app_users/", response_model=schemas.AppUserResponse, status_code=HTTPStatus.OK
 )
@@ -1,6 +1,6 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -48,11 +48,12 @@ def insert_app_user(
 def login_app_user(
     request: Request,
     login_request: schemas.AppUserLoginRequest,
+    background_tasks: BackgroundTasks,
     db_session: Session = Depends(get_db_session),
 ):
     return get_user_password_service(
         login_request.password, login_request.username
-    ).login_user(request, db_session)
+    ).login_user(request, db_session, background_tasks)
 
 
 @router.get(
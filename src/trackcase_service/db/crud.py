@@ -1,26 +1,111 @@
+import base64
+import hashlib
+import json
 import math
+from contextlib import contextmanager
 from datetime import datetime
+from decimal import Decimal
 from typing import Dict, List, NamedTuple, Type, TypeVar, Union
 
-from sqlalchemy import asc, desc, func, text
-from sqlalchemy.orm import Query, Session
+from sqlalchemy import (
+    Select,
+    and_,
+    asc,
+    bindparam,
+    desc,
+    event,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Compiled
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from src.trackcase_service.db.models import Base
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.schemas import (
+    CountStrategy,
     FilterConfig,
     FilterOperation,
     ResponseMetadata,
     SortConfig,
     SortDirection,
 )
-from src.trackcase_service.utils.convert import create_default_schema_instance
+from src.trackcase_service.utils.cache import (
+    RAW_SQL_CACHE_KEY,
+    clear_total_items_cache,
+    get_total_items_cache,
+    get_total_items_cache_generation,
+    set_total_items_cache,
+)
+from src.trackcase_service.utils.constants import ESTIMATED_COUNT_EXACT_THRESHOLD
+from src.trackcase_service.utils.convert import convert_raw_data_to_schema
 
 ModelBase = TypeVar("ModelBase", bound=Base)
 DataKeys = NamedTuple("DataKeys", [("data", str), ("metadata", str)])
+# session info key, tables written in the open unit of work
+UNIT_OF_WORK_KEY = "unit_of_work_tables"
+# session info key, tables written by statements the caller commits
+PENDING_CACHE_CLEAR_KEY = "pending_cache_clear_tables"
+# dialects with INSERT ... ON CONFLICT DO NOTHING ... RETURNING
+DIALECT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+# relationships to eager load in read, instead of lazy loading them per row
+# default ones are always loaded, extra and history per request metadata flags
+class LoadingProfile(NamedTuple):
+    default: tuple[str, ...] = ()
+    extra: tuple[str, ...] = ()
+    history: tuple[str, ...] = ()
+
+
+# entity and history writes flushed together and committed once at the end
+# nested units of work join the outer one, any exception rolls back all of it
+@contextmanager
+def unit_of_work(db_session: Session):
+    if UNIT_OF_WORK_KEY in db_session.info:
+        yield db_session
+        return
+    db_session.info[UNIT_OF_WORK_KEY] = set()
+    try:
+        yield db_session
+        db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    finally:
+        table_names = db_session.info.pop(UNIT_OF_WORK_KEY)
+    for table_name in table_names:
+        clear_total_items_cache(table_name)
+
+
+# counts are cleared once the write is visible, not before the caller commits
+# otherwise a read in between caches the old count again until the next write
+def clear_total_items_cache_after_commit(db_session: Session, table_name: str):
+    db_session.info.setdefault(PENDING_CACHE_CLEAR_KEY, set()).add(table_name)
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_pending_total_items_cache(db_session: Session):
+    for table_name in db_session.info.pop(PENDING_CACHE_CLEAR_KEY, ()):
+        clear_total_items_cache(table_name)
+
+
+# soft rollback fires for savepoints too, the outer transaction keeps them
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_total_items_cache(db_session: Session, previous_transaction):
+    if not db_session.in_transaction():
+        db_session.info.pop(PENDING_CACHE_CLEAR_KEY, None)
 
 
 class CrudService:
+    loading_profile: LoadingProfile = LoadingProfile()
+
     def __init__(self, db_session: Session, db_model: Type[ModelBase]):
         self.db_model = db_model
         self.db_session = db_session
@@ -30,10 +115,45 @@ class CrudService:
         setattr(model_data, "modified", func.now())
         setattr(model_data, "is_deleted", False)
         self.db_session.add(model_data)
-        self.db_session.commit()
-        self.db_session.refresh(model_data)
+        self._commit(model_data)
         return model_data
 
+    # multi row inserts, rows violating a unique constraint are skipped
+    # returns {key_column value: id} of inserted rows, caller commits
+    def create_bulk(
+        self, models_data: List[ModelBase], key_column: str = None
+    ) -> Dict[object, int]:
+        if not models_data:
+            return {}
+        columns = [
+            column.key
+            for column in self.db_model.__table__.columns
+            if column.key not in ("id", "created", "modified", "is_deleted")
+        ]
+        insert = DIALECT_INSERTS.get(self.db_session.bind.dialect.name)
+        if insert is None:
+            raise ValueError(
+                f"Bulk insert not supported for: {self.db_session.bind.dialect.name}"
+            )
+        statement = insert(self.db_model).values(
+            created=func.now(), modified=func.now(), is_deleted=False
+        )
+        if key_column:
+            statement = statement.on_conflict_do_nothing().returning(
+                getattr(self.db_model, key_column), self.db_model.id
+            )
+        result = self.db_session.execute(
+            statement,
+            [
+                {column: getattr(model_data, column) for column in columns}
+                for model_data in models_data
+            ],
+        )
+        clear_total_items_cache_after_commit(
+            self.db_session, self.db_model.__tablename__
+        )
+        return dict(result.all()) if key_column else {}
+
     def read(
         self,
         model_id: int = None,
@@ -43,67 +163,207 @@ class CrudService:
         page_number: int = 1,
         per_page: int = 100,
         is_include_soft_deleted: bool = False,
+        cursor: str = None,
+        is_skip_count: bool = False,
+        count_strategy: CountStrategy = None,
+        is_include_extra: bool = False,
+        is_include_history: bool = False,
     ) -> Dict[str, Union[List[ModelBase], ResponseMetadata]]:
-        if model_id and model_id > 0:
-            query = self.db_session.query(self.db_model).filter(
-                self.db_model.id == model_id
+        loader_options = self._get_loader_options(is_include_extra, is_include_history)
+        statement = self._get_read_statement(
+            model_id, model_ids, filter_config, is_include_soft_deleted
+        )
+        if _is_read_by_ids(model_id, model_ids):
+            data = self.db_session.execute(statement.options(*loader_options))
+            return {DataKeys.data: data.scalars().all(), DataKeys.metadata: None}
+
+        per_page = min(per_page, 1000)  # Cap per_page at 1000
+        total_items = None
+        if not is_skip_count:
+            total_items = self._get_total_items(
+                statement, filter_config, is_include_soft_deleted, count_strategy
             )
-            if not is_include_soft_deleted:
-                query = query.filter(
-                    self.db_model.is_deleted == False  # noqa: E501, E712
-                )
-            data = query.first()
-            return {
-                DataKeys.data: [data] if data else [],
-                DataKeys.metadata: None,
-            }
-        elif model_ids and len(model_ids) > 0:
-            query = self.db_session.query(self.db_model).filter(
-                self.db_model.id.in_(model_ids)
+        data = self.db_session.execute(
+            self._get_page_statement(
+                statement, sort_config, page_number, per_page, cursor, loader_options
             )
-            if not is_include_soft_deleted:
-                query = query.filter(
-                    self.db_model.is_deleted == False  # noqa: E501, E712
-                )
-            data = query.all()
-            return {
-                DataKeys.data: data,
-                DataKeys.metadata: None,
-            }
-
-        if per_page > 1000:
-            per_page = 1000  # Cap per_page at 1000
+        )
+        return _get_read_response(
+            data.scalars().all(), sort_config, total_items, page_number, per_page
+        )
 
-        query: Query = self.db_session.query(self.db_model)
+    # same as read, for async routes on an AsyncSession
+    async def read_async(
+        self,
+        model_id: int = None,
+        model_ids: list[int] = None,
+        sort_config: SortConfig = None,
+        filter_config: List[FilterConfig] = None,
+        page_number: int = 1,
+        per_page: int = 100,
+        is_include_soft_deleted: bool = False,
+        cursor: str = None,
+        is_skip_count: bool = False,
+        count_strategy: CountStrategy = None,
+        is_include_extra: bool = False,
+        is_include_history: bool = False,
+    ) -> Dict[str, Union[List[ModelBase], ResponseMetadata]]:
+        loader_options = self._get_loader_options(is_include_extra, is_include_history)
+        statement = self._get_read_statement(
+            model_id, model_ids, filter_config, is_include_soft_deleted
+        )
+        if _is_read_by_ids(model_id, model_ids):
+            data = await self.db_session.execute(statement.options(*loader_options))
+            return {DataKeys.data: data.scalars().all(), DataKeys.metadata: None}
+
+        per_page = min(per_page, 1000)  # Cap per_page at 1000
+        total_items = None
+        if not is_skip_count:
+            total_items = await self._get_total_items_async(
+                statement, filter_config, is_include_soft_deleted, count_strategy
+            )
+        data = await self.db_session.execute(
+            self._get_page_statement(
+                statement, sort_config, page_number, per_page, cursor, loader_options
+            )
+        )
+        return _get_read_response(
+            data.scalars().all(), sort_config, total_items, page_number, per_page
+        )
 
+    def _get_read_statement(
+        self,
+        model_id: int = None,
+        model_ids: list[int] = None,
+        filter_config: List[FilterConfig] = None,
+        is_include_soft_deleted: bool = False,
+    ) -> Select:
+        statement = select(self.db_model)
+        if model_id and model_id > 0:
+            statement = statement.filter(self.db_model.id == model_id)
+        elif model_ids:
+            statement = statement.filter(self.db_model.id.in_(model_ids))
+        elif filter_config:
+            statement = _apply_filters(self.db_model, statement, filter_config)
         if not is_include_soft_deleted:
             # Add filter to exclude deleted rows
-            query = query.filter(
-                getattr(self.db_model, "is_deleted") == False  # noqa: E501, E712
+            statement = statement.filter(
+                self.db_model.is_deleted == False  # noqa: E501, E712
             )
+        return statement
 
-        if filter_config:
-            query = _apply_filters(self.db_model, query, filter_config)
-
-        if sort_config:
-            query = _apply_sort(self.db_model, query, sort_config)
-
-        total_items = query.count()
-        total_pages = math.ceil(total_items / per_page)
-        paginated_query = query.offset((page_number - 1) * per_page).limit(per_page)
-
-        data = paginated_query.all()
-        metadata = ResponseMetadata(
-            total_items=total_items,
-            total_pages=total_pages,
-            page_number=page_number,
-            per_page=per_page,
-        )
+    def _get_page_statement(
+        self,
+        statement: Select,
+        sort_config: SortConfig,
+        page_number: int,
+        per_page: int,
+        cursor: str,
+        loader_options: list,
+    ) -> Select:
+        # `id` is always the last sort key so that pages are deterministic
+        # and a cursor (sort column value + id) identifies a unique position
+        statement = _apply_sort(self.db_model, statement, sort_config)
+        statement = statement.options(*loader_options)
+        if cursor:
+            # seek past the last row of previous page instead of OFFSET
+            statement = _apply_seek(self.db_model, statement, sort_config, cursor)
+            return statement.limit(per_page)
+        return statement.offset((page_number - 1) * per_page).limit(per_page)
+
+    def _get_loader_options(
+        self, is_include_extra: bool = False, is_include_history: bool = False
+    ) -> list:
+        relationship_names = list(self.loading_profile.default)
+        if is_include_extra:
+            relationship_names.extend(self.loading_profile.extra)
+        if is_include_history:
+            relationship_names.extend(self.loading_profile.history)
+
+        loader_options = []
+        for relationship_path in dict.fromkeys(relationship_names):
+            # dotted paths load nested relationships, eg: court_case.client
+            loader_option, model = None, self.db_model
+            for relationship_name in relationship_path.split("."):
+                relationship_attr = getattr(model, relationship_name)
+                # join to-one relationships, select-in collections to avoid fan out
+                loader = (
+                    selectinload if relationship_attr.property.uselist else joinedload
+                )
+                loader_option = (
+                    loader(relationship_attr)
+                    if loader_option is None
+                    else getattr(loader_option, loader.__name__)(relationship_attr)
+                )
+                model = relationship_attr.property.mapper.class_
+            loader_options.append(loader_option)
+        return loader_options
 
-        return {
-            DataKeys.data: data,
-            DataKeys.metadata: metadata,
-        }
+    def _get_total_items(
+        self,
+        statement: Select,
+        filter_config: List[FilterConfig],
+        is_include_soft_deleted: bool,
+        count_strategy: CountStrategy,
+    ) -> int:
+        if count_strategy == CountStrategy.ESTIMATED:
+            if filter_config:
+                total_items = _get_estimated_count(
+                    self.db_session, _compile(self.db_session, statement)
+                )
+            else:
+                total_items = _get_estimated_count_table(
+                    self.db_session, self.db_model.__tablename__
+                )
+            if total_items is not None:
+                return total_items
+        elif count_strategy == CountStrategy.CACHED:
+            table_name = self.db_model.__tablename__
+            cache_key = _get_total_items_cache_key(
+                table_name, filter_config, is_include_soft_deleted
+            )
+            total_items = get_total_items_cache(cache_key)
+            if total_items is None:
+                generation = get_total_items_cache_generation(table_name)
+                total_items = self.db_session.execute(
+                    _get_count_statement(statement)
+                ).scalar()
+                set_total_items_cache(cache_key, table_name, generation, total_items)
+            return total_items
+        return self.db_session.execute(_get_count_statement(statement)).scalar()
+
+    async def _get_total_items_async(
+        self,
+        statement: Select,
+        filter_config: List[FilterConfig],
+        is_include_soft_deleted: bool,
+        count_strategy: CountStrategy,
+    ) -> int:
+        if count_strategy == CountStrategy.ESTIMATED:
+            if filter_config:
+                total_items = await _get_estimated_count_async(
+                    self.db_session, _compile(self.db_session, statement)
+                )
+            else:
+                total_items = await _get_estimated_count_table_async(
+                    self.db_session, self.db_model.__tablename__
+                )
+            if total_items is not None:
+                return total_items
+        elif count_strategy == CountStrategy.CACHED:
+            table_name = self.db_model.__tablename__
+            cache_key = _get_total_items_cache_key(
+                table_name, filter_config, is_include_soft_deleted
+            )
+            total_items = get_total_items_cache(cache_key)
+            if total_items is None:
+                generation = get_total_items_cache_generation(table_name)
+                total_items = (
+                    await self.db_session.execute(_get_count_statement(statement))
+                ).scalar()
+                set_total_items_cache(cache_key, table_name, generation, total_items)
+            return total_items
+        return (await self.db_session.execute(_get_count_statement(statement))).scalar()
 
     def update(
         self, model_id: int, model_data: ModelBase, is_restore: bool = False
@@ -116,10 +376,44 @@ class CrudService:
         else:
             db_record = _copy_key_values(model_data, db_record)
         setattr(db_record, "modified", func.now())
-        self.db_session.commit()
-        self.db_session.refresh(db_record)
+        self._commit(db_record)
         return db_record
 
+    def _commit(self, model_data: ModelBase):
+        unit_of_work_tables = self.db_session.info.get(UNIT_OF_WORK_KEY)
+        if unit_of_work_tables is None:
+            self.db_session.commit()
+            clear_total_items_cache(self.db_model.__tablename__)
+            self.db_session.refresh(model_data)
+        else:
+            self.db_session.flush()
+            unit_of_work_tables.add(self.db_model.__tablename__)
+
+    # single executemany update, each dict has the id and the columns to set
+    # caller commits
+    def update_bulk(self, models_values: List[Dict[str, object]]):
+        if not models_values:
+            return
+        table = self.db_model.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(modified=func.now())
+        )
+        self.db_session.execute(
+            statement,
+            [
+                {
+                    ("_id" if column == "id" else column): value
+                    for column, value in model_values.items()
+                }
+                for model_values in models_values
+            ],
+        )
+        clear_total_items_cache_after_commit(
+            self.db_session, self.db_model.__tablename__
+        )
+
     def delete(self, model_id: int, is_hard_delete: bool = False):
         db_record = self.db_session.query(self.db_model).get(model_id)
         # exists check done in controller/api for better messaging, so no need again
@@ -130,6 +424,7 @@ class CrudService:
             setattr(db_record, "deleted_date", func.now())
             setattr(db_record, "is_deleted", True)
         self.db_session.commit()
+        clear_total_items_cache(self.db_model.__tablename__)
         return True
 
 
@@ -143,41 +438,295 @@ class CrudServiceRaw:
         sql_query: str,
         page_number: int = 1,
         per_page: int = 100,
+        sort_config: SortConfig = None,
+        cursor: str = None,
+        is_skip_count: bool = False,
+        count_strategy: CountStrategy = None,
+        is_validate: bool = False,
     ) -> Dict[str, Union[List[object], object]]:
-        if per_page > 1000:
-            per_page = 1000  # Cap per_page at 1000
+        per_page = min(per_page, 1000)  # Cap per_page at 1000
+        total_items = None
+        if not is_skip_count:
+            total_items = self._get_total_items(sql_query, count_strategy)
+        paginated_query, seek_params = _get_paginated_query_raw(
+            sql_query, sort_config, page_number, per_page, cursor
+        )
+        result = self.db_session.execute(text(paginated_query), seek_params)
+        return _get_read_response_raw(
+            result,
+            class_type,
+            sort_config,
+            total_items,
+            page_number,
+            per_page,
+            is_validate,
+        )
 
-        total_items_query = f"SELECT COUNT(*) FROM ({sql_query}) as total_items_query"
-        total_items = self.db_session.execute(text(total_items_query)).scalar()
-        total_pages = math.ceil(total_items / per_page)
+    # same as read, for async routes on an AsyncSession
+    async def read_async(
+        self,
+        class_type: Type[schemas.BaseSchema],
+        sql_query: str,
+        page_number: int = 1,
+        per_page: int = 100,
+        sort_config: SortConfig = None,
+        cursor: str = None,
+        is_skip_count: bool = False,
+        count_strategy: CountStrategy = None,
+        is_validate: bool = False,
+    ) -> Dict[str, Union[List[object], object]]:
+        per_page = min(per_page, 1000)  # Cap per_page at 1000
+        total_items = None
+        if not is_skip_count:
+            total_items = await self._get_total_items_async(sql_query, count_strategy)
+        paginated_query, seek_params = _get_paginated_query_raw(
+            sql_query, sort_config, page_number, per_page, cursor
+        )
+        result = await self.db_session.execute(text(paginated_query), seek_params)
+        return _get_read_response_raw(
+            result,
+            class_type,
+            sort_config,
+            total_items,
+            page_number,
+            per_page,
+            is_validate,
+        )
+
+    def _get_total_items(self, sql_query: str, count_strategy: CountStrategy) -> int:
+        if count_strategy == CountStrategy.ESTIMATED:
+            total_items = _get_estimated_count(self.db_session, sql_query)
+            if total_items is not None:
+                return total_items
+        elif count_strategy == CountStrategy.CACHED:
+            cache_key = _get_total_items_cache_key_raw(sql_query)
+            total_items = get_total_items_cache(cache_key)
+            if total_items is None:
+                generation = get_total_items_cache_generation(RAW_SQL_CACHE_KEY)
+                total_items = self.db_session.execute(
+                    _get_count_query_raw(sql_query)
+                ).scalar()
+                set_total_items_cache(
+                    cache_key, RAW_SQL_CACHE_KEY, generation, total_items
+                )
+            return total_items
+        return self.db_session.execute(_get_count_query_raw(sql_query)).scalar()
+
+    async def _get_total_items_async(
+        self, sql_query: str, count_strategy: CountStrategy
+    ) -> int:
+        if count_strategy == CountStrategy.ESTIMATED:
+            total_items = await _get_estimated_count_async(self.db_session, sql_query)
+            if total_items is not None:
+                return total_items
+        elif count_strategy == CountStrategy.CACHED:
+            cache_key = _get_total_items_cache_key_raw(sql_query)
+            total_items = get_total_items_cache(cache_key)
+            if total_items is None:
+                generation = get_total_items_cache_generation(RAW_SQL_CACHE_KEY)
+                total_items = (
+                    await self.db_session.execute(_get_count_query_raw(sql_query))
+                ).scalar()
+                set_total_items_cache(
+                    cache_key, RAW_SQL_CACHE_KEY, generation, total_items
+                )
+            return total_items
+        return (await self.db_session.execute(_get_count_query_raw(sql_query))).scalar()
+
+
+def _is_read_by_ids(model_id: int = None, model_ids: list[int] = None) -> bool:
+    return bool((model_id and model_id > 0) or model_ids)
+
+
+def _get_read_response(
+    data: list,
+    sort_config: SortConfig,
+    total_items: int,
+    page_number: int,
+    per_page: int,
+) -> Dict[str, Union[List[ModelBase], ResponseMetadata]]:
+    next_cursor = None
+    if len(data) == per_page:
+        next_cursor = _get_next_cursor(data[-1], sort_config)
+    metadata = ResponseMetadata(
+        total_items=total_items,
+        total_pages=None if total_items is None else math.ceil(total_items / per_page),
+        page_number=page_number,
+        per_page=per_page,
+        next_cursor=next_cursor,
+    )
+    return {
+        DataKeys.data: data,
+        DataKeys.metadata: metadata,
+    }
+
+
+def _get_count_statement(statement: Select) -> Select:
+    return select(func.count()).select_from(statement.subquery())
 
+
+def _get_total_items_cache_key(
+    table_name: str, filter_config: List[FilterConfig], is_include_soft_deleted: bool
+) -> tuple:
+    return (
+        table_name,
+        is_include_soft_deleted,
+        _get_filter_config_hash(filter_config),
+    )
+
+
+def _get_paginated_query_raw(
+    sql_query: str,
+    sort_config: SortConfig,
+    page_number: int,
+    per_page: int,
+    cursor: str,
+) -> tuple[str, dict]:
+    if cursor:
+        # sql_query is wrapped, so seek and sort use its output column names
+        seek_clause, seek_params = _get_seek_clause_raw(sort_config, cursor)
         paginated_query = (
-            f"{sql_query} LIMIT {per_page} OFFSET {(page_number - 1) * per_page}"
+            f"SELECT * FROM ({sql_query}) as paginated_query WHERE {seek_clause}"
+            f"{_get_sort_clause_raw(sort_config)} LIMIT {per_page}"
         )
-        result = self.db_session.execute(text(paginated_query))
-        column_names = result.keys()
-        data = [dict(zip(column_names, row)) for row in result.fetchall()]
-
-        metadata = ResponseMetadata(
-            total_items=total_items,
-            total_pages=total_pages,
-            page_number=page_number,
-            per_page=per_page,
+        return paginated_query, seek_params
+    paginated_query = (
+        f"{sql_query} LIMIT {per_page} OFFSET {(page_number - 1) * per_page}"
+    )
+    return paginated_query, {}
+
+
+def _get_read_response_raw(
+    result,
+    class_type: Type[schemas.BaseSchema],
+    sort_config: SortConfig,
+    total_items: int,
+    page_number: int,
+    per_page: int,
+    is_validate: bool,
+) -> Dict[str, Union[List[object], object]]:
+    column_names = result.keys()
+    data = [dict(zip(column_names, row)) for row in result.fetchall()]
+
+    next_cursor = None
+    if len(data) == per_page:
+        next_cursor = _get_next_cursor_raw(data[-1], sort_config)
+
+    metadata = ResponseMetadata(
+        total_items=total_items,
+        total_pages=None if total_items is None else math.ceil(total_items / per_page),
+        page_number=page_number,
+        per_page=per_page,
+        next_cursor=next_cursor,
+    )
+
+    class_objects = convert_raw_data_to_schema(data, class_type, is_validate)
+
+    return {
+        DataKeys.data: class_objects,
+        DataKeys.metadata: metadata,
+    }
+
+
+def _get_count_query_raw(sql_query: str):
+    return text(f"SELECT COUNT(*) FROM ({sql_query}) as total_items_query")
+
+
+def _get_total_items_cache_key_raw(sql_query: str) -> tuple:
+    return (RAW_SQL_CACHE_KEY, hashlib.sha256(sql_query.encode("utf-8")).hexdigest())
+
+
+# planner's row count of the table, as of its last vacuum/analyze
+ESTIMATED_COUNT_TABLE_QUERY = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"
+)
+
+
+def _get_estimated_count_table(db_session: Session, table_name: str) -> int | None:
+    if db_session.bind.dialect.name != "postgresql":
+        return None
+    estimated_count = db_session.execute(
+        ESTIMATED_COUNT_TABLE_QUERY, {"table_name": table_name}
+    ).scalar()
+    return _check_estimated_count(estimated_count)
+
+
+async def _get_estimated_count_table_async(
+    db_session: AsyncSession, table_name: str
+) -> int | None:
+    if db_session.bind.dialect.name != "postgresql":
+        return None
+    estimated_count = (
+        await db_session.execute(
+            ESTIMATED_COUNT_TABLE_QUERY, {"table_name": table_name}
+        )
+    ).scalar()
+    return _check_estimated_count(estimated_count)
+
+
+def _get_estimated_count(db_session: Session, sql_query) -> int | None:
+    if db_session.bind.dialect.name != "postgresql":
+        return None
+    # planner row estimate, sql_query is either raw sql or a compiled statement
+    explain_query = f"EXPLAIN (FORMAT JSON) {sql_query}"
+    if isinstance(sql_query, str):
+        explain_result = db_session.execute(text(explain_query)).scalar()
+    else:
+        explain_result = (
+            db_session.connection()
+            .exec_driver_sql(explain_query, _get_compiled_params(sql_query))
+            .scalar()
         )
+    return _get_explain_estimated_count(explain_result)
+
+
+async def _get_estimated_count_async(db_session: AsyncSession, sql_query) -> int | None:
+    if db_session.bind.dialect.name != "postgresql":
+        return None
+    explain_query = f"EXPLAIN (FORMAT JSON) {sql_query}"
+    if isinstance(sql_query, str):
+        explain_result = (await db_session.execute(text(explain_query))).scalar()
+    else:
+        db_connection = await db_session.connection()
+        explain_result = (
+            await db_connection.exec_driver_sql(
+                explain_query, _get_compiled_params(sql_query)
+            )
+        ).scalar()
+    return _get_explain_estimated_count(explain_result)
+
 
-        class_objects = []
-        field_names = class_type.model_fields
-        for row in data:
-            obj = create_default_schema_instance(class_type)
-            for column_name, value in row.items():
-                if column_name in field_names:
-                    setattr(obj, column_name, value)
-            class_objects.append(obj)
+def _compile(db_session: Session | AsyncSession, statement: Select) -> Compiled:
+    return statement.compile(dialect=db_session.bind.dialect)
 
-        return {
-            DataKeys.data: class_objects,
-            DataKeys.metadata: metadata,
-        }
+
+# asyncpg compiles to positional ($1) parameters, psycopg2 to named ones
+def _get_compiled_params(compiled: Compiled) -> tuple | dict:
+    if compiled.positional:
+        return tuple(compiled.params[name] for name in compiled.positiontup)
+    return compiled.params
+
+
+def _get_explain_estimated_count(explain_result) -> int | None:
+    if isinstance(explain_result, str):
+        explain_result = json.loads(explain_result)
+    return _check_estimated_count(int(explain_result[0]["Plan"]["Plan Rows"]))
+
+
+# reltuples is -1 until the table is first vacuumed/analyzed
+# estimates below the threshold are re-counted exactly, cheap for small tables
+def _check_estimated_count(estimated_count: int | None) -> int | None:
+    if estimated_count is None or estimated_count < ESTIMATED_COUNT_EXACT_THRESHOLD:
+        return None
+    return estimated_count
+
+
+def _get_filter_config_hash(filter_config: List[FilterConfig] = None) -> str:
+    filter_items = [
+        (filter_item.column, str(filter_item.value), filter_item.operation.value)
+        for filter_item in filter_config or []
+    ]
+    return hashlib.sha256(json.dumps(filter_items).encode("utf-8")).hexdigest()
 
 
 def _copy_key_values(model_data, db_record):
@@ -216,8 +765,8 @@ def _is_should_set_attr_value(model_data, attr_name, attr_value, attr_type) -> b
 
 
 def _apply_filters(
-    db_model: ModelBase, query: Query, filter_config: List[FilterConfig] = None
-) -> Query:
+    db_model: ModelBase, query: Select, filter_config: List[FilterConfig] = None
+) -> Select:
     for filter_item in filter_config:
         column = filter_item.column
         value = filter_item.value
@@ -230,11 +779,11 @@ def _apply_filters(
 
 def _apply_filter(
     db_model: ModelBase,
-    query: Query,
+    query: Select,
     column: str,
     value: Union[str, int, float, datetime],
     operation: FilterOperation,
-) -> Query:
+) -> Select:
     column_attr = getattr(db_model, column)
     if operation == FilterOperation.EQUAL_TO:
         query = query.filter(column_attr == value)
@@ -251,12 +800,134 @@ def _apply_filter(
     return query
 
 
-def _apply_sort(db_model: ModelBase, query: Query, sort_config: SortConfig) -> Query:
+def _apply_sort(db_model: ModelBase, query: Select, sort_config: SortConfig) -> Select:
     order_by_conditions = []
-    if sort_config.direction == SortDirection.ASC:
+    if sort_config is None or sort_config.column == "id":
+        direction = sort_config.direction if sort_config else SortDirection.ASC
+    elif sort_config.direction == SortDirection.ASC:
+        direction = SortDirection.ASC
         order_by_conditions.append(asc(getattr(db_model, sort_config.column)))
     elif sort_config.direction == SortDirection.DESC:
+        direction = SortDirection.DESC
         order_by_conditions.append(desc(getattr(db_model, sort_config.column)))
     else:
         raise ValueError("Unsupported operation for sort")
+    if direction == SortDirection.DESC:
+        order_by_conditions.append(desc(db_model.id))
+    else:
+        order_by_conditions.append(asc(db_model.id))
     return query.order_by(*order_by_conditions)
+
+
+def _apply_seek(
+    db_model: ModelBase, query: Select, sort_config: SortConfig, cursor: str
+) -> Select:
+    column, direction, last_value, last_id = _decode_cursor(cursor, sort_config)
+    id_attr = db_model.id
+    if column == "id":
+        if direction == SortDirection.DESC:
+            return query.filter(id_attr < last_id)
+        return query.filter(id_attr > last_id)
+
+    column_attr = getattr(db_model, column)
+    # postgres sorts NULLs last for ASC and first for DESC
+    if direction == SortDirection.DESC:
+        if last_value is None:
+            seek = or_(
+                and_(column_attr.is_(None), id_attr < last_id),
+                column_attr.is_not(None),
+            )
+        else:
+            seek = or_(
+                column_attr < last_value,
+                and_(column_attr == last_value, id_attr < last_id),
+            )
+    else:
+        if last_value is None:
+            seek = and_(column_attr.is_(None), id_attr > last_id)
+        else:
+            seek = or_(
+                column_attr > last_value,
+                and_(column_attr == last_value, id_attr > last_id),
+                column_attr.is_(None),
+            )
+    return query.filter(seek)
+
+
+def _get_next_cursor(last_row: ModelBase, sort_config: SortConfig) -> str:
+    column = sort_config.column if sort_config else "id"
+    return _encode_cursor(sort_config, getattr(last_row, column), last_row.id)
+
+
+def _get_next_cursor_raw(last_row: dict, sort_config: SortConfig) -> str | None:
+    column = sort_config.column if sort_config else "id"
+    if column not in last_row or "id" not in last_row:
+        return None
+    return _encode_cursor(sort_config, last_row.get(column), last_row.get("id"))
+
+
+def _get_sort_clause_raw(sort_config: SortConfig) -> str:
+    column = sort_config.column if sort_config else "id"
+    direction = sort_config.direction.value if sort_config else "ASC"
+    if column == "id":
+        return f" ORDER BY id {direction}"
+    return f" ORDER BY {column} {direction}, id {direction}"
+
+
+def _get_seek_clause_raw(sort_config: SortConfig, cursor: str) -> tuple[str, dict]:
+    column, direction, last_value, last_id = _decode_cursor(cursor, sort_config)
+    op = "<" if direction == SortDirection.DESC else ">"
+    params = {"seek_id": last_id, "seek_value": last_value}
+    if column == "id":
+        return f"id {op} :seek_id", params
+    if direction == SortDirection.DESC:
+        if last_value is None:
+            seek = f"(({column} IS NULL AND id < :seek_id) OR {column} IS NOT NULL)"
+        else:
+            seek = (
+                f"({column} < :seek_value OR "
+                f"({column} = :seek_value AND id < :seek_id))"
+            )
+    else:
+        if last_value is None:
+            seek = f"({column} IS NULL AND id > :seek_id)"
+        else:
+            seek = (
+                f"({column} > :seek_value OR "
+                f"({column} = :seek_value AND id > :seek_id) OR {column} IS NULL)"
+            )
+    return seek, params
+
+
+def _encode_cursor(sort_config: SortConfig, last_value, last_id: int) -> str:
+    value_type = None
+    if isinstance(last_value, datetime):
+        value_type, last_value = "datetime", last_value.isoformat()
+    elif isinstance(last_value, Decimal):
+        value_type, last_value = "decimal", str(last_value)
+    cursor = {
+        "c": sort_config.column if sort_config else "id",
+        "d": sort_config.direction.value if sort_config else SortDirection.ASC.value,
+        "v": last_value,
+        "t": value_type,
+        "i": last_id,
+    }
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode("utf-8")).decode("utf-8")
+
+
+def _decode_cursor(cursor: str, sort_config: SortConfig) -> tuple:
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+        column, direction = decoded["c"], SortDirection(decoded["d"])
+        last_value, last_id = decoded["v"], int(decoded["i"])
+        if last_value is not None and decoded.get("t") == "datetime":
+            last_value = datetime.fromisoformat(last_value)
+        elif last_value is not None and decoded.get("t") == "decimal":
+            last_value = Decimal(last_value)
+    except (ValueError, KeyError, TypeError, ArithmeticError) as ex:
+        raise ValueError("Invalid cursor for pagination") from ex
+    sort_column = sort_config.column if sort_config else "id"
+    sort_direction = sort_config.direction if sort_config else SortDirection.ASC
+    if column != sort_column or direction != sort_direction:
+        raise ValueError("Cursor does not match sort config for pagination")
+    return column, direction, last_value, last_id
@@ -5,10 +5,14 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
+    Text,
     UniqueConstraint,
+    func,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, relationship
@@ -17,9 +21,11 @@ Base: Any = declarative_base()
 
 
 class TableBase:
+    # with sql defaults, created/modified set to now() come back with RETURNING
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created = Column(DateTime, nullable=False)
-    modified = Column(DateTime, nullable=False)
+    created = Column(DateTime, nullable=False, default=func.now())
+    modified = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
     is_deleted = Column(Boolean, nullable=False, default=False)
     deleted_date = Column(DateTime, nullable=True)
 
@@ -37,6 +43,66 @@ class AddressBase:
     phone_number = Column(String(25), nullable=True)
 
 
+# version per cache key, bumped on writes so other workers clear their caches
+class CacheVersion(Base):
+    __tablename__ = "cache_version"
+    cache_key = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    modified = Column(DateTime, nullable=False)
+
+
+# write behind history, committed with the entity and moved to history by the writer
+class HistoryOutbox(Base):
+    __tablename__ = "history_outbox"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)
+    created = Column(DateTime, nullable=False)
+
+
+# logged out tokens by sha256 digest, denied by every worker until they expire
+class RevokedToken(Base):
+    __tablename__ = "revoked_token"
+    token_digest = Column(String(64), primary_key=True)
+    expires = Column(DateTime, nullable=False)
+    created = Column(DateTime, nullable=False)
+
+
+# import jobs and their reports, shared by all worker processes
+class ImportJob(Base):
+    __tablename__ = "import_job"
+    job_id = Column(String(32), primary_key=True)
+    job_type = Column(String(25), nullable=False)
+    status = Column(String(25), nullable=False)
+    app_user_id = Column(
+        ForeignKey(
+            "app_user.id",
+            onupdate="NO ACTION",
+            ondelete="RESTRICT",
+            name="import_job_app_user_id",
+        ),
+        nullable=False,
+    )
+    created = Column(DateTime, nullable=False)
+    started = Column(DateTime, nullable=True)
+    finished = Column(DateTime, nullable=True)
+    summary = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    # json of report name to csv
+    reports = Column(Text, nullable=True)
+
+    # one queued or running job per type, whichever worker it is submitted to
+    __table_args__ = (
+        Index(
+            "import_job_pending_job_type",
+            "job_type",
+            unique=True,
+            postgresql_where=text("status IN ('QUEUED', 'RUNNING')"),
+            sqlite_where=text("status IN ('QUEUED', 'RUNNING')"),
+        ),
+    )
+
+
 class ComponentStatus(TableBase, Base):
     __tablename__ = "component_status"
     component_name = Column(String(100), nullable=False)
@@ -635,6 +701,15 @@ class HearingCalendar(TableBase, Base):
         "HistoryTaskCalendar"
     )
 
+    # calendars are read by date window, mostly excluding soft deleted ones
+    __table_args__ = (
+        Index(
+            "hearing_calendar_is_deleted_hearing_date",
+            "is_deleted",
+            "hearing_date",
+        ),
+    )
+
 
 class HistoryHearingCalendar(TableBase, Base):
     __tablename__ = "history_hearing_calendar"
@@ -753,6 +828,14 @@ class TaskCalendar(TableBase, Base):
         back_populates="task_calendar"
     )
 
+    __table_args__ = (
+        Index(
+            "task_calendar_is_deleted_task_date",
+            "is_deleted",
+            "task_date",
+        ),
+    )
+
 
 class HistoryTaskCalendar(TableBase, Base):
     __tablename__ = "history_task_calendar"
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.connects = 0
+        self.invalidations = 0
+        self.max_checked_out = 0
+        # registered on the engine, so they carry over when dispose recreates the pool
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        engine.pool.metrics = self
+
+    def add_checkout_wait(self, wait_seconds: float):
+        with self.lock:
+            self.checkouts += 1
+            self.checkout_wait_total += wait_seconds
+            self.checkout_wait_max = max(self.checkout_wait_max, wait_seconds)
+
+    def get_metrics(self) -> dict:
+        pool = self.engine.pool
+        with self.lock:
+            return {
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "max_checked_out": self.max_checked_out,
+                "checkouts": self.checkouts,
+                "checkout_wait_avg_ms": (
+                    self.checkout_wait_total / self.checkouts * 1000
+                    if self.checkouts
+                    else 0.0
+                ),
+                "checkout_wait_max_ms": self.checkout_wait_max * 1000,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+            }
+
+    def _on_connect(self, *args):
+        with self.lock:
+            self.connects += 1
+
+    def _on_checkout(self, *args):
+        checked_out = self.engine.pool.checkedout()
+        with self.lock:
+            self.max_checked_out = max(self.max_checked_out, checked_out)
+
+    def _on_invalidate(self, *args):
+        with self.lock:
+            self.invalidations += 1
+
+
+# there is no pool event before a checkout starts waiting, so time it here
+class _CheckoutWaitMixin:
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        start = time.monotonic()
+        connection_record = super()._do_get()
+        if self.metrics is not None:
+            self.metrics.add_checkout_wait(time.monotonic() - start)
+        return connection_record
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_CheckoutWaitMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutWaitMixin, AsyncAdaptedQueuePool):
+    pass
@@ -1,15 +1,55 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.trackcase_service.utils.constants import DB_NAME, DB_PASSWORD, DB_USERNAME
+from src.trackcase_service.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+)
+from src.trackcase_service.utils.constants import (
+    DB_MAX_OVERFLOW,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_USERNAME,
+)
+
+# pre ping and recycle, the hosted database drops idle connections
+pool_options = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
 
 url = (
     f"postgresql+psycopg2://{DB_USERNAME}:{DB_PASSWORD}"
     f"@{DB_NAME}.db.elephantsql.com/{DB_USERNAME}"
 )
-engine = create_engine(url, echo=False)  # use echo=True to show log in SysOut
+# use echo=True to show log in SysOut
+engine = create_engine(url, echo=False, poolclass=InstrumentedQueuePool, **pool_options)
+engine_pool_metrics = PoolMetrics(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async engine for read routes, waiting on the database doesn't hold a thread
+async_url = (
+    f"postgresql+asyncpg://{DB_USERNAME}:{DB_PASSWORD}"
+    f"@{DB_NAME}.db.elephantsql.com/{DB_USERNAME}"
+)
+async_engine = create_async_engine(
+    async_url, echo=False, poolclass=InstrumentedAsyncAdaptedQueuePool, **pool_options
+)
+async_engine_pool_metrics = PoolMetrics(async_engine.sync_engine)
+# responses are serialized after the session is closed, so don't expire objects
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db_session():
     db = SessionLocal()
@@ -17,3 +57,8 @@ def get_db_session():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db_session():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,13 +1,21 @@
+import http
 import logging
 import os
 import time
 from contextlib import asynccontextmanager
 
+import anyio
 import uvicorn
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.responses import PlainTextResponse
+from fastapi.security import (
+    HTTPAuthorizationCredentials,
+    HTTPBasic,
+    HTTPBasicCredentials,
+    HTTPBearer,
+)
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
@@ -25,10 +33,20 @@ from src.trackcase_service.api import (
     user_management,
     user_management_noauth,
 )
-from src.trackcase_service.db.session import get_db_session
+from src.trackcase_service.db.session import (
+    async_engine_pool_metrics,
+    engine_pool_metrics,
+    get_db_session,
+)
+from src.trackcase_service.service import schemas
 from src.trackcase_service.utils import commons, constants, logger
+from src.trackcase_service.utils.metrics import get_metrics_registry
 
 log = logger.Logger(logging.getLogger(__name__))
+access_log = logger.Logger(
+    logging.getLogger(f"{__name__}.access"), constants.ACCESS_LOG_SAMPLE_RATE
+)
+metrics_registry = get_metrics_registry()
 
 
 @asynccontextmanager
@@ -36,7 +54,7 @@ async def lifespan(application: FastAPI):
     commons.validate_input()
     await commons.startup_app()
     yield
-    commons.shutdown_app()
+    await commons.shutdown_app()
 
 
 app = FastAPI(
@@ -112,15 +130,39 @@ app.include_router(
 
 @app.middleware("http")
 async def log_request_response(request: Request, call_next):
-    log.info(f"Receiving [ {request.method} ] URL [ {request.url} ]")
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["x-process-time"] = str(process_time)
-    log.info(
-        f"Returning [ {request.method} ] Status Code [ {response.status_code} ] "
-        f"URL [ {request.url} ] AFTER [ {format(process_time, '.4f')}ms]"
+    # sampled per request, so both lines of a request are kept or dropped
+    is_sampled = access_log.is_sampled()
+    if is_sampled:
+        access_log.info(f"Receiving [ {request.method} ] URL [ {request.url} ]")
+    metrics_registry.request_started()
+    start_time = time.perf_counter()
+    try:
+        response = await call_next(request)
+    except Exception:
+        metrics_registry.request_finished(
+            request.method,
+            request.scope.get("route"),
+            int(http.HTTPStatus.INTERNAL_SERVER_ERROR),
+            time.perf_counter() - start_time,
+        )
+        raise
+    process_time = time.perf_counter() - start_time
+    # route is set on the scope by the router, its path is the template
+    metrics_registry.request_finished(
+        request.method, request.scope.get("route"), response.status_code, process_time
     )
+    response.headers["x-process-time"] = str(process_time)
+    if is_sampled or response.status_code >= http.HTTPStatus.INTERNAL_SERVER_ERROR:
+        access_log.info(
+            f"Returning [ {request.method} ] Status Code [ {response.status_code} ] "
+            f"URL [ {request.url} ] AFTER [ {format(process_time, '.4f')}ms]",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "process_time": process_time,
+            },
+        )
     return response
 
 
@@ -151,6 +193,80 @@ def ping(db_session: Session = Depends(get_db_session)):
         return {"ping": "successful", "ping_db": f"exception: {str(ex)}"}
 
 
+# basic auth, so that prometheus can scrape it
+@app.get(
+    "/trackcase-service/admin/metrics/",
+    tags=["Main"],
+    summary="Prometheus Metrics",
+    response_class=PlainTextResponse,
+)
+async def prometheus_metrics(
+    request: Request,
+    http_basic_credentials: HTTPBasicCredentials = Depends(HTTPBasic()),
+):
+    if not commons.validate_basic_credentials(http_basic_credentials):
+        commons.raise_http_exception(
+            request=request,
+            sts_code=http.HTTPStatus.UNAUTHORIZED,
+            error="Incorrect Credentials",
+        )
+    # the threadpool that runs sync endpoints, read on the event loop
+    thread_limiter = anyio.to_thread.current_default_thread_limiter()
+    return PlainTextResponse(
+        metrics_registry.render(
+            thread_limiter.borrowed_tokens, int(thread_limiter.total_tokens)
+        ),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@app.get(
+    "/trackcase-service/admin/log_level/",
+    tags=["Main"],
+    summary="Get Log Level",
+    dependencies=[Depends(validate_credentials)],
+)
+def get_log_level():
+    return {"log_level": logger.get_logging_backend().get_log_level()}
+
+
+@app.put(
+    "/trackcase-service/admin/log_level/",
+    tags=["Main"],
+    summary="Set Log Level",
+    dependencies=[Depends(validate_credentials)],
+)
+def set_log_level(request: Request, log_level: schemas.LogLevelOptions):
+    if not commons.has_permission("LOG_LEVEL_UPDATE", request):
+        commons.raise_http_exception(
+            request=request,
+            sts_code=http.HTTPStatus.FORBIDDEN,
+            error="Insufficient permissions...",
+        )
+    logger.get_logging_backend().set_log_level(log_level.value)
+    log.info(f"Log Level Set To: [ {log_level.value} ]")
+    return {"log_level": logger.get_logging_backend().get_log_level()}
+
+
+@app.get(
+    "/trackcase-service/admin/db_pool/",
+    tags=["Main"],
+    summary="Database Connection Pool Metrics",
+    dependencies=[Depends(validate_credentials)],
+)
+def db_pool_metrics(request: Request):
+    if not commons.has_permission("DB_POOL_READ", request):
+        commons.raise_http_exception(
+            request=request,
+            sts_code=http.HTTPStatus.FORBIDDEN,
+            error="Insufficient permissions...",
+        )
+    return {
+        "engine": engine_pool_metrics.get_metrics(),
+        "async_engine": async_engine_pool_metrics.get_metrics(),
+    }
+
+
 if __name__ == "__main__":
     port = os.getenv(constants.ENV_APP_PORT, "9090")
     uvicorn.run(app, port=int(port), host="0.0.0.0", log_level=logging.WARNING)
@@ -0,0 +1,32 @@
+"""revoked token
+
+Revision ID: 5e2b9d7f1c34
+Revises: 4d8a7c3e5b12
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2b9d7f1c34"
+down_revision: Union[str, None] = "4d8a7c3e5b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_token",
+        sa.Column("token_digest", sa.String(length=64), nullable=False),
+        sa.Column("expires", sa.DateTime(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("token_digest"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("revoked_token")
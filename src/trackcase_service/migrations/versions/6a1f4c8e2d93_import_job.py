@@ -0,0 +1,54 @@
+"""import job
+
+Revision ID: 6a1f4c8e2d93
+Revises: 8f3a6c1d2e47
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a1f4c8e2d93"
+down_revision: Union[str, None] = "8f3a6c1d2e47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_job",
+        sa.Column("job_id", sa.String(length=32), nullable=False),
+        sa.Column("job_type", sa.String(length=25), nullable=False),
+        sa.Column("status", sa.String(length=25), nullable=False),
+        sa.Column("app_user_id", sa.Integer(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("started", sa.DateTime(), nullable=True),
+        sa.Column("finished", sa.DateTime(), nullable=True),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("reports", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["app_user_id"],
+            ["app_user.id"],
+            name="import_job_app_user_id",
+            onupdate="NO ACTION",
+            ondelete="RESTRICT",
+        ),
+        sa.PrimaryKeyConstraint("job_id"),
+    )
+    op.create_index(
+        "import_job_pending_job_type",
+        "import_job",
+        ["job_type"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('QUEUED', 'RUNNING')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("import_job_pending_job_type", table_name="import_job")
+    op.drop_table("import_job")
@@ -0,0 +1,32 @@
+"""cache version
+
+Revision ID: 7c1d2e4f9a31
+Revises: 2efaf725cf08
+Create Date: 2026-10-18 01:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d2e4f9a31"
+down_revision: Union[str, None] = "2efaf725cf08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_version",
+        sa.Column("cache_key", sa.String(length=100), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("modified", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_version")
@@ -0,0 +1,35 @@
+"""admin permissions
+
+Revision ID: 8f3a6c1d2e47
+Revises: 5e2b9d7f1c34
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3a6c1d2e47"
+down_revision: Union[str, None] = "5e2b9d7f1c34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """INSERT INTO app_permission (created, modified, name, description, is_deleted) VALUES (now(), now(), 'DB_POOL_READ', 'CAN VIEW DATABASE POOL METRICS', False)"""  # noqa: E501
+    )
+    op.execute(
+        """INSERT INTO app_permission (created, modified, name, description, is_deleted) VALUES (now(), now(), 'LOG_LEVEL_UPDATE', 'CAN UPDATE LOG LEVEL', False)"""  # noqa: E501
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """DELETE FROM app_role_permission WHERE app_permission_id IN (SELECT id FROM app_permission WHERE name IN ('DB_POOL_READ', 'LOG_LEVEL_UPDATE'))"""  # noqa: E501
+    )
+    op.execute(
+        """DELETE FROM app_permission WHERE name IN ('DB_POOL_READ', 'LOG_LEVEL_UPDATE')"""  # noqa: E501
+    )
@@ -0,0 +1,39 @@
+"""calendar date indexes
+
+Revision ID: 9b4e6f2a1c58
+Revises: 7c1d2e4f9a31
+Create Date: 2026-10-18 02:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e6f2a1c58"
+down_revision: Union[str, None] = "7c1d2e4f9a31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "hearing_calendar_is_deleted_hearing_date",
+        "hearing_calendar",
+        ["is_deleted", "hearing_date"],
+        unique=False,
+    )
+    op.create_index(
+        "task_calendar_is_deleted_task_date",
+        "task_calendar",
+        ["is_deleted", "task_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("task_calendar_is_deleted_task_date", table_name="task_calendar")
+    op.drop_index(
+        "hearing_calendar_is_deleted_hearing_date", table_name="hearing_calendar"
+    )
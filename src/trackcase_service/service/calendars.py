@@ -1,20 +1,28 @@
 import sys
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from http.client import HTTPException
 
-from fastapi import Request
-from sqlalchemy.orm import Session
+from fastapi import HTTPException, Request
+from sqlalchemy import Select, and_, case, false, literal, select, true
+from sqlalchemy.orm import Session, aliased
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.crud import CrudService, LoadingProfile, unit_of_work
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.history_service import get_history_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
+from src.trackcase_service.utils.cache import (
+    get_calendar_events_cache,
+    get_table_generations,
+    get_table_generations_async,
+    set_calendar_events_cache,
+    share_table_generations,
+)
 from src.trackcase_service.utils.commons import (
     check_active_component_status,
     check_permissions,
     get_err_msg,
+    get_read_kwargs,
     get_read_response_data_metadata,
     raise_http_exception,
 )
@@ -29,8 +37,27 @@ from src.trackcase_service.utils.convert import (
     convert_schema_to_model,
 )
 
+# tables calendar events are read from, a write to any of them changes events
+CALENDAR_EVENT_TABLES = (
+    models.HearingCalendar.__tablename__,
+    models.TaskCalendar.__tablename__,
+    models.HearingType.__tablename__,
+    models.TaskType.__tablename__,
+    models.CourtCase.__tablename__,
+    models.Client.__tablename__,
+    models.Filing.__tablename__,
+)
+# window events are cached per process, writes in other processes must miss too
+share_table_generations(CALENDAR_EVENT_TABLES)
+
 
 class HearingCalendarService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("component_status", "hearing_type", "court_case", "court_case.client"),
+        extra=("task_calendars",),
+        history=("history_hearing_calendars",),
+    )
+
     def __init__(self, db_session: Session):
         super(HearingCalendarService, self).__init__(db_session, models.HearingCalendar)
 
@@ -39,30 +66,31 @@ class HearingCalendarService(CrudService):
         self, request: Request, request_object: schemas.HearingCalendarRequest
     ) -> schemas.HearingCalendarResponse:
         try:
-            data_model: models.HearingCalendar = convert_schema_to_model(
-                request_object, models.HearingCalendar
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryHearingCalendar
-            ).add_to_history(
-                request,
-                request_object,
-                "hearing_calendar_id",
-                data_model.id,
-                "HearingCalendar",
-                "HistoryHearingCalendar",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.HearingCalendar,
-                exclusions=[
-                    "task_calendars",
-                    "history_hearing_calendars",
-                    "history_task_calendars",
-                ],
-            )
-            self.create_related_task_calendar(request, schema_model)
+            with unit_of_work(self.db_session):
+                data_model: models.HearingCalendar = convert_schema_to_model(
+                    request_object, models.HearingCalendar
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryHearingCalendar
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "hearing_calendar_id",
+                    data_model.id,
+                    "HearingCalendar",
+                    "HistoryHearingCalendar",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.HearingCalendar,
+                    exclusions=[
+                        "task_calendars",
+                        "history_hearing_calendars",
+                        "history_task_calendars",
+                    ],
+                )
+                self.create_related_task_calendar(request, schema_model)
             return schemas.HearingCalendarResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -76,61 +104,47 @@ class HearingCalendarService(CrudService):
 
     @check_permissions("CALENDARS_READ")
     def read_hearing_calendar(
-        self, request: Request, request_metadata: schemas.RequestMetadata = None
+        self,
+        request: Request,
+        request_metadata: schemas.RequestMetadata = None,
+        start: datetime = None,
+        end: datetime = None,
     ) -> schemas.HearingCalendarResponse:
+        request_metadata = _get_window_request_metadata(
+            request_metadata, "hearing_date", start, end
+        )
         try:
-            if request_metadata:
-                if request_metadata.schema_model_id:
-                    read_response = self.read(
-                        model_id=request_metadata.schema_model_id,
-                        is_include_soft_deleted=request_metadata.is_include_deleted,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-                    if not response_data:
-                        raise_http_exception(
-                            request,
-                            HTTPStatus.NOT_FOUND,
-                            f"Hearing Calendar Not Found By Id: {request_metadata.schema_model_id}!!!",  # noqa: E501
-                        )
-                else:
-                    read_response = self.read(
-                        sort_config=request_metadata.sort_config,
-                        filter_config=request_metadata.filter_config,
-                        page_number=request_metadata.page_number,
-                        per_page=request_metadata.per_page,
-                        is_include_soft_deleted=request_metadata.is_include_deleted
-                        is True,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-            else:
-                request_metadata = schemas.RequestMetadata()
-                read_response = self.read()
-                response_data, response_metadata = get_read_response_data_metadata(
-                    read_response
-                )
+            read_response = self.read(**get_read_kwargs(request_metadata))
+            return _get_hearing_calendar_response(
+                request, request_metadata, read_response
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving Hearing Calendar. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
 
-            schema_models = [
-                convert_model_to_schema(
-                    data_model=data_model,
-                    schema_class=schemas.HearingCalendar,
-                    is_include_extra=request_metadata.is_include_extra,
-                    is_include_history=request_metadata.is_include_history,
-                    exclusions=[
-                        "task_calendars",
-                        "history_hearing_calendars",
-                        "history_task_calendars",
-                    ],
-                    extra_to_include=["task_calendars"],
-                    history_to_include=["history_hearing_calendars"],
-                )
-                for data_model in response_data
-            ]
-            return schemas.HearingCalendarResponse(
-                data=schema_models, metadata=response_metadata
+    @check_permissions("CALENDARS_READ")
+    async def read_hearing_calendar_async(
+        self,
+        request: Request,
+        request_metadata: schemas.RequestMetadata = None,
+        start: datetime = None,
+        end: datetime = None,
+    ) -> schemas.HearingCalendarResponse:
+        request_metadata = _get_window_request_metadata(
+            request_metadata, "hearing_date", start, end
+        )
+        try:
+            read_response = await self.read_async(**get_read_kwargs(request_metadata))
+            return _get_hearing_calendar_response(
+                request, request_metadata, read_response
             )
         except Exception as ex:
             if isinstance(ex, HTTPException):
@@ -160,29 +174,30 @@ class HearingCalendarService(CrudService):
         )
 
         try:
-            data_model: models.HearingCalendar = convert_schema_to_model(
-                request_object, models.HearingCalendar
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryHearingCalendar
-            ).add_to_history(
-                request,
-                request_object,
-                "hearing_calendar_id",
-                data_model.id,
-                "HearingCalendar",
-                "HistoryHearingCalendar",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.HearingCalendar,
-                exclusions=[
-                    "task_calendars",
-                    "history_hearing_calendars",
-                    "history_task_calendars",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.HearingCalendar = convert_schema_to_model(
+                    request_object, models.HearingCalendar
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryHearingCalendar
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "hearing_calendar_id",
+                    data_model.id,
+                    "HearingCalendar",
+                    "HistoryHearingCalendar",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.HearingCalendar,
+                    exclusions=[
+                        "task_calendars",
+                        "history_hearing_calendars",
+                        "history_task_calendars",
+                    ],
+                )
             return schemas.HearingCalendarResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -300,17 +315,14 @@ class HearingCalendarService(CrudService):
     ):
         if hearing_calendar_old.task_calendars:
             status_old = hearing_calendar_old.component_status_id
-            calendar_active_statuses = get_ref_types_service(
+            active_status_ids = get_ref_types_service(
                 service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
                 db_session=self.db_session,
-            ).get_component_status(
+            ).get_component_status_ids(
                 request,
                 schemas.ComponentStatusNames.CALENDARS,
                 schemas.ComponentStatusTypes.ACTIVE,
             )
-            active_status_ids = [
-                component_status.id for component_status in calendar_active_statuses
-            ]
 
             if status_new != status_old and status_new not in active_status_ids:
                 if check_active_component_status(
@@ -324,6 +336,18 @@ class HearingCalendarService(CrudService):
 
 
 class TaskCalendarService(CrudService):
+    loading_profile = LoadingProfile(
+        default=(
+            "component_status",
+            "task_type",
+            "hearing_calendar",
+            "hearing_calendar.court_case.client",
+            "filing",
+            "filing.court_case.client",
+        ),
+        history=("history_task_calendars",),
+    )
+
     def __init__(self, db_session: Session):
         super(TaskCalendarService, self).__init__(db_session, models.TaskCalendar)
 
@@ -332,27 +356,28 @@ class TaskCalendarService(CrudService):
         self, request: Request, request_object: schemas.TaskCalendarRequest
     ) -> schemas.TaskCalendarResponse:
         try:
-            data_model: models.TaskCalendar = convert_schema_to_model(
-                request_object, models.TaskCalendar
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryTaskCalendar
-            ).add_to_history(
-                request,
-                request_object,
-                "task_calendar_id",
-                data_model.id,
-                "TaskCalendar",
-                "HistoryTaskCalendar",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.TaskCalendar,
-                exclusions=[
-                    "history_task_calendars",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.TaskCalendar = convert_schema_to_model(
+                    request_object, models.TaskCalendar
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryTaskCalendar
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "task_calendar_id",
+                    data_model.id,
+                    "TaskCalendar",
+                    "HistoryTaskCalendar",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.TaskCalendar,
+                    exclusions=[
+                        "history_task_calendars",
+                    ],
+                )
             return schemas.TaskCalendarResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -366,59 +391,44 @@ class TaskCalendarService(CrudService):
 
     @check_permissions("CALENDARS_READ")
     def read_task_calendar(
-        self, request: Request, request_metadata: schemas.RequestMetadata = None
+        self,
+        request: Request,
+        request_metadata: schemas.RequestMetadata = None,
+        start: datetime = None,
+        end: datetime = None,
     ) -> schemas.TaskCalendarResponse:
+        request_metadata = _get_window_request_metadata(
+            request_metadata, "task_date", start, end
+        )
         try:
-            if request_metadata:
-                if request_metadata.schema_model_id:
-                    read_response = self.read(
-                        model_id=request_metadata.schema_model_id,
-                        is_include_soft_deleted=request_metadata.is_include_deleted,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-                    if not response_data:
-                        raise_http_exception(
-                            request,
-                            HTTPStatus.NOT_FOUND,
-                            f"Task Calendar Not Found By Id: {request_metadata.schema_model_id}!!!",  # noqa: E501
-                        )
-                else:
-                    read_response = self.read(
-                        sort_config=request_metadata.sort_config,
-                        filter_config=request_metadata.filter_config,
-                        page_number=request_metadata.page_number,
-                        per_page=request_metadata.per_page,
-                        is_include_soft_deleted=request_metadata.is_include_deleted
-                        is True,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-            else:
-                request_metadata = schemas.RequestMetadata()
-                read_response = self.read()
-                response_data, response_metadata = get_read_response_data_metadata(
-                    read_response
-                )
-
-            schema_models = [
-                convert_model_to_schema(
-                    data_model=data_model,
-                    schema_class=schemas.TaskCalendar,
-                    is_include_extra=request_metadata.is_include_extra,
-                    is_include_history=request_metadata.is_include_history,
-                    exclusions=[
-                        "history_task_calendars",
-                    ],
-                    history_to_include=["history_task_calendars"],
-                )
-                for data_model in response_data
-            ]
-            return schemas.TaskCalendarResponse(
-                data=schema_models, metadata=response_metadata
+            read_response = self.read(**get_read_kwargs(request_metadata))
+            return _get_task_calendar_response(request, request_metadata, read_response)
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving Task Calendar. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
             )
+
+    @check_permissions("CALENDARS_READ")
+    async def read_task_calendar_async(
+        self,
+        request: Request,
+        request_metadata: schemas.RequestMetadata = None,
+        start: datetime = None,
+        end: datetime = None,
+    ) -> schemas.TaskCalendarResponse:
+        request_metadata = _get_window_request_metadata(
+            request_metadata, "task_date", start, end
+        )
+        try:
+            read_response = await self.read_async(**get_read_kwargs(request_metadata))
+            return _get_task_calendar_response(request, request_metadata, read_response)
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -442,27 +452,28 @@ class TaskCalendarService(CrudService):
         self.check_task_calendar_exists(model_id, request, is_restore)
 
         try:
-            data_model: models.TaskCalendar = convert_schema_to_model(
-                request_object, models.TaskCalendar
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryTaskCalendar
-            ).add_to_history(
-                request,
-                request_object,
-                "task_calendar_id",
-                data_model.id,
-                "TaskCalendar",
-                "HistoryTaskCalendar",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.TaskCalendar,
-                exclusions=[
-                    "history_task_calendars",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.TaskCalendar = convert_schema_to_model(
+                    request_object, models.TaskCalendar
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryTaskCalendar
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "task_calendar_id",
+                    data_model.id,
+                    "TaskCalendar",
+                    "HistoryTaskCalendar",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.TaskCalendar,
+                    exclusions=[
+                        "history_task_calendars",
+                    ],
+                )
             return schemas.TaskCalendarResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -537,11 +548,448 @@ class TaskCalendarService(CrudService):
         return task_calendar_response.data[0]
 
 
+# calendar events are read with one joined query per calendar type
+# instead of following court case and client relationships per calendar
+class CalendarEventService:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def read_calendar_events(
+        self,
+        request: Request,
+        hearing_calendar_ids: list[int],
+        task_calendar_ids: list[int],
+    ) -> list[schemas.CalendarEvent]:
+        try:
+            calendar_event_rows = []
+            if hearing_calendar_ids:
+                calendar_event_rows.extend(
+                    _sort_calendar_event_rows(
+                        self._read_calendar_events(
+                            _get_hearing_calendar_events_statement(
+                                models.HearingCalendar.id.in_(hearing_calendar_ids)
+                            )
+                        ),
+                        hearing_calendar_ids,
+                    )
+                )
+            if task_calendar_ids:
+                calendar_event_rows.extend(
+                    _sort_calendar_event_rows(
+                        self._read_calendar_events(
+                            _get_task_calendar_events_statement(
+                                models.TaskCalendar.id.in_(task_calendar_ids)
+                            )
+                        ),
+                        task_calendar_ids,
+                    )
+                )
+            return _get_calendar_events(
+                calendar_event_rows, self._get_calendar_inactive_status_ids(request)
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving Calendar Events. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    async def read_calendar_events_async(
+        self,
+        request: Request,
+        hearing_calendar_ids: list[int],
+        task_calendar_ids: list[int],
+    ) -> list[schemas.CalendarEvent]:
+        try:
+            calendar_event_rows = []
+            if hearing_calendar_ids:
+                calendar_event_rows.extend(
+                    _sort_calendar_event_rows(
+                        await self._read_calendar_events_async(
+                            _get_hearing_calendar_events_statement(
+                                models.HearingCalendar.id.in_(hearing_calendar_ids)
+                            )
+                        ),
+                        hearing_calendar_ids,
+                    )
+                )
+            if task_calendar_ids:
+                calendar_event_rows.extend(
+                    _sort_calendar_event_rows(
+                        await self._read_calendar_events_async(
+                            _get_task_calendar_events_statement(
+                                models.TaskCalendar.id.in_(task_calendar_ids)
+                            )
+                        ),
+                        task_calendar_ids,
+                    )
+                )
+            return _get_calendar_events(
+                calendar_event_rows,
+                await self._get_calendar_inactive_status_ids_async(request),
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving Calendar Events. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    # all events from start (inclusive) to end (exclusive), ordered by date
+    # rows are cached per window, statuses depend on today so aren't cached
+    def read_calendar_events_window(
+        self,
+        request: Request,
+        start: datetime = None,
+        end: datetime = None,
+        is_include_deleted: bool = False,
+    ) -> list[schemas.CalendarEvent]:
+        try:
+            cache_key = (
+                start,
+                end,
+                is_include_deleted,
+                get_table_generations(CALENDAR_EVENT_TABLES),
+            )
+            calendar_event_rows = get_calendar_events_cache(cache_key)
+            if calendar_event_rows is None:
+                hearing_statement, task_statement = _get_window_events_statements(
+                    start, end, is_include_deleted
+                )
+                calendar_event_rows = self._read_calendar_events(
+                    hearing_statement
+                ) + self._read_calendar_events(task_statement)
+                set_calendar_events_cache(cache_key, calendar_event_rows)
+            return _get_calendar_events(
+                calendar_event_rows, self._get_calendar_inactive_status_ids(request)
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving Calendar Events. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    async def read_calendar_events_window_async(
+        self,
+        request: Request,
+        start: datetime = None,
+        end: datetime = None,
+        is_include_deleted: bool = False,
+    ) -> list[schemas.CalendarEvent]:
+        try:
+            cache_key = (
+                start,
+                end,
+                is_include_deleted,
+                await get_table_generations_async(CALENDAR_EVENT_TABLES),
+            )
+            calendar_event_rows = get_calendar_events_cache(cache_key)
+            if calendar_event_rows is None:
+                hearing_statement, task_statement = _get_window_events_statements(
+                    start, end, is_include_deleted
+                )
+                calendar_event_rows = await self._read_calendar_events_async(
+                    hearing_statement
+                ) + await self._read_calendar_events_async(task_statement)
+                set_calendar_events_cache(cache_key, calendar_event_rows)
+            return _get_calendar_events(
+                calendar_event_rows,
+                await self._get_calendar_inactive_status_ids_async(request),
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving Calendar Events. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    def _get_calendar_inactive_status_ids(self, request: Request) -> frozenset[int]:
+        return get_ref_types_service(
+            service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
+            db_session=self.db_session,
+        ).get_component_status_ids(
+            request,
+            schemas.ComponentStatusNames.CALENDARS,
+            schemas.ComponentStatusTypes.INACTIVE,
+        )
+
+    async def _get_calendar_inactive_status_ids_async(
+        self, request: Request
+    ) -> frozenset[int]:
+        return await get_ref_types_service(
+            service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
+            db_session=self.db_session,
+        ).get_component_status_ids_async(
+            request,
+            schemas.ComponentStatusNames.CALENDARS,
+            schemas.ComponentStatusTypes.INACTIVE,
+        )
+
+    def _read_calendar_events(self, statement: Select) -> list:
+        return [tuple(row) for row in self.db_session.execute(statement)]
+
+    async def _read_calendar_events_async(self, statement: Select) -> list:
+        return [tuple(row) for row in await self.db_session.execute(statement)]
+
+
+def _get_hearing_calendar_response(
+    request: Request,
+    request_metadata: schemas.RequestMetadata,
+    read_response: dict,
+) -> schemas.HearingCalendarResponse:
+    response_data, response_metadata = get_read_response_data_metadata(read_response)
+    if request_metadata and request_metadata.schema_model_id and not response_data:
+        raise_http_exception(
+            request,
+            HTTPStatus.NOT_FOUND,
+            f"Hearing Calendar Not Found By Id: {request_metadata.schema_model_id}!!!",  # noqa: E501
+        )
+    request_metadata = request_metadata or schemas.RequestMetadata()
+    schema_models = [
+        convert_model_to_schema(
+            data_model=data_model,
+            schema_class=schemas.HearingCalendar,
+            is_include_extra=request_metadata.is_include_extra,
+            is_include_history=request_metadata.is_include_history,
+            exclusions=[
+                "task_calendars",
+                "history_hearing_calendars",
+                "history_task_calendars",
+            ],
+            extra_to_include=["task_calendars"],
+            history_to_include=["history_hearing_calendars"],
+        )
+        for data_model in response_data
+    ]
+    return schemas.HearingCalendarResponse(
+        data=schema_models, metadata=response_metadata
+    )
+
+
+def _get_task_calendar_response(
+    request: Request,
+    request_metadata: schemas.RequestMetadata,
+    read_response: dict,
+) -> schemas.TaskCalendarResponse:
+    response_data, response_metadata = get_read_response_data_metadata(read_response)
+    if request_metadata and request_metadata.schema_model_id and not response_data:
+        raise_http_exception(
+            request,
+            HTTPStatus.NOT_FOUND,
+            f"Task Calendar Not Found By Id: {request_metadata.schema_model_id}!!!",
+        )
+    request_metadata = request_metadata or schemas.RequestMetadata()
+    schema_models = [
+        convert_model_to_schema(
+            data_model=data_model,
+            schema_class=schemas.TaskCalendar,
+            is_include_extra=request_metadata.is_include_extra,
+            is_include_history=request_metadata.is_include_history,
+            exclusions=[
+                "history_task_calendars",
+            ],
+            history_to_include=["history_task_calendars"],
+        )
+        for data_model in response_data
+    ]
+    return schemas.TaskCalendarResponse(data=schema_models, metadata=response_metadata)
+
+
+def _get_hearing_calendar_events_statement(where_clause) -> Select:
+    return (
+        select(
+            literal(schemas.CalendarObjectTypes.HEARING.value),
+            models.HearingCalendar.id,
+            models.HearingType.name,
+            models.HearingCalendar.hearing_date,
+            models.HearingCalendar.component_status_id,
+            models.Client.name,
+            models.HearingCalendar.court_case_id,
+        )
+        .join(
+            models.HearingType,
+            models.HearingCalendar.hearing_type_id == models.HearingType.id,
+        )
+        .join(
+            models.CourtCase,
+            models.HearingCalendar.court_case_id == models.CourtCase.id,
+        )
+        .join(models.Client, models.CourtCase.client_id == models.Client.id)
+        .where(where_clause)
+        .order_by(models.HearingCalendar.hearing_date, models.HearingCalendar.id)
+    )
+
+
+def _get_task_calendar_events_statement(where_clause) -> Select:
+    # task calendar belongs to either a filing or a hearing calendar
+    filing_court_case = aliased(models.CourtCase)
+    filing_client = aliased(models.Client)
+    hearing_court_case = aliased(models.CourtCase)
+    hearing_client = aliased(models.Client)
+    is_filing = models.TaskCalendar.filing_id.is_not(None)
+    return (
+        select(
+            literal(schemas.CalendarObjectTypes.TASK.value),
+            models.TaskCalendar.id,
+            models.TaskType.name,
+            models.TaskCalendar.task_date,
+            models.TaskCalendar.component_status_id,
+            case((is_filing, filing_client.name), else_=hearing_client.name),
+            case(
+                (is_filing, models.Filing.court_case_id),
+                else_=models.HearingCalendar.court_case_id,
+            ),
+        )
+        .join(models.TaskType, models.TaskCalendar.task_type_id == models.TaskType.id)
+        .outerjoin(models.Filing, models.TaskCalendar.filing_id == models.Filing.id)
+        .outerjoin(
+            filing_court_case, models.Filing.court_case_id == filing_court_case.id
+        )
+        .outerjoin(filing_client, filing_court_case.client_id == filing_client.id)
+        .outerjoin(
+            models.HearingCalendar,
+            models.TaskCalendar.hearing_calendar_id == models.HearingCalendar.id,
+        )
+        .outerjoin(
+            hearing_court_case,
+            models.HearingCalendar.court_case_id == hearing_court_case.id,
+        )
+        .outerjoin(hearing_client, hearing_court_case.client_id == hearing_client.id)
+        .where(where_clause)
+        .order_by(models.TaskCalendar.task_date, models.TaskCalendar.id)
+    )
+
+
+def _get_window_events_statements(
+    start: datetime, end: datetime, is_include_deleted: bool
+) -> tuple[Select, Select]:
+    return _get_hearing_calendar_events_statement(
+        _get_window_clause(
+            models.HearingCalendar, "hearing_date", start, end, is_include_deleted
+        )
+    ), _get_task_calendar_events_statement(
+        _get_window_clause(
+            models.TaskCalendar, "task_date", start, end, is_include_deleted
+        )
+    )
+
+
+def _get_window_clause(
+    db_model, date_column: str, start: datetime, end: datetime, is_include_deleted: bool
+):
+    conditions = []
+    if start:
+        conditions.append(getattr(db_model, date_column) >= start)
+    if end:
+        conditions.append(getattr(db_model, date_column) < end)
+    if not is_include_deleted:
+        conditions.append(db_model.is_deleted == false())
+    return and_(true(), *conditions)
+
+
+# window filters on the calendar date, start inclusive and end exclusive
+def _get_window_request_metadata(
+    request_metadata: schemas.RequestMetadata,
+    date_column: str,
+    start: datetime = None,
+    end: datetime = None,
+) -> schemas.RequestMetadata:
+    if not start and not end:
+        return request_metadata
+    request_metadata = (
+        request_metadata.model_copy(deep=True)
+        if request_metadata
+        else schemas.RequestMetadata()
+    )
+    if start:
+        request_metadata.filter_config.append(
+            schemas.FilterConfig(
+                column=date_column,
+                value=start,
+                operation=schemas.FilterOperation.GREATER_THAN_OR_EQUAL_TO,
+            )
+        )
+    if end:
+        request_metadata.filter_config.append(
+            schemas.FilterConfig(
+                column=date_column,
+                value=end,
+                operation=schemas.FilterOperation.LESS_THAN,
+            )
+        )
+    return request_metadata
+
+
+# keep the events in the same order as the calendars they are read for
+def _sort_calendar_event_rows(calendar_event_rows: list, calendar_ids: list[int]):
+    calendar_event_rows_by_id = {row[1]: row for row in calendar_event_rows}
+    return [
+        calendar_event_rows_by_id[calendar_id]
+        for calendar_id in calendar_ids
+        if calendar_id in calendar_event_rows_by_id
+    ]
+
+
+def _get_calendar_events(
+    calendar_event_rows: list, calendar_inactive_status_ids: frozenset[int]
+) -> list[schemas.CalendarEvent]:
+    today = datetime.today().date()
+    calendar_events = []
+    for (
+        calendar,
+        calendar_id,
+        calendar_type,
+        calendar_date,
+        component_status_id,
+        title,
+        court_case_id,
+    ) in calendar_event_rows:
+        is_inactive = component_status_id in calendar_inactive_status_ids
+        if calendar_date.date() < today:
+            status = "PAST_DONE" if is_inactive else "PAST_DUE"
+        else:
+            status = "DONE" if is_inactive else "DUE"
+        calendar_events.append(
+            schemas.CalendarEvent.model_construct(
+                id=calendar_id,
+                calendar=calendar,
+                type=calendar_type,
+                date=calendar_date,
+                status=status,
+                title=title,
+                court_case_id=court_case_id,
+            )
+        )
+    return calendar_events
+
+
 def get_calendar_service(
     service_type: schemas.CalendarServiceRegistry, db_session: Session
-) -> HearingCalendarService | TaskCalendarService:
+) -> HearingCalendarService | TaskCalendarService | CalendarEventService:
     service_registry = {
         schemas.CalendarServiceRegistry.HEARING_CALENDAR: HearingCalendarService,
         schemas.CalendarServiceRegistry.TASK_CALENDAR: TaskCalendarService,
+        schemas.CalendarServiceRegistry.CALENDAR_EVENT: CalendarEventService,
     }
     return service_registry.get(service_type)(db_session)
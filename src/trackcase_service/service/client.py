@@ -5,7 +5,7 @@ from fastapi import HTTPException, Request
 from sqlalchemy.orm import Session
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.crud import CrudService, LoadingProfile, unit_of_work
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.history_service import get_history_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
@@ -13,6 +13,7 @@ from src.trackcase_service.utils.commons import (
     check_active_component_status,
     check_permissions,
     get_err_msg,
+    get_read_kwargs,
     get_read_response_data_metadata,
     raise_http_exception,
 )
@@ -23,6 +24,12 @@ from src.trackcase_service.utils.convert import (
 
 
 class ClientService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("component_status", "judge"),
+        extra=("court_cases",),
+        history=("history_clients",),
+    )
+
     def __init__(self, db_session: Session):
         super(ClientService, self).__init__(db_session, models.Client)
 
@@ -31,29 +38,30 @@ class ClientService(CrudService):
         self, request: Request, request_object: schemas.ClientRequest
     ) -> schemas.ClientResponse:
         try:
-            data_model: models.Client = convert_schema_to_model(
-                request_object, models.Client
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryClient
-            ).add_to_history(
-                request,
-                request_object,
-                "client_id",
-                data_model.id,
-                "Client",
-                "HistoryClient",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.Client,
-                exclusions=[
-                    "court_cases",
-                    "history_clients",
-                    "history_court_cases",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.Client = convert_schema_to_model(
+                    request_object, models.Client
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryClient
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "client_id",
+                    data_model.id,
+                    "Client",
+                    "HistoryClient",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.Client,
+                    exclusions=[
+                        "court_cases",
+                        "history_clients",
+                        "history_court_cases",
+                    ],
+                )
             return schemas.ClientResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -68,59 +76,25 @@ class ClientService(CrudService):
         self, request: Request, request_metadata: schemas.RequestMetadata = None
     ) -> schemas.ClientResponse:
         try:
-            if request_metadata:
-                if request_metadata.schema_model_id:
-                    read_response = self.read(
-                        model_id=request_metadata.schema_model_id,
-                        is_include_soft_deleted=request_metadata.is_include_deleted,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-                    if not response_data:
-                        raise_http_exception(
-                            request,
-                            HTTPStatus.NOT_FOUND,
-                            f"Client Not Found By Id: {request_metadata.schema_model_id}!!!",  # noqa: E501
-                        )
-                else:
-                    read_response = self.read(
-                        sort_config=request_metadata.sort_config,
-                        filter_config=request_metadata.filter_config,
-                        page_number=request_metadata.page_number,
-                        per_page=request_metadata.per_page,
-                        is_include_soft_deleted=request_metadata.is_include_deleted
-                        is True,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-            else:
-                request_metadata = schemas.RequestMetadata()
-                read_response = self.read()
-                response_data, response_metadata = get_read_response_data_metadata(
-                    read_response
-                )
-
-            schema_models = [
-                convert_model_to_schema(
-                    data_model=data_model,
-                    schema_class=schemas.Client,
-                    is_include_extra=request_metadata.is_include_extra,
-                    is_include_history=request_metadata.is_include_history,
-                    exclusions=[
-                        "court_cases",
-                        "history_clients",
-                        "history_court_cases",
-                    ],
-                    extra_to_include=["court_cases"],
-                    history_to_include=["history_clients"],
-                )
-                for data_model in response_data
-            ]
-            return schemas.ClientResponse(
-                data=schema_models, metadata=response_metadata
+            read_response = self.read(**get_read_kwargs(request_metadata))
+            return _get_client_response(request, request_metadata, read_response)
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg("Error Retrieving Client. Please Try Again!!!", str(ex)),
+                exc_info=sys.exc_info(),
             )
+
+    @check_permissions("CLIENTS_READ")
+    async def read_client_async(
+        self, request: Request, request_metadata: schemas.RequestMetadata = None
+    ) -> schemas.ClientResponse:
+        try:
+            read_response = await self.read_async(**get_read_kwargs(request_metadata))
+            return _get_client_response(request, request_metadata, read_response)
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -145,29 +119,30 @@ class ClientService(CrudService):
         )
 
         try:
-            data_model: models.Client = convert_schema_to_model(
-                request_object, models.Client
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryClient
-            ).add_to_history(
-                request,
-                request_object,
-                "client_id",
-                data_model.id,
-                "Client",
-                "HistoryClient",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.Client,
-                exclusions=[
-                    "court_cases",
-                    "history_clients",
-                    "history_court_cases",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.Client = convert_schema_to_model(
+                    request_object, models.Client
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryClient
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "client_id",
+                    data_model.id,
+                    "Client",
+                    "HistoryClient",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.Client,
+                    exclusions=[
+                        "court_cases",
+                        "history_clients",
+                        "history_court_cases",
+                    ],
+                )
             return schemas.ClientResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -257,25 +232,20 @@ class ClientService(CrudService):
                 service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
                 db_session=self.db_session,
             )
-            client_active_statuses = ref_types_service.get_component_status(
+            active_status_ids_client = ref_types_service.get_component_status_ids(
                 request,
                 schemas.ComponentStatusNames.CLIENTS,
                 schemas.ComponentStatusTypes.ACTIVE,
             )
-            active_status_ids_client = [
-                component_status.id for component_status in client_active_statuses
-            ]
 
             if status_new != status_old and status_new not in active_status_ids_client:
-                court_case_active_statuses = ref_types_service.get_component_status(
-                    request,
-                    schemas.ComponentStatusNames.COURT_CASES,
-                    schemas.ComponentStatusTypes.ACTIVE,
+                active_status_ids_court_case = (
+                    ref_types_service.get_component_status_ids(
+                        request,
+                        schemas.ComponentStatusNames.COURT_CASES,
+                        schemas.ComponentStatusTypes.ACTIVE,
+                    )
                 )
-                active_status_ids_court_case = [
-                    component_status.id
-                    for component_status in court_case_active_statuses
-                ]
                 if check_active_component_status(
                     client_old.court_cases, active_status_ids_court_case
                 ):
@@ -286,5 +256,37 @@ class ClientService(CrudService):
                     )
 
 
+def _get_client_response(
+    request: Request,
+    request_metadata: schemas.RequestMetadata,
+    read_response: dict,
+) -> schemas.ClientResponse:
+    response_data, response_metadata = get_read_response_data_metadata(read_response)
+    if request_metadata and request_metadata.schema_model_id and not response_data:
+        raise_http_exception(
+            request,
+            HTTPStatus.NOT_FOUND,
+            f"Client Not Found By Id: {request_metadata.schema_model_id}!!!",
+        )
+    request_metadata = request_metadata or schemas.RequestMetadata()
+    schema_models = [
+        convert_model_to_schema(
+            data_model=data_model,
+            schema_class=schemas.Client,
+            is_include_extra=request_metadata.is_include_extra,
+            is_include_history=request_metadata.is_include_history,
+            exclusions=[
+                "court_cases",
+                "history_clients",
+                "history_court_cases",
+            ],
+            extra_to_include=["court_cases"],
+            history_to_include=["history_clients"],
+        )
+        for data_model in response_data
+    ]
+    return schemas.ClientResponse(data=schema_models, metadata=response_metadata)
+
+
 def get_client_service(db_session: Session) -> ClientService:
     return ClientService(db_session)
@@ -6,7 +6,7 @@ from fastapi import Request
 from sqlalchemy.orm import Session
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.crud import CrudService, LoadingProfile, unit_of_work
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.history_service import get_history_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
@@ -24,6 +24,12 @@ from src.trackcase_service.utils.convert import (
 
 
 class CaseCollectionService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("component_status", "court_case"),
+        extra=("cash_collections",),
+        history=("history_case_collections",),
+    )
+
     def __init__(self, db_session: Session):
         super(CaseCollectionService, self).__init__(db_session, models.CaseCollection)
 
@@ -32,29 +38,30 @@ class CaseCollectionService(CrudService):
         self, request: Request, request_object: schemas.CaseCollectionRequest
     ) -> schemas.CaseCollectionResponse:
         try:
-            data_model: models.CaseCollection = convert_schema_to_model(
-                request_object, models.CaseCollection
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCaseCollection
-            ).add_to_history(
-                request,
-                request_object,
-                "case_collection_id",
-                data_model.id,
-                "CaseCollection",
-                "HistoryCaseCollection",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.CaseCollection,
-                exclusions=[
-                    "cash_collections",
-                    "history_case_collections",
-                    "history_cash_collections",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.CaseCollection = convert_schema_to_model(
+                    request_object, models.CaseCollection
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCaseCollection
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "case_collection_id",
+                    data_model.id,
+                    "CaseCollection",
+                    "HistoryCaseCollection",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.CaseCollection,
+                    exclusions=[
+                        "cash_collections",
+                        "history_case_collections",
+                        "history_cash_collections",
+                    ],
+                )
             return schemas.CaseCollectionResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -75,6 +82,8 @@ class CaseCollectionService(CrudService):
                 if request_metadata.schema_model_id:
                     read_response = self.read(
                         model_id=request_metadata.schema_model_id,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted,
                     )
                     response_data, response_metadata = get_read_response_data_metadata(
@@ -92,6 +101,11 @@ class CaseCollectionService(CrudService):
                         filter_config=request_metadata.filter_config,
                         page_number=request_metadata.page_number,
                         per_page=request_metadata.per_page,
+                        cursor=request_metadata.cursor,
+                        is_skip_count=request_metadata.is_skip_count,
+                        count_strategy=request_metadata.count_strategy,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted
                         is True,
                     )
@@ -155,29 +169,30 @@ class CaseCollectionService(CrudService):
         )
 
         try:
-            data_model: models.CaseCollection = convert_schema_to_model(
-                request_object, models.CaseCollection
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCaseCollection
-            ).add_to_history(
-                request,
-                request_object,
-                "case_collection_id",
-                data_model.id,
-                "CaseCollection",
-                "HistoryCaseCollection",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.CaseCollection,
-                exclusions=[
-                    "cash_collections",
-                    "history_case_collections",
-                    "history_cash_collections",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.CaseCollection = convert_schema_to_model(
+                    request_object, models.CaseCollection
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCaseCollection
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "case_collection_id",
+                    data_model.id,
+                    "CaseCollection",
+                    "HistoryCaseCollection",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.CaseCollection,
+                    exclusions=[
+                        "cash_collections",
+                        "history_case_collections",
+                        "history_cash_collections",
+                    ],
+                )
             return schemas.CaseCollectionResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -265,17 +280,14 @@ class CaseCollectionService(CrudService):
     ):
         if case_collection_old.cash_collections:
             status_old = case_collection_old.component_status_id
-            collection_active_statuses = get_ref_types_service(
+            active_status_ids = get_ref_types_service(
                 service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
                 db_session=self.db_session,
-            ).get_component_status(
+            ).get_component_status_ids(
                 request,
                 schemas.ComponentStatusNames.COLLECTIONS,
                 schemas.ComponentStatusTypes.ACTIVE,
             )
-            active_status_ids = [
-                component_status.id for component_status in collection_active_statuses
-            ]
 
             if status_new != status_old and status_new not in active_status_ids:
                 if check_active_component_status(
@@ -306,6 +318,11 @@ class CaseCollectionService(CrudService):
 
 
 class CashCollectionService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("collection_method", "case_collection"),
+        history=("history_cash_collections",),
+    )
+
     def __init__(self, db_session: Session):
         super(CashCollectionService, self).__init__(db_session, models.CashCollection)
 
@@ -314,27 +331,28 @@ class CashCollectionService(CrudService):
         self, request: Request, request_object: schemas.CashCollectionRequest
     ) -> schemas.CashCollectionResponse:
         try:
-            data_model: models.CashCollection = convert_schema_to_model(
-                request_object, models.CashCollection
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCashCollection
-            ).add_to_history(
-                request,
-                request_object,
-                "cash_collection_id",
-                data_model.id,
-                "CashCollection",
-                "HistoryCashCollection",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.CashCollection,
-                exclusions=[
-                    "history_cash_collections",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.CashCollection = convert_schema_to_model(
+                    request_object, models.CashCollection
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCashCollection
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "cash_collection_id",
+                    data_model.id,
+                    "CashCollection",
+                    "HistoryCashCollection",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.CashCollection,
+                    exclusions=[
+                        "history_cash_collections",
+                    ],
+                )
             return schemas.CashCollectionResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -355,6 +373,8 @@ class CashCollectionService(CrudService):
                 if request_metadata.schema_model_id:
                     read_response = self.read(
                         model_id=request_metadata.schema_model_id,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted,
                     )
                     response_data, response_metadata = get_read_response_data_metadata(
@@ -372,6 +392,11 @@ class CashCollectionService(CrudService):
                         filter_config=request_metadata.filter_config,
                         page_number=request_metadata.page_number,
                         per_page=request_metadata.per_page,
+                        cursor=request_metadata.cursor,
+                        is_skip_count=request_metadata.is_skip_count,
+                        count_strategy=request_metadata.count_strategy,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted
                         is True,
                     )
@@ -424,27 +449,28 @@ class CashCollectionService(CrudService):
         self.check_cash_collection_exists(model_id, request, is_restore)
 
         try:
-            data_model: models.CashCollection = convert_schema_to_model(
-                request_object, models.CashCollection
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCashCollection
-            ).add_to_history(
-                request,
-                request_object,
-                "cash_collection_id",
-                data_model.id,
-                "CashCollection",
-                "HistoryCashCollection",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.CashCollection,
-                exclusions=[
-                    "history_cash_collections",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.CashCollection = convert_schema_to_model(
+                    request_object, models.CashCollection
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCashCollection
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "cash_collection_id",
+                    data_model.id,
+                    "CashCollection",
+                    "HistoryCashCollection",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.CashCollection,
+                    exclusions=[
+                        "history_cash_collections",
+                    ],
+                )
             return schemas.CashCollectionResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
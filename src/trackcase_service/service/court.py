@@ -1,11 +1,12 @@
 import sys
 from http import HTTPStatus
+from typing import List, Tuple
 
 from fastapi import HTTPException, Request
 from sqlalchemy.orm import Session
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.crud import CrudService, LoadingProfile, unit_of_work
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.history_service import get_history_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
@@ -23,6 +24,12 @@ from src.trackcase_service.utils.convert import (
 
 
 class CourtService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("component_status",),
+        extra=("judges",),
+        history=("history_courts",),
+    )
+
     def __init__(self, db_session: Session):
         super(CourtService, self).__init__(db_session, models.Court)
 
@@ -31,35 +38,113 @@ class CourtService(CrudService):
         self, request: Request, request_object: schemas.CourtRequest
     ) -> schemas.CourtResponse:
         try:
-            data_model: models.Court = convert_schema_to_model(
-                request_object, models.Court
+            with unit_of_work(self.db_session):
+                data_model: models.Court = convert_schema_to_model(
+                    request_object, models.Court
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCourt
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "court_id",
+                    data_model.id,
+                    "Court",
+                    "HistoryCourt",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.Court,
+                    exclusions=[
+                        "judges",
+                        "history_courts",
+                        "history_judges",
+                    ],
+                )
+            return schemas.CourtResponse(data=[schema_model])
+        except Exception as ex:
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg("Error Inserting Court. Please Try Again!!!", str(ex)),
+                exc_info=sys.exc_info(),
             )
-            data_model = self.create(data_model)
+
+    # existing courts are skipped and not returned, single commit for the batch
+    @check_permissions("COURTS_CREATE")
+    def create_courts_bulk(
+        self, request: Request, request_objects: List[schemas.CourtRequest]
+    ) -> List[schemas.CourtRequest]:
+        try:
+            data_models = [
+                convert_schema_to_model(request_object, models.Court)
+                for request_object in request_objects
+            ]
+            inserted_ids = self.create_bulk(data_models, "name")
+            inserted_request_objects_ids = [
+                (request_object, inserted_ids.pop(data_model.name))
+                for request_object, data_model in zip(request_objects, data_models)
+                if data_model.name in inserted_ids
+            ]
             get_history_service(
                 db_session=self.db_session, db_model=models.HistoryCourt
-            ).add_to_history(
+            ).add_to_history_bulk(
                 request,
-                request_object,
+                inserted_request_objects_ids,
                 "court_id",
-                data_model.id,
                 "Court",
                 "HistoryCourt",
             )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.Court,
-                exclusions=[
-                    "judges",
-                    "history_courts",
-                    "history_judges",
-                ],
+            self.db_session.commit()
+            return [
+                request_object for request_object, _ in inserted_request_objects_ids
+            ]
+        except Exception as ex:
+            self.db_session.rollback()
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg("Error Inserting Courts. Please Try Again!!!", str(ex)),
+                exc_info=sys.exc_info(),
             )
-            return schemas.CourtResponse(data=[schema_model])
+
+    # only the given columns are updated, single commit for the batch
+    @check_permissions("COURTS_UPDATE")
+    def update_courts_bulk(
+        self,
+        request: Request,
+        request_objects_ids: List[Tuple[schemas.CourtRequest, int]],
+        columns: List[str],
+    ) -> List[schemas.CourtRequest]:
+        try:
+            models_values = []
+            for request_object, model_id in request_objects_ids:
+                data_model = convert_schema_to_model(request_object, models.Court)
+                models_values.append(
+                    {
+                        "id": model_id,
+                        **{column: getattr(data_model, column) for column in columns},
+                    }
+                )
+            self.update_bulk(models_values)
+            get_history_service(
+                db_session=self.db_session, db_model=models.HistoryCourt
+            ).add_to_history_bulk(
+                request,
+                request_objects_ids,
+                "court_id",
+                "Court",
+                "HistoryCourt",
+            )
+            self.db_session.commit()
+            return [request_object for request_object, _ in request_objects_ids]
         except Exception as ex:
+            self.db_session.rollback()
             raise_http_exception(
                 request,
                 HTTPStatus.INTERNAL_SERVER_ERROR,
-                get_err_msg("Error Inserting Court. Please Try Again!!!", str(ex)),
+                get_err_msg("Error Updating Courts. Please Try Again!!!", str(ex)),
                 exc_info=sys.exc_info(),
             )
 
@@ -72,6 +157,8 @@ class CourtService(CrudService):
                 if request_metadata.schema_model_id:
                     read_response = self.read(
                         model_id=request_metadata.schema_model_id,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted,
                     )
                     response_data, response_metadata = get_read_response_data_metadata(
@@ -89,6 +176,11 @@ class CourtService(CrudService):
                         filter_config=request_metadata.filter_config,
                         page_number=request_metadata.page_number,
                         per_page=request_metadata.per_page,
+                        cursor=request_metadata.cursor,
+                        is_skip_count=request_metadata.is_skip_count,
+                        count_strategy=request_metadata.count_strategy,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted
                         is True,
                     )
@@ -143,29 +235,30 @@ class CourtService(CrudService):
         )
 
         try:
-            data_model: models.Court = convert_schema_to_model(
-                request_object, models.Court
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCourt
-            ).add_to_history(
-                request,
-                request_object,
-                "court_id",
-                data_model.id,
-                "Court",
-                "HistoryCourt",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.Court,
-                exclusions=[
-                    "judges",
-                    "history_courts",
-                    "history_judges",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.Court = convert_schema_to_model(
+                    request_object, models.Court
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCourt
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "court_id",
+                    data_model.id,
+                    "Court",
+                    "HistoryCourt",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.Court,
+                    exclusions=[
+                        "judges",
+                        "history_courts",
+                        "history_judges",
+                    ],
+                )
             return schemas.CourtResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -255,24 +348,18 @@ class CourtService(CrudService):
                 service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
                 db_session=self.db_session,
             )
-            court_active_statuses = ref_types_service.get_component_status(
+            active_status_ids_court = ref_types_service.get_component_status_ids(
                 request,
                 schemas.ComponentStatusNames.COURTS,
                 schemas.ComponentStatusTypes.ACTIVE,
             )
-            active_status_ids_court = [
-                component_status.id for component_status in court_active_statuses
-            ]
 
             if status_new != status_old and status_new not in active_status_ids_court:
-                judge_active_statuses = ref_types_service.get_component_status(
+                active_status_ids_judge = ref_types_service.get_component_status_ids(
                     request,
                     schemas.ComponentStatusNames.JUDGES,
                     schemas.ComponentStatusTypes.ACTIVE,
                 )
-                active_status_ids_judge = [
-                    component_status.id for component_status in judge_active_statuses
-                ]
                 if check_active_component_status(
                     court_old.judges, active_status_ids_judge
                 ):
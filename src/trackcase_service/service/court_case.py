@@ -5,7 +5,7 @@ from fastapi import HTTPException, Request
 from sqlalchemy.orm import Session
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.crud import CrudService, LoadingProfile, unit_of_work
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.history_service import get_history_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
@@ -13,6 +13,7 @@ from src.trackcase_service.utils.commons import (
     check_active_component_status,
     check_permissions,
     get_err_msg,
+    get_read_kwargs,
     get_read_response_data_metadata,
     raise_http_exception,
 )
@@ -23,6 +24,12 @@ from src.trackcase_service.utils.convert import (
 
 
 class CourtCaseService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("component_status", "case_type", "client"),
+        extra=("filings", "case_collections", "hearing_calendars"),
+        history=("history_court_cases",),
+    )
+
     def __init__(self, db_session: Session):
         super(CourtCaseService, self).__init__(db_session, models.CourtCase)
 
@@ -31,33 +38,34 @@ class CourtCaseService(CrudService):
         self, request: Request, request_object: schemas.CourtCaseRequest
     ) -> schemas.CourtCaseResponse:
         try:
-            data_model: models.CourtCase = convert_schema_to_model(
-                request_object, models.CourtCase
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCourtCase
-            ).add_to_history(
-                request,
-                request_object,
-                "court_case_id",
-                data_model.id,
-                "CourtCase",
-                "HistoryCourtCase",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.CourtCase,
-                exclusions=[
-                    "filings",
-                    "case_collections",
-                    "hearing_calendars",
-                    "history_court_cases",
-                    "history_hearing_calendars",
-                    "history_filings",
-                    "history_case_collections",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.CourtCase = convert_schema_to_model(
+                    request_object, models.CourtCase
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCourtCase
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "court_case_id",
+                    data_model.id,
+                    "CourtCase",
+                    "HistoryCourtCase",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.CourtCase,
+                    exclusions=[
+                        "filings",
+                        "case_collections",
+                        "hearing_calendars",
+                        "history_court_cases",
+                        "history_hearing_calendars",
+                        "history_filings",
+                        "history_case_collections",
+                    ],
+                )
             return schemas.CourtCaseResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -72,67 +80,25 @@ class CourtCaseService(CrudService):
         self, request: Request, request_metadata: schemas.RequestMetadata = None
     ) -> schemas.CourtCaseResponse:
         try:
-            if request_metadata:
-                if request_metadata.schema_model_id:
-                    read_response = self.read(
-                        model_id=request_metadata.schema_model_id,
-                        is_include_soft_deleted=request_metadata.is_include_deleted,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-                    if not response_data:
-                        raise_http_exception(
-                            request,
-                            HTTPStatus.NOT_FOUND,
-                            f"CourtCase Not Found By Id: {request_metadata.schema_model_id}!!!",  # noqa: E501
-                        )
-                else:
-                    read_response = self.read(
-                        sort_config=request_metadata.sort_config,
-                        filter_config=request_metadata.filter_config,
-                        page_number=request_metadata.page_number,
-                        per_page=request_metadata.per_page,
-                        is_include_soft_deleted=request_metadata.is_include_deleted
-                        is True,
-                    )
-                    response_data, response_metadata = get_read_response_data_metadata(
-                        read_response
-                    )
-            else:
-                request_metadata = schemas.RequestMetadata()
-                read_response = self.read()
-                response_data, response_metadata = get_read_response_data_metadata(
-                    read_response
-                )
-
-            schema_models = [
-                convert_model_to_schema(
-                    data_model=data_model,
-                    schema_class=schemas.CourtCase,
-                    is_include_extra=request_metadata.is_include_extra,
-                    is_include_history=request_metadata.is_include_history,
-                    exclusions=[
-                        "filings",
-                        "case_collections",
-                        "hearing_calendars",
-                        "history_court_cases",
-                        "history_hearing_calendars",
-                        "history_filings",
-                        "history_case_collections",
-                    ],
-                    extra_to_include=[
-                        "filings",
-                        "case_collections",
-                        "hearing_calendars",
-                    ],
-                    history_to_include=["history_court_cases"],
-                )
-                for data_model in response_data
-            ]
-            return schemas.CourtCaseResponse(
-                data=schema_models, metadata=response_metadata
+            read_response = self.read(**get_read_kwargs(request_metadata))
+            return _get_court_case_response(request, request_metadata, read_response)
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg("Error Retrieving CourtCase. Please Try Again!!!", str(ex)),
+                exc_info=sys.exc_info(),
             )
+
+    @check_permissions("COURT_CASES_READ")
+    async def read_court_case_async(
+        self, request: Request, request_metadata: schemas.RequestMetadata = None
+    ) -> schemas.CourtCaseResponse:
+        try:
+            read_response = await self.read_async(**get_read_kwargs(request_metadata))
+            return _get_court_case_response(request, request_metadata, read_response)
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -157,33 +123,34 @@ class CourtCaseService(CrudService):
         )
 
         try:
-            data_model: models.CourtCase = convert_schema_to_model(
-                request_object, models.CourtCase
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryCourtCase
-            ).add_to_history(
-                request,
-                request_object,
-                "court_case_id",
-                data_model.id,
-                "CourtCase",
-                "HistoryCourtCase",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.CourtCase,
-                exclusions=[
-                    "filings",
-                    "case_collections",
-                    "hearing_calendars",
-                    "history_court_cases",
-                    "history_hearing_calendars",
-                    "history_filings",
-                    "history_case_collections",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.CourtCase = convert_schema_to_model(
+                    request_object, models.CourtCase
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryCourtCase
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "court_case_id",
+                    data_model.id,
+                    "CourtCase",
+                    "HistoryCourtCase",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.CourtCase,
+                    exclusions=[
+                        "filings",
+                        "case_collections",
+                        "hearing_calendars",
+                        "history_court_cases",
+                        "history_hearing_calendars",
+                        "history_filings",
+                        "history_case_collections",
+                    ],
+                )
             return schemas.CourtCaseResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -284,25 +251,19 @@ class CourtCaseService(CrudService):
             service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
             db_session=self.db_session,
         )
-        court_case_active_statuses = ref_types_service.get_component_status(
+        active_status_ids_court_case = ref_types_service.get_component_status_ids(
             request,
             schemas.ComponentStatusNames.COURT_CASES,
             schemas.ComponentStatusTypes.ACTIVE,
         )
-        active_status_ids_court_case = [
-            component_status.id for component_status in court_case_active_statuses
-        ]
 
         if status_new != status_old and status_new not in active_status_ids_court_case:
             if court_case_old.filings:
-                filing_active_statuses = ref_types_service.get_component_status(
+                active_status_ids_filing = ref_types_service.get_component_status_ids(
                     request,
                     schemas.ComponentStatusNames.FILINGS,
                     schemas.ComponentStatusTypes.ACTIVE,
                 )
-                active_status_ids_filing = [
-                    component_status.id for component_status in filing_active_statuses
-                ]
                 if check_active_component_status(
                     court_case_old.filings, active_status_ids_filing
                 ):
@@ -313,15 +274,13 @@ class CourtCaseService(CrudService):
                     )
 
             if court_case_old.case_collections:
-                collection_active_statuses = ref_types_service.get_component_status(
-                    request,
-                    schemas.ComponentStatusNames.COLLECTIONS,
-                    schemas.ComponentStatusTypes.ACTIVE,
+                active_status_ids_collection = (
+                    ref_types_service.get_component_status_ids(
+                        request,
+                        schemas.ComponentStatusNames.COLLECTIONS,
+                        schemas.ComponentStatusTypes.ACTIVE,
+                    )
                 )
-                active_status_ids_collection = [
-                    component_status.id
-                    for component_status in collection_active_statuses
-                ]
                 if check_active_component_status(
                     court_case_old.case_collections, active_status_ids_collection
                 ):
@@ -332,14 +291,11 @@ class CourtCaseService(CrudService):
                     )
 
             if court_case_old.hearing_calendars:
-                calendar_active_statuses = ref_types_service.get_component_status(
+                active_status_ids_calendar = ref_types_service.get_component_status_ids(
                     request,
                     schemas.ComponentStatusNames.CALENDARS,
                     schemas.ComponentStatusTypes.ACTIVE,
                 )
-                active_status_ids_calendar = [
-                    component_status.id for component_status in calendar_active_statuses
-                ]
                 if check_active_component_status(
                     court_case_old.hearing_calendars, active_status_ids_calendar
                 ):
@@ -350,5 +306,45 @@ class CourtCaseService(CrudService):
                     )
 
 
+def _get_court_case_response(
+    request: Request,
+    request_metadata: schemas.RequestMetadata,
+    read_response: dict,
+) -> schemas.CourtCaseResponse:
+    response_data, response_metadata = get_read_response_data_metadata(read_response)
+    if request_metadata and request_metadata.schema_model_id and not response_data:
+        raise_http_exception(
+            request,
+            HTTPStatus.NOT_FOUND,
+            f"CourtCase Not Found By Id: {request_metadata.schema_model_id}!!!",
+        )
+    request_metadata = request_metadata or schemas.RequestMetadata()
+    schema_models = [
+        convert_model_to_schema(
+            data_model=data_model,
+            schema_class=schemas.CourtCase,
+            is_include_extra=request_metadata.is_include_extra,
+            is_include_history=request_metadata.is_include_history,
+            exclusions=[
+                "filings",
+                "case_collections",
+                "hearing_calendars",
+                "history_court_cases",
+                "history_hearing_calendars",
+                "history_filings",
+                "history_case_collections",
+            ],
+            extra_to_include=[
+                "filings",
+                "case_collections",
+                "hearing_calendars",
+            ],
+            history_to_include=["history_court_cases"],
+        )
+        for data_model in response_data
+    ]
+    return schemas.CourtCaseResponse(data=schema_models, metadata=response_metadata)
+
+
 def get_court_case_service(db_session: Session) -> CourtCaseService:
     return CourtCaseService(db_session)
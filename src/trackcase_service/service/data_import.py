@@ -1,27 +1,58 @@
 import csv
+import hashlib
+import importlib.util
+import io
+import json
 import logging
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from fastapi import Request
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
 
+from src.trackcase_service.db import models
+from src.trackcase_service.db.session import SessionLocal
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.court import get_court_service
 from src.trackcase_service.service.judge import get_judge_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
-from src.trackcase_service.utils import logger
+from src.trackcase_service.utils import constants, logger
+from src.trackcase_service.utils.commons import get_auth_user_token
+from src.trackcase_service.utils.convert import convert_schema_to_model
 
 log = logger.Logger(logging.getLogger(__name__))
-
-
-def create_csv(file_name, csv_data):
+# scraped columns compared against existing rows, only these are updated
+COURT_IMPORT_COLUMNS = [
+    "court_url",
+    "component_status_id",
+    "street_address",
+    "city",
+    "state",
+    "zip_code",
+]
+JUDGE_IMPORT_COLUMNS = ["name", "webex", "court_id", "component_status_id"]
+IMPORT_JOB_PENDING_STATUSES = (
+    schemas.ImportJobStatus.QUEUED,
+    schemas.ImportJobStatus.RUNNING,
+)
+# lxml parses much faster when installed, html.parser otherwise
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+
+def create_csv(csv_data) -> str:
     fieldnames = list(csv_data[0].keys())
-    with open(file_name, "w") as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for data in csv_data:
-            writer.writerow(data)
+    outfile = io.StringIO()
+    writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+    writer.writeheader()
+    for data in csv_data:
+        writer.writerow(data)
+    return outfile.getvalue()
 
 
 def get_component_status_map(
@@ -165,33 +196,199 @@ def dedupe_judge_requests(judge_requests):
     return unique_judge_requests
 
 
+def get_import_diff(import_requests, model_class, existing_rows, key_columns, columns):
+    # existing rows indexed by each key column, the first key that matches wins
+    existing_indexes = {
+        key_column: {
+            getattr(existing_row, key_column): existing_row
+            for existing_row in existing_rows
+            if getattr(existing_row, key_column)
+        }
+        for key_column in key_columns
+    }
+    new_requests, changed_requests_ids, unchanged_requests = [], [], []
+    for import_request in import_requests:
+        data_model = convert_schema_to_model(import_request, model_class)
+        existing_row = next(
+            (
+                existing_indexes[key_column][getattr(data_model, key_column)]
+                for key_column in key_columns
+                if getattr(data_model, key_column) in existing_indexes[key_column]
+            ),
+            None,
+        )
+        if existing_row is None:
+            new_requests.append(import_request)
+        # soft deleted rows are left as they are
+        elif existing_row.is_deleted or all(
+            getattr(data_model, column) == getattr(existing_row, column)
+            for column in columns
+        ):
+            unchanged_requests.append(import_request)
+        else:
+            changed_requests_ids.append((import_request, existing_row.id))
+    return new_requests, changed_requests_ids, unchanged_requests
+
+
+def upsert_import_data(
+    db_session: Session,
+    model_class,
+    import_requests,
+    key_columns,
+    columns,
+    create_bulk,
+    update_bulk,
+):
+    existing_rows = db_session.query(
+        model_class.id,
+        model_class.is_deleted,
+        *[
+            getattr(model_class, column)
+            for column in dict.fromkeys(key_columns + columns)
+        ],
+    ).all()
+    new_requests, changed_requests_ids, unchanged_requests = get_import_diff(
+        import_requests, model_class, existing_rows, key_columns, columns
+    )
+
+    created, updated = [], []
+    if new_requests:
+        try:
+            created = create_bulk(new_requests)
+        except Exception as ex:
+            log.error(msg=f"Error Inserting {model_class.__name__}s", extra=ex)
+    if changed_requests_ids:
+        try:
+            updated = update_bulk(changed_requests_ids, columns)
+        except Exception as ex:
+            log.error(msg=f"Error Updating {model_class.__name__}s", extra=ex)
+
+    successes = created + updated
+    failures = get_import_failures(
+        new_requests + [request for request, _ in changed_requests_ids], successes
+    )
+    import_summary = schemas.ImportSummary(
+        created=len(created),
+        updated=len(updated),
+        unchanged=len(unchanged_requests),
+        failed=len(failures),
+    )
+    log.info(
+        f"{model_class.__name__}s Import Summary: {import_summary.model_dump_json()}"
+    )
+    return successes, failures, import_summary
+
+
+def get_import_failures(import_requests, successes):
+    success_ids = {id(success) for success in successes}
+    return [
+        import_request
+        for import_request in import_requests
+        if id(import_request) not in success_ids
+    ]
+
+
 class WebScraper:
-    def __init__(self, url_to_scrape: str):
+    def __init__(
+        self,
+        url_to_scrape: str,
+        parse_only: SoupStrainer = None,
+        cache_dir: str = constants.SCRAPE_CACHE_DIR,
+    ):
         self.url_to_scrape = url_to_scrape
+        self.parse_only = parse_only
+        self.cache_file = (
+            os.path.join(
+                cache_dir,
+                hashlib.sha256(url_to_scrape.encode("utf-8")).hexdigest() + ".json",
+            )
+            if cache_dir
+            else None
+        )
 
-    def scrape(self):
-        response = requests.get(self.url_to_scrape)
+    # returns None when the page has not changed since the last scrape
+    # otherwise the page and its cache entry, to be written once it is imported
+    def scrape(self, is_force: bool = False) -> tuple[BeautifulSoup | None, dict]:
+        cache_entry = {} if is_force else self._read_cache_entry()
+        headers = {}
+        if cache_entry.get("etag"):
+            headers["If-None-Match"] = cache_entry.get("etag")
+        if cache_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cache_entry.get("last_modified")
+        response = requests.get(
+            self.url_to_scrape,
+            headers=headers,
+            timeout=constants.SCRAPE_TIMEOUT_SECONDS,
+        )
 
+        if response.status_code == 304:
+            log.info(f"Not Modified, skipping scraped url: {self.url_to_scrape}")
+            return None, cache_entry
         if response.status_code == 200:
-            return BeautifulSoup(response.content, "html.parser")
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            pending_cache_entry = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content_hash": content_hash,
+            }
+            if content_hash == cache_entry.get("content_hash"):
+                # this content was already imported, only the headers are new
+                self.write_cache_entry(pending_cache_entry)
+                log.info(f"Same content, skipping scraped url: {self.url_to_scrape}")
+                return None, pending_cache_entry
+            return (
+                BeautifulSoup(
+                    response.content, HTML_PARSER, parse_only=self.parse_only
+                ),
+                pending_cache_entry,
+            )
         else:
             raise RuntimeError(
                 f"Invalid Response code of {response.status_code} scraping url: {self.url_to_scrape}"  # noqa: E501
             )
 
+    def _read_cache_entry(self) -> dict:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "r") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError) as ex:
+            log.error(msg="Error Reading Scrape Cache", extra=ex)
+            return {}
+
+    def write_cache_entry(self, cache_entry: dict):
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w") as cache_file:
+                json.dump(cache_entry, cache_file)
+        except OSError as ex:
+            log.error(msg="Error Writing Scrape Cache", extra=ex)
+
 
 # does not have phone number or dhs address data
 class CourtsImport:
     def __init__(self, db_session: Session, request: Request):
         self.db_session = db_session
         self.request = request
+        # successes and failures csv, downloaded from the import job
+        self.csv_reports: dict[str, str] = {}
+
+    def import_courts(self, is_force: bool = False) -> schemas.ImportSummary:
+        url = "https://www.justice.gov/eoir/immigration-court-operational-status"
+        web_scraper = WebScraper(
+            url_to_scrape=url,
+            parse_only=SoupStrainer("table", class_="usa-table"),
+        )
+        soup, cache_entry = web_scraper.scrape(is_force)
+        if soup is None:
+            return schemas.ImportSummary()
 
-    def import_courts(self):
         court_statuses = get_component_status_map(
             self.db_session, self.request, schemas.ComponentStatusNames.COURTS
         )
-        url = "https://www.justice.gov/eoir/immigration-court-operational-status"
-        soup = WebScraper(url_to_scrape=url).scrape()
         court_table = soup.find("table", class_="usa-table")
         courts_data = []
 
@@ -203,27 +400,32 @@ class CourtsImport:
                     courts_data.append(court)
                 else:
                     log.error(msg="Court is None", extra=row)
-        self.insert_court_data(courts_data)
-
-    def insert_court_data(self, court_requests):
-        successes = []
-        failures = []
-        for court_request in court_requests:
-            try:
-                get_court_service(db_session=self.db_session).create_court(
-                    self.request, court_request
-                )
-                successes.append(court_request)
-                self.db_session.commit()
-            except Exception as ex:
-                log.error(msg="Error Inserting Court", extra=ex)
-                failures.append(court_request)
-                self.db_session.rollback()
+        import_summary = self.insert_court_data(courts_data)
+        # failed rows are retried on the next run, so the page is not marked done
+        if import_summary.failed == 0:
+            web_scraper.write_cache_entry(cache_entry)
+        return import_summary
+
+    def insert_court_data(self, court_requests) -> schemas.ImportSummary:
+        court_service = get_court_service(db_session=self.db_session)
+        successes, failures, import_summary = upsert_import_data(
+            self.db_session,
+            models.Court,
+            court_requests,
+            ["name"],
+            COURT_IMPORT_COLUMNS,
+            lambda new_requests: court_service.create_courts_bulk(
+                self.request, new_requests
+            ),
+            lambda changed_requests_ids, columns: court_service.update_courts_bulk(
+                self.request, changed_requests_ids, columns
+            ),
+        )
         self.create_csv_data(successes, True)
         self.create_csv_data(failures, False)
+        return import_summary
 
-    @staticmethod
-    def create_csv_data(successes_or_failures, is_success):
+    def create_csv_data(self, successes_or_failures, is_success):
         csv_data = []
         for success_or_failure in successes_or_failures:
             csv_data.append(
@@ -238,10 +440,9 @@ class CourtsImport:
                 }
             )
         if len(csv_data) > 0:
-            if is_success:
-                create_csv("courts_import_successes.csv", csv_data)
-            else:
-                create_csv("courts_import_failures.csv", csv_data)
+            self.csv_reports["successes" if is_success else "failures"] = create_csv(
+                csv_data
+            )
         else:
             log.info("COURTS IMPORT NO CSV DATA")
 
@@ -250,15 +451,23 @@ class JudgesImport:
     def __init__(self, db_session: Session, request: Request):
         self.db_session = db_session
         self.request = request
+        # successes and failures csv, downloaded from the import job
+        self.csv_reports: dict[str, str] = {}
+
+    def import_judges(self, is_force: bool = False) -> schemas.ImportSummary:
+        url = "https://www.justice.gov/eoir/find-immigration-court-and-access-internet-based-hearings"  # noqa: E501
+        # court names and the judge tables after them, siblings in the strained tree
+        web_scraper = WebScraper(
+            url_to_scrape=url, parse_only=SoupStrainer(["h3", "table"])
+        )
+        soup, cache_entry = web_scraper.scrape(is_force)
+        if soup is None:
+            return schemas.ImportSummary()
 
-    def import_judges(self):
         judge_active_status = get_judges_active_status(self.db_session, self.request)
         courts_map = get_courts_map(self.db_session, self.request)
 
         judges_data = []
-        url = "https://www.justice.gov/eoir/find-immigration-court-and-access-internet-based-hearings"  # noqa: E501
-        soup = WebScraper(url_to_scrape=url).scrape()
-
         court_tags = soup.find_all("h3")
         for court_tag in court_tags:
             judges = extract_judges_details(court_tag, courts_map, judge_active_status)
@@ -266,27 +475,32 @@ class JudgesImport:
                 judges_data.extend(judges)
             else:
                 log.error(msg="Judges is None", extra=court_tag)
-        self.insert_judge_data(judges_data)
-
-    def insert_judge_data(self, judge_requests):
-        successes = []
-        failures = []
-        for judge_request in dedupe_judge_requests(judge_requests):
-            try:
-                get_judge_service(db_session=self.db_session).create_judge(
-                    self.request, judge_request
-                )
-                successes.append(judge_request)
-                self.db_session.commit()
-            except Exception as ex:
-                log.error(msg="Error Inserting Judge", extra=ex)
-                failures.append(judge_request)
-                self.db_session.rollback()
+        import_summary = self.insert_judge_data(judges_data)
+        # failed rows are retried on the next run, so the page is not marked done
+        if import_summary.failed == 0:
+            web_scraper.write_cache_entry(cache_entry)
+        return import_summary
+
+    def insert_judge_data(self, judge_requests) -> schemas.ImportSummary:
+        judge_service = get_judge_service(db_session=self.db_session)
+        successes, failures, import_summary = upsert_import_data(
+            self.db_session,
+            models.Judge,
+            dedupe_judge_requests(judge_requests),
+            ["name", "webex"],
+            JUDGE_IMPORT_COLUMNS,
+            lambda new_requests: judge_service.create_judges_bulk(
+                self.request, new_requests
+            ),
+            lambda changed_requests_ids, columns: judge_service.update_judges_bulk(
+                self.request, changed_requests_ids, columns
+            ),
+        )
         self.create_csv_data(successes, True)
         self.create_csv_data(failures, False)
+        return import_summary
 
-    @staticmethod
-    def create_csv_data(successes_or_failures, is_success):
+    def create_csv_data(self, successes_or_failures, is_success):
         csv_data = []
         for success_or_failure in successes_or_failures:
             csv_data.append(
@@ -298,10 +512,9 @@ class JudgesImport:
                 }
             )
         if len(csv_data) > 0:
-            if is_success:
-                create_csv("judges_import_successes.csv", csv_data)
-            else:
-                create_csv("judges_import_failures.csv", csv_data)
+            self.csv_reports["successes" if is_success else "failures"] = create_csv(
+                csv_data
+            )
         else:
             log.info("JUDGES IMPORT NO CSV DATA")
 
@@ -312,3 +525,200 @@ def get_courts_import_service(db_session: Session, request: Request) -> CourtsIm
 
 def get_judges_import_service(db_session: Session, request: Request) -> JudgesImport:
     return JudgesImport(db_session, request)
+
+
+# jobs run in this process, their state and reports are in the import_job table
+# so any worker can return them, and a pending job blocks submits in all workers
+class ImportJobRunner:
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        max_workers: int,
+        max_kept_jobs: int,
+        stale_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.max_kept_jobs = max_kept_jobs
+        self.stale_seconds = stale_seconds
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="import-job"
+        )
+
+    def submit(
+        self, job_type: schemas.ImportJobTypes, request: Request, is_force: bool
+    ) -> schemas.ImportJob:
+        app_user_id = get_auth_user_token(request).get("id")
+        db_session = self.session_factory()
+        try:
+            self._fail_stale_jobs(db_session)
+            # one job per type at a time, a repeated submit gets the pending one
+            for _ in range(3):
+                import_job = models.ImportJob(
+                    job_id=uuid.uuid4().hex,
+                    job_type=job_type,
+                    status=schemas.ImportJobStatus.QUEUED,
+                    app_user_id=app_user_id,
+                    created=datetime.now(),
+                )
+                job = _get_import_job_schema(import_job)
+                db_session.add(import_job)
+                try:
+                    db_session.commit()
+                    break
+                except IntegrityError:
+                    db_session.rollback()
+                pending_job = db_session.execute(
+                    select(models.ImportJob).where(
+                        models.ImportJob.job_type == job_type,
+                        models.ImportJob.status.in_(IMPORT_JOB_PENDING_STATUSES),
+                    )
+                ).scalar_one_or_none()
+                if pending_job:
+                    return _get_import_job_schema(pending_job)
+            else:
+                raise RuntimeError(f"Error Submitting Import Job: {job_type}")
+        finally:
+            db_session.close()
+
+        # request is done before the job, keep only what the import needs
+        job_request = Request(
+            scope={
+                **request.scope,
+                "state": {"user_details": get_auth_user_token(request)},
+            }
+        )
+        self.executor.submit(self._run, job.job_id, job_request, is_force)
+        return job
+
+    def get_job(self, job_id: str) -> schemas.ImportJob | None:
+        db_session = self.session_factory()
+        try:
+            import_job = db_session.get(models.ImportJob, job_id)
+            return _get_import_job_schema(import_job) if import_job else None
+        finally:
+            db_session.close()
+
+    def get_csv_report(self, job_id: str, report_name: str) -> str | None:
+        db_session = self.session_factory()
+        try:
+            import_job = db_session.get(models.ImportJob, job_id)
+            if not import_job or not import_job.reports:
+                return None
+            return json.loads(import_job.reports).get(report_name)
+        finally:
+            db_session.close()
+
+    # queued jobs not started are failed as stale, by the next submit
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: str, request: Request, is_force: bool):
+        self._update_job(
+            job_id, status=schemas.ImportJobStatus.RUNNING, started=datetime.now()
+        )
+        job = self.get_job(job_id)
+        db_session = self.session_factory()
+        try:
+            if job.job_type == schemas.ImportJobTypes.COURTS:
+                data_import = get_courts_import_service(db_session, request)
+                import_summary = data_import.import_courts(is_force)
+            else:
+                data_import = get_judges_import_service(db_session, request)
+                import_summary = data_import.import_judges(is_force)
+            self._update_job(
+                job_id,
+                status=schemas.ImportJobStatus.COMPLETED,
+                finished=datetime.now(),
+                summary=import_summary.model_dump_json(),
+                reports=json.dumps(data_import.csv_reports),
+            )
+        except Exception as ex:
+            log.error(msg=f"Error Running Import Job: {job_id}", extra=ex)
+            self._update_job(
+                job_id,
+                status=schemas.ImportJobStatus.FAILED,
+                finished=datetime.now(),
+                error=str(ex),
+            )
+        finally:
+            db_session.close()
+        self._remove_old_jobs()
+
+    def _update_job(self, job_id: str, **values):
+        db_session = self.session_factory()
+        try:
+            db_session.execute(
+                update(models.ImportJob)
+                .where(models.ImportJob.job_id == job_id)
+                .values(**values)
+            )
+            db_session.commit()
+        finally:
+            db_session.close()
+
+    # a worker stopped while running or before starting leaves the job pending
+    def _fail_stale_jobs(self, db_session: Session):
+        db_session.execute(
+            update(models.ImportJob)
+            .where(
+                models.ImportJob.status.in_(IMPORT_JOB_PENDING_STATUSES),
+                models.ImportJob.created
+                < datetime.now() - timedelta(seconds=self.stale_seconds),
+            )
+            .values(
+                status=schemas.ImportJobStatus.FAILED,
+                finished=datetime.now(),
+                error="Import Job Not Finished, Worker Stopped?",
+            )
+        )
+        db_session.commit()
+
+    def _remove_old_jobs(self):
+        # newest finished ones are kept, pending ones are not counted
+        old_job_ids = (
+            select(models.ImportJob.job_id)
+            .where(models.ImportJob.status.not_in(IMPORT_JOB_PENDING_STATUSES))
+            .order_by(models.ImportJob.created.desc())
+            .offset(self.max_kept_jobs)
+        )
+        db_session = self.session_factory()
+        try:
+            db_session.execute(
+                delete(models.ImportJob).where(
+                    models.ImportJob.job_id.in_(old_job_ids.scalar_subquery())
+                )
+            )
+            db_session.commit()
+        finally:
+            db_session.close()
+
+
+def _get_import_job_schema(import_job: models.ImportJob) -> schemas.ImportJob:
+    return schemas.ImportJob(
+        job_id=import_job.job_id,
+        job_type=import_job.job_type,
+        status=import_job.status,
+        app_user_id=import_job.app_user_id,
+        created=import_job.created,
+        started=import_job.started,
+        finished=import_job.finished,
+        summary=(
+            schemas.ImportSummary.model_validate_json(import_job.summary)
+            if import_job.summary
+            else None
+        ),
+        error=import_job.error,
+        reports=list(json.loads(import_job.reports)) if import_job.reports else [],
+    )
+
+
+IMPORT_JOB_RUNNER = ImportJobRunner(
+    SessionLocal,
+    constants.IMPORT_JOBS_MAX_WORKERS,
+    constants.IMPORT_JOBS_MAX_KEPT,
+    constants.IMPORT_JOBS_STALE_SECONDS,
+)
+
+
+def get_import_job_runner() -> ImportJobRunner:
+    return IMPORT_JOB_RUNNER
@@ -5,7 +5,7 @@ from fastapi import HTTPException, Request
 from sqlalchemy.orm import Session
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.crud import CrudService, LoadingProfile, unit_of_work
 from src.trackcase_service.service import schemas
 from src.trackcase_service.service.history_service import get_history_service
 from src.trackcase_service.service.ref_types import get_ref_types_service
@@ -23,6 +23,18 @@ from src.trackcase_service.utils.convert import (
 
 
 class FilingService(CrudService):
+    loading_profile = LoadingProfile(
+        default=(
+            "component_status",
+            "filing_type",
+            "court_case",
+            "filing_rfes",
+            "history_filing_rfes",
+        ),
+        extra=("task_calendars",),
+        history=("history_filings",),
+    )
+
     def __init__(self, db_session: Session):
         super(FilingService, self).__init__(db_session, models.Filing)
 
@@ -31,29 +43,30 @@ class FilingService(CrudService):
         self, request: Request, request_object: schemas.FilingRequest
     ) -> schemas.FilingResponse:
         try:
-            data_model: models.Filing = convert_schema_to_model(
-                request_object, models.Filing
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryFiling
-            ).add_to_history(
-                request,
-                request_object,
-                "filing_id",
-                data_model.id,
-                "Filing",
-                "HistoryFiling",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.Filing,
-                exclusions=[
-                    "task_calendars",
-                    "history_filings",
-                    "history_task_calendars",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.Filing = convert_schema_to_model(
+                    request_object, models.Filing
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryFiling
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "filing_id",
+                    data_model.id,
+                    "Filing",
+                    "HistoryFiling",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.Filing,
+                    exclusions=[
+                        "task_calendars",
+                        "history_filings",
+                        "history_task_calendars",
+                    ],
+                )
             return schemas.FilingResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -72,6 +85,8 @@ class FilingService(CrudService):
                 if request_metadata.schema_model_id:
                     read_response = self.read(
                         model_id=request_metadata.schema_model_id,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted,
                     )
                     response_data, response_metadata = get_read_response_data_metadata(
@@ -89,6 +104,11 @@ class FilingService(CrudService):
                         filter_config=request_metadata.filter_config,
                         page_number=request_metadata.page_number,
                         per_page=request_metadata.per_page,
+                        cursor=request_metadata.cursor,
+                        is_skip_count=request_metadata.is_skip_count,
+                        count_strategy=request_metadata.count_strategy,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted
                         is True,
                     )
@@ -145,29 +165,30 @@ class FilingService(CrudService):
         )
 
         try:
-            data_model: models.Filing = convert_schema_to_model(
-                request_object, models.Filing
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryFiling
-            ).add_to_history(
-                request,
-                request_object,
-                "filing_id",
-                data_model.id,
-                "Filing",
-                "HistoryFiling",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.Filing,
-                exclusions=[
-                    "task_calendars",
-                    "history_filings",
-                    "history_task_calendars",
-                ],
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.Filing = convert_schema_to_model(
+                    request_object, models.Filing
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryFiling
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "filing_id",
+                    data_model.id,
+                    "Filing",
+                    "HistoryFiling",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.Filing,
+                    exclusions=[
+                        "task_calendars",
+                        "history_filings",
+                        "history_task_calendars",
+                    ],
+                )
             return schemas.FilingResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -257,23 +278,17 @@ class FilingService(CrudService):
                 service_type=schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
                 db_session=self.db_session,
             )
-            filing_active_statuses = ref_types_service.get_component_status(
+            active_status_ids_filing = ref_types_service.get_component_status_ids(
                 request,
                 schemas.ComponentStatusNames.FILINGS,
                 schemas.ComponentStatusTypes.ACTIVE,
             )
-            active_status_ids_filing = [
-                component_status.id for component_status in filing_active_statuses
-            ]
             if status_new != status_old and status_new not in active_status_ids_filing:
-                calendar_active_statuses = ref_types_service.get_component_status(
+                active_status_ids_calendar = ref_types_service.get_component_status_ids(
                     request,
                     schemas.ComponentStatusNames.CALENDARS,
                     schemas.ComponentStatusTypes.ACTIVE,
                 )
-                active_status_ids_calendar = [
-                    component_status.id for component_status in calendar_active_statuses
-                ]
 
                 if check_active_component_status(
                     filing_old.task_calendars, active_status_ids_calendar
@@ -286,6 +301,10 @@ class FilingService(CrudService):
 
 
 class FilingRfeService(CrudService):
+    loading_profile = LoadingProfile(
+        default=("filing", "history_filing_rfes"),
+    )
+
     def __init__(self, db_session: Session):
         super(FilingRfeService, self).__init__(db_session, models.FilingRfe)
 
@@ -294,24 +313,25 @@ class FilingRfeService(CrudService):
         self, request: Request, request_object: schemas.FilingRfeRequest
     ) -> schemas.FilingRfeResponse:
         try:
-            data_model: models.FilingRfe = convert_schema_to_model(
-                request_object, models.FilingRfe
-            )
-            data_model = self.create(data_model)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryFilingRfe
-            ).add_to_history(
-                request,
-                request_object,
-                "filing_rfe_id",
-                data_model.id,
-                "FilingRfe",
-                "HistoryFilingRfe",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.FilingRfe,
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.FilingRfe = convert_schema_to_model(
+                    request_object, models.FilingRfe
+                )
+                data_model = self.create(data_model)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryFilingRfe
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "filing_rfe_id",
+                    data_model.id,
+                    "FilingRfe",
+                    "HistoryFilingRfe",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.FilingRfe,
+                )
             return schemas.FilingRfeResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -330,6 +350,8 @@ class FilingRfeService(CrudService):
                 if request_metadata.schema_model_id:
                     read_response = self.read(
                         model_id=request_metadata.schema_model_id,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted,
                     )
                     response_data, response_metadata = get_read_response_data_metadata(
@@ -347,6 +369,11 @@ class FilingRfeService(CrudService):
                         filter_config=request_metadata.filter_config,
                         page_number=request_metadata.page_number,
                         per_page=request_metadata.per_page,
+                        cursor=request_metadata.cursor,
+                        is_skip_count=request_metadata.is_skip_count,
+                        count_strategy=request_metadata.count_strategy,
+                        is_include_extra=request_metadata.is_include_extra,
+                        is_include_history=request_metadata.is_include_history,
                         is_include_soft_deleted=request_metadata.is_include_deleted
                         is True,
                     )
@@ -396,24 +423,25 @@ class FilingRfeService(CrudService):
         self.check_filing_rfe_exists(model_id, request, is_restore)
 
         try:
-            data_model: models.FilingRfe = convert_schema_to_model(
-                request_object, models.FilingRfe
-            )
-            data_model = self.update(model_id, data_model, is_restore)
-            get_history_service(
-                db_session=self.db_session, db_model=models.HistoryFilingRfe
-            ).add_to_history(
-                request,
-                request_object,
-                "filing_rfe_id",
-                data_model.id,
-                "FilingRfe",
-                "HistoryFilingRfe",
-            )
-            schema_model = convert_model_to_schema(
-                data_model,
-                schemas.FilingRfe,
-            )
+            with unit_of_work(self.db_session):
+                data_model: models.FilingRfe = convert_schema_to_model(
+                    request_object, models.FilingRfe
+                )
+                data_model = self.update(model_id, data_model, is_restore)
+                get_history_service(
+                    db_session=self.db_session, db_model=models.HistoryFilingRfe
+                ).add_to_history(
+                    request,
+                    request_object,
+                    "filing_rfe_id",
+                    data_model.id,
+                    "FilingRfe",
+                    "HistoryFilingRfe",
+                )
+                schema_model = convert_model_to_schema(
+                    data_model,
+                    schemas.FilingRfe,
+                )
             return schemas.FilingRfeResponse(data=[schema_model])
         except Exception as ex:
             raise_http_exception(
@@ -1,19 +1,34 @@
+import json
 import logging
-from typing import Type, TypeVar, Union
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Tuple, Type, TypeVar, Union
 
 from fastapi import Request
 from pydantic import BaseModel
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, Numeric, delete, event, insert, select, text
+from sqlalchemy.orm import Session, sessionmaker
 
-from src.trackcase_service.db.crud import CrudService
-from src.trackcase_service.db.models import Base
+from src.trackcase_service.db.crud import (
+    UNIT_OF_WORK_KEY,
+    CrudService,
+    clear_total_items_cache_after_commit,
+)
+from src.trackcase_service.db.models import Base, HistoryOutbox
+from src.trackcase_service.db.session import SessionLocal
+from src.trackcase_service.utils import constants
+from src.trackcase_service.utils.cache import clear_total_items_cache
 from src.trackcase_service.utils.commons import get_auth_user_token
 from src.trackcase_service.utils.convert import convert_schema_to_model
 from src.trackcase_service.utils.logger import Logger
 
 log = Logger(logging.getLogger(__name__))
 ModelBase = TypeVar("ModelBase", bound=Base)
+# outbox rows added in the session, queued for the writer once they commit
+HISTORY_PENDING_KEY = "history_outbox_pending"
 
 
 class HistoryService(CrudService):
@@ -39,9 +54,63 @@ class HistoryService(CrudService):
             exclusions=["id", "created", "modified"],
         )
         try:
-            super().create(history_data_model)
+            if constants.HISTORY_WRITE_BEHIND:
+                self._add_to_history_outbox(history_data_model)
+            else:
+                super().create(history_data_model)
         except Exception as ex:
-            err_msg = f"{parent_type} Action Successful! BUT!! Something went wrong inserting {history_type}!!!"  # noqa: E501
+            if UNIT_OF_WORK_KEY in self.db_session.info:
+                # the unit of work rolls back the entity write with it
+                err_msg = f"{parent_type} Action Failed! Something went wrong inserting {history_type}!!!"  # noqa: E501
+            else:
+                err_msg = f"{parent_type} Action Successful! BUT!! Something went wrong inserting {history_type}!!!"  # noqa: E501
+            log.error(err_msg, extra=ex)
+            raise Exception(err_msg)
+
+    # the outbox row is committed with the entity by the unit of work or the caller
+    # it is the durable copy, the record itself is queued once that commit is done
+    def _add_to_history_outbox(self, history_data_model: ModelBase):
+        now = datetime.now()
+        table = self.db_model.__table__
+        values = {
+            column.key: getattr(history_data_model, column.key)
+            for column in table.columns
+            if column.key != "id"
+        }
+        values.update(created=now, modified=now, is_deleted=False)
+        outbox_row = HistoryOutbox(
+            table_name=table.name, payload=_dump_record(values), created=now
+        )
+        self.db_session.add(outbox_row)
+        self.db_session.flush()
+        self.db_session.info.setdefault(HISTORY_PENDING_KEY, []).append(
+            (outbox_row.id, table.name, values)
+        )
+
+    def add_to_history_bulk(
+        self,
+        request: Request,
+        request_objects_ids: List[Tuple[BaseModel, int]],
+        history_object_id_key: str,
+        parent_type: str,
+        history_type: str,
+    ):
+        app_user_id = get_auth_user_token(request).get("id")
+        history_data_models = [
+            convert_schema_to_model(
+                request_object,
+                self.db_model,
+                app_user_id,
+                history_object_id_key,
+                history_object_id_value,
+                exclusions=["id", "created", "modified"],
+            )
+            for request_object, history_object_id_value in request_objects_ids
+        ]
+        try:
+            super().create_bulk(history_data_models)
+        except Exception as ex:
+            err_msg = f"Something went wrong inserting {history_type} for {parent_type}!!!"  # noqa: E501
             log.error(err_msg, extra=ex)
             raise Exception(err_msg)
 
@@ -56,6 +125,7 @@ class HistoryService(CrudService):
         sql = text(f"""DELETE FROM {history_table_name} WHERE {id_key} = {id_value}""")
         try:
             self.db_session.execute(sql)
+            clear_total_items_cache_after_commit(self.db_session, history_table_name)
         except Exception as ex:
             err_msg = (
                 f"Something went wrong deleting all {history_type} for {parent_type}!!!"
@@ -64,6 +134,219 @@ class HistoryService(CrudService):
             raise Exception(err_msg)
 
 
+@event.listens_for(Session, "after_commit")
+def _enqueue_pending_history(db_session: Session):
+    records = db_session.info.pop(HISTORY_PENDING_KEY, None)
+    if records:
+        get_history_writer().enqueue(records)
+
+
+# soft rollback fires even if nothing reached the database, savepoints keep them
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_history(db_session: Session, previous_transaction):
+    if not db_session.in_transaction():
+        db_session.info.pop(HISTORY_PENDING_KEY, None)
+
+
+# batch inserts queued history records and deletes their outbox rows
+# replays outbox rows the queue did not write: overflow, errors, stopped workers
+class HistoryWriter:
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        max_queue_size: int,
+        batch_size: int,
+        flush_seconds: float,
+        outbox_replay_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.outbox_replay_seconds = outbox_replay_seconds
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self._run, name="history-writer", daemon=True
+        )
+        self.thread.start()
+
+    def enqueue(self, records: List[Tuple[int, str, dict]]):
+        for index, record in enumerate(records):
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                # do not block the request, the outbox rows are replayed later
+                log.error(f"History Queue Full, Left in Outbox: {len(records[index:])}")
+                return
+
+    def flush(self):
+        batch = self._drain(self.batch_size)
+        while batch:
+            self._write(batch)
+            batch = self._drain(self.batch_size)
+
+    # what is still queued is written, then the rest of the outbox
+    def shutdown(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=self.flush_seconds * 5)
+            self.thread = None
+        self.flush()
+        self.replay_outbox()
+
+    def replay_outbox(self, created_before: datetime = None):
+        while True:
+            db_session = self.session_factory()
+            try:
+                # skip locked, another worker process may be replaying too
+                statement = select(HistoryOutbox)
+                if created_before:
+                    statement = statement.where(HistoryOutbox.created < created_before)
+                outbox_rows = (
+                    db_session.execute(
+                        statement.order_by(HistoryOutbox.id)
+                        .limit(self.batch_size)
+                        .with_for_update(skip_locked=True)
+                    )
+                    .scalars()
+                    .all()
+                )
+                if not outbox_rows:
+                    return
+                records = [
+                    _load_record(outbox_row.table_name, outbox_row.payload)
+                    for outbox_row in outbox_rows
+                ]
+                table_names = self._insert(db_session, records)
+                db_session.execute(
+                    delete(HistoryOutbox).where(
+                        HistoryOutbox.id.in_([row.id for row in outbox_rows])
+                    )
+                )
+                db_session.commit()
+            except Exception as ex:
+                db_session.rollback()
+                log.error("Error Replaying History Outbox...", extra=ex)
+                return
+            finally:
+                db_session.close()
+            for table_name in table_names:
+                clear_total_items_cache(table_name)
+            if len(outbox_rows) < self.batch_size:
+                return
+
+    def _run(self):
+        self.replay_outbox()
+        last_replay = time.monotonic()
+        while not self.stop_event.is_set():
+            try:
+                batch = [self.queue.get(timeout=self.flush_seconds)]
+            except queue.Empty:
+                batch = []
+            batch.extend(self._drain(self.batch_size - len(batch)))
+            if batch:
+                self._write(batch)
+            if time.monotonic() - last_replay >= self.outbox_replay_seconds:
+                # rows this long in the outbox are not waiting in a queue anymore
+                self.replay_outbox(
+                    datetime.now() - timedelta(seconds=self.outbox_replay_seconds)
+                )
+                last_replay = time.monotonic()
+
+    def _drain(self, max_records: int) -> List[Tuple[int, str, dict]]:
+        batch = []
+        while len(batch) < max_records:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    # one delete of the outbox rows and one multi row insert per history table
+    def _write(self, batch: List[Tuple[int, str, dict]]):
+        db_session = self.session_factory()
+        try:
+            # rows already replayed are not deleted again, so not inserted twice
+            deleted_ids = set(
+                db_session.execute(
+                    delete(HistoryOutbox)
+                    .where(HistoryOutbox.id.in_([record[0] for record in batch]))
+                    .returning(HistoryOutbox.id)
+                )
+                .scalars()
+                .all()
+            )
+            table_names = self._insert(
+                db_session,
+                [
+                    (table_name, values)
+                    for outbox_id, table_name, values in batch
+                    if outbox_id in deleted_ids
+                ],
+            )
+            db_session.commit()
+        except Exception as ex:
+            db_session.rollback()
+            log.error("Error Writing History, Left in Outbox...", extra=ex)
+            return
+        finally:
+            db_session.close()
+        for table_name in table_names:
+            clear_total_items_cache(table_name)
+
+    # one multi row insert per history table
+    @staticmethod
+    def _insert(db_session: Session, records: List[Tuple[str, dict]]) -> set:
+        records_by_table: dict[str, list] = {}
+        for table_name, values in records:
+            records_by_table.setdefault(table_name, []).append(values)
+        for table_name, values_list in records_by_table.items():
+            db_session.execute(insert(Base.metadata.tables[table_name]), values_list)
+        return set(records_by_table.keys())
+
+
+def _dump_record(values: dict) -> str:
+    return json.dumps(
+        {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in values.items()
+        },
+        default=str,
+    )
+
+
+def _load_record(table_name: str, payload: str) -> Tuple[str, dict]:
+    values = json.loads(payload)
+    for column in Base.metadata.tables[table_name].columns:
+        value = values.get(column.key)
+        if value is None:
+            continue
+        if isinstance(column.type, DateTime):
+            values[column.key] = datetime.fromisoformat(value)
+        elif isinstance(column.type, Numeric):
+            values[column.key] = Decimal(value)
+    return table_name, values
+
+
+HISTORY_WRITER = HistoryWriter(
+    SessionLocal,
+    constants.HISTORY_QUEUE_MAX_SIZE,
+    constants.HISTORY_BATCH_SIZE,
+    constants.HISTORY_FLUSH_SECONDS,
+    constants.HISTORY_OUTBOX_REPLAY_SECONDS,
+)
+
+
+def get_history_writer() -> HistoryWriter:
+    return HISTORY_WRITER
+
+
 def get_history_service(
     db_session: Session, db_model: Type[ModelBase]
 ) -> HistoryService:
@@ -1,7 +1,7 @@
 import logging
 import sys
 from http import HTTPStatus
-from typing import Type, Union
+from typing import NamedTuple, Type, Union
 
 from fastapi import HTTPException, Request
 from sqlalchemy.orm import Session
@@ -9,10 +9,16 @@ from sqlalchemy.orm import Session
 from src.trackcase_service.db import models
 from src.trackcase_service.db.crud import CrudService, DataKeys
 from src.trackcase_service.service import schemas
-from src.trackcase_service.utils.cache import get_ref_types_cache, set_ref_types_cache
+from src.trackcase_service.utils.cache import (
+    clear_ref_types_cache,
+    get_ref_types_cache,
+    get_ref_types_index,
+    get_ref_types_index_async,
+)
 from src.trackcase_service.utils.commons import (
     check_permissions,
     get_err_msg,
+    get_read_kwargs,
     raise_http_exception,
 )
 from src.trackcase_service.utils.convert import (
@@ -24,6 +30,47 @@ from src.trackcase_service.utils.logger import Logger
 log = Logger(logging.getLogger(__name__))
 
 
+# component status lookups, built once per cached component statuses snapshot
+class ComponentStatusIndex(NamedTuple):
+    statuses: dict[tuple, tuple[schemas.ComponentStatus, ...]]
+    status_ids: dict[tuple, frozenset[int]]
+    status_by_id: dict[int, schemas.ComponentStatus]
+    status_id_by_name: dict[tuple, int]
+
+
+def _build_component_status_index(
+    component_statuses: tuple[schemas.ComponentStatus, ...],
+) -> ComponentStatusIndex:
+    statuses = {}
+    for component_status in component_statuses:
+        status_types = [schemas.ComponentStatusTypes.ALL]
+        if component_status.is_active is True:
+            status_types.append(schemas.ComponentStatusTypes.ACTIVE)
+        elif component_status.is_active is False:
+            status_types.append(schemas.ComponentStatusTypes.INACTIVE)
+        for status_type in status_types:
+            statuses.setdefault(
+                (component_status.component_name, status_type), []
+            ).append(component_status)
+    return ComponentStatusIndex(
+        statuses={key: tuple(value) for key, value in statuses.items()},
+        status_ids={
+            key: frozenset(component_status.id for component_status in value)
+            for key, value in statuses.items()
+        },
+        status_by_id={
+            component_status.id: component_status
+            for component_status in component_statuses
+        },
+        status_id_by_name={
+            (component_status.component_name, component_status.status_name): (
+                component_status.id
+            )
+            for component_status in component_statuses
+        },
+    )
+
+
 class ComponentStatusService(CrudService):
     def __init__(self, db_session: Session):
         super(ComponentStatusService, self).__init__(db_session, models.ComponentStatus)
@@ -32,13 +79,12 @@ class ComponentStatusService(CrudService):
     def create_component_status(
         self, request: Request, request_object: schemas.ComponentStatusRequest
     ) -> schemas.ComponentStatusResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS, [])
-
         try:
             data_model: models.ComponentStatus = convert_schema_to_model(
                 request_object, models.ComponentStatus
             )
             data_model = self.create(data_model)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.ComponentStatus,
@@ -59,39 +105,37 @@ class ComponentStatusService(CrudService):
         self, request: Request, metadata: schemas.RequestMetadata = None
     ) -> schemas.ComponentStatusResponse:
         try:
-            if metadata is not None and metadata.schema_model_id is not None:
-                read_response = self.read(
-                    model_id=metadata.schema_model_id,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    True,
-                    request,
-                    metadata.schema_model_id,
-                    schemas.ComponentStatus,
-                    schemas.ComponentStatusResponse,
-                )
-            elif metadata is not None:
-                read_response = self.read(
-                    sort_config=metadata.sort_config,
-                    filter_config=metadata.filter_config,
-                    page_number=metadata.page_number,
-                    per_page=metadata.per_page,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.ComponentStatus,
-                    return_type=schemas.ComponentStatusResponse,
-                )
-            else:
-                read_response = self.read()
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.ComponentStatus,
-                    return_type=schemas.ComponentStatusResponse,
-                )
+            return get_ref_types_response(
+                self.read(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.ComponentStatus,
+                schemas.ComponentStatusResponse,
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving ComponentStatus. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    @check_permissions("REF_TYPES_READ")
+    async def read_component_status_async(
+        self, request: Request, metadata: schemas.RequestMetadata = None
+    ) -> schemas.ComponentStatusResponse:
+        try:
+            return get_ref_types_response(
+                await self.read_async(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.ComponentStatus,
+                schemas.ComponentStatusResponse,
+            )
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -110,40 +154,73 @@ class ComponentStatusService(CrudService):
         component_name: schemas.ComponentStatusNames,
         status_type: schemas.ComponentStatusTypes = None,
     ) -> list[schemas.ComponentStatus]:
-        component_statuses = get_ref_types_cache(
-            schemas.RefTypesServiceRegistry.COMPONENT_STATUS
-        )
-        if not component_statuses:
-            component_statuses = self.read_component_status(request).data or []
-            set_ref_types_cache(
-                schemas.RefTypesServiceRegistry.COMPONENT_STATUS, component_statuses
+        component_status_index = self._get_component_status_index(request)
+        return list(
+            component_status_index.statuses.get(
+                (component_name, status_type or schemas.ComponentStatusTypes.ALL),
+                (),
             )
-        component_name_statuses = [
-            component_status
-            for component_status in component_statuses
-            if component_status.component_name == component_name
-        ]
-        if not status_type or status_type == schemas.ComponentStatusTypes.ALL:
-            return component_name_statuses
-        elif status_type == schemas.ComponentStatusTypes.ACTIVE:
-            return [
-                component_status
-                for component_status in component_name_statuses
-                if component_status.is_active is True
-            ]
-        else:
-            return [
-                component_status
-                for component_status in component_name_statuses
-                if component_status.is_active is False
-            ]
-        # return list(
-        #     filter(
-        #         lambda component_status: component_status.component_name
-        #         == component_name,
-        #         component_statuses,
-        #     )
-        # )
+        )
+
+    def get_component_status_ids(
+        self,
+        request: Request,
+        component_name: schemas.ComponentStatusNames,
+        status_type: schemas.ComponentStatusTypes = None,
+    ) -> frozenset[int]:
+        component_status_index = self._get_component_status_index(request)
+        return component_status_index.status_ids.get(
+            (component_name, status_type or schemas.ComponentStatusTypes.ALL),
+            frozenset(),
+        )
+
+    async def get_component_status_ids_async(
+        self,
+        request: Request,
+        component_name: schemas.ComponentStatusNames,
+        status_type: schemas.ComponentStatusTypes = None,
+    ) -> frozenset[int]:
+        component_status_index = await self._get_component_status_index_async(request)
+        return component_status_index.status_ids.get(
+            (component_name, status_type or schemas.ComponentStatusTypes.ALL),
+            frozenset(),
+        )
+
+    def get_component_status_by_id(
+        self, request: Request, component_status_id: int
+    ) -> schemas.ComponentStatus | None:
+        component_status_index = self._get_component_status_index(request)
+        return component_status_index.status_by_id.get(component_status_id)
+
+    def get_component_status_id(
+        self,
+        request: Request,
+        component_name: schemas.ComponentStatusNames,
+        status_name: str,
+    ) -> int | None:
+        component_status_index = self._get_component_status_index(request)
+        return component_status_index.status_id_by_name.get(
+            (component_name, status_name)
+        )
+
+    def _get_component_status_index(self, request: Request) -> ComponentStatusIndex:
+        return get_ref_types_index(
+            schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
+            _build_component_status_index,
+            lambda: self.read_component_status(request).data or [],
+        )
+
+    async def _get_component_status_index_async(
+        self, request: Request
+    ) -> ComponentStatusIndex:
+        async def load_component_statuses():
+            return (await self.read_component_status_async(request)).data or []
+
+        return await get_ref_types_index_async(
+            schemas.RefTypesServiceRegistry.COMPONENT_STATUS,
+            _build_component_status_index,
+            load_component_statuses,
+        )
 
     def check_component_status_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -169,7 +246,6 @@ class ComponentStatusService(CrudService):
         request_object: schemas.ComponentStatusRequest,
         is_restore: bool = False,
     ) -> schemas.ComponentStatusResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS, [])
         self.check_component_status_exists(model_id, request, is_restore)
 
         try:
@@ -177,6 +253,7 @@ class ComponentStatusService(CrudService):
                 request_object, models.ComponentStatus
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.ComponentStatus,
@@ -197,11 +274,11 @@ class ComponentStatusService(CrudService):
     def delete_component_status(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.ComponentStatusResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS, [])
         self.check_component_status_exists(model_id, request)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS)
             return schemas.ComponentStatusResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -225,12 +302,12 @@ class CollectionMethodService(CrudService):
     def create_collection_method(
         self, request: Request, request_object: schemas.CollectionMethodRequest
     ) -> schemas.CollectionMethodResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.COLLECTION_METHOD, [])
         try:
             data_model: models.CollectionMethod = convert_schema_to_model(
                 request_object, models.CollectionMethod
             )
             data_model = self.create(data_model)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.COLLECTION_METHOD)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.CollectionMethod,
@@ -252,42 +329,39 @@ class CollectionMethodService(CrudService):
         self, request: Request, metadata: schemas.RequestMetadata = None
     ) -> schemas.CollectionMethodResponse:
         try:
-            if metadata is not None and metadata.schema_model_id is not None:
-                read_response = self.read(
-                    model_id=metadata.schema_model_id,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    True,
-                    request,
-                    metadata.schema_model_id,
-                    schemas.CollectionMethod,
-                    schemas.CollectionMethodResponse,
-                    exclusions=["cash_collections", "history_cash_collections"],
-                )
-            elif metadata is not None:
-                read_response = self.read(
-                    sort_config=metadata.sort_config,
-                    filter_config=metadata.filter_config,
-                    page_number=metadata.page_number,
-                    per_page=metadata.per_page,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.CollectionMethod,
-                    return_type=schemas.CollectionMethodResponse,
-                    exclusions=["cash_collections", "history_cash_collections"],
-                )
-            else:
-                read_response = self.read()
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.CollectionMethod,
-                    return_type=schemas.CollectionMethodResponse,
-                    exclusions=["cash_collections", "history_cash_collections"],
-                )
+            return get_ref_types_response(
+                self.read(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.CollectionMethod,
+                schemas.CollectionMethodResponse,
+                exclusions=["cash_collections", "history_cash_collections"],
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving CollectionMethod. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    @check_permissions("REF_TYPES_READ")
+    async def read_collection_method_async(
+        self, request: Request, metadata: schemas.RequestMetadata = None
+    ) -> schemas.CollectionMethodResponse:
+        try:
+            return get_ref_types_response(
+                await self.read_async(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.CollectionMethod,
+                schemas.CollectionMethodResponse,
+                exclusions=["cash_collections", "history_cash_collections"],
+            )
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -305,14 +379,10 @@ class CollectionMethodService(CrudService):
         request: Request,
     ) -> list[schemas.CollectionMethod]:
         collection_methods = get_ref_types_cache(
-            schemas.RefTypesServiceRegistry.COLLECTION_METHOD
+            schemas.RefTypesServiceRegistry.COLLECTION_METHOD,
+            lambda: self.read_collection_method(request).data or [],
         )
-        if not collection_methods:
-            collection_methods = self.read_collection_method(request).data or []
-            set_ref_types_cache(
-                schemas.RefTypesServiceRegistry.COLLECTION_METHOD, collection_methods
-            )
-            return collection_methods
+        return list(collection_methods)
 
     def check_collection_method_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -338,7 +408,6 @@ class CollectionMethodService(CrudService):
         request_object: schemas.CollectionMethodRequest,
         is_restore: bool = False,
     ) -> schemas.CollectionMethodResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.COLLECTION_METHOD, [])
         self.check_collection_method_exists(model_id, request, is_restore)
 
         try:
@@ -346,6 +415,7 @@ class CollectionMethodService(CrudService):
                 request_object, models.CollectionMethod
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.COLLECTION_METHOD)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.CollectionMethod,
@@ -367,11 +437,11 @@ class CollectionMethodService(CrudService):
     def delete_collection_method(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.CollectionMethodResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.COLLECTION_METHOD, [])
         self.check_collection_method_exists(model_id, request)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.COLLECTION_METHOD)
             return schemas.CollectionMethodResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -393,12 +463,12 @@ class CaseTypeService(CrudService):
     def create_case_type(
         self, request: Request, request_object: schemas.CaseTypeRequest
     ) -> schemas.CaseTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE, [])
         try:
             data_model: models.CaseType = convert_schema_to_model(
                 request_object, models.CaseType
             )
             data_model = self.create(data_model)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.CaseType,
@@ -418,42 +488,37 @@ class CaseTypeService(CrudService):
         self, request: Request, metadata: schemas.RequestMetadata = None
     ) -> schemas.CaseTypeResponse:
         try:
-            if metadata is not None and metadata.schema_model_id is not None:
-                read_response = self.read(
-                    model_id=metadata.schema_model_id,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    True,
-                    request,
-                    metadata.schema_model_id,
-                    schemas.CaseType,
-                    schemas.CaseTypeResponse,
-                    exclusions=["court_cases", "history_court_cases"],
-                )
-            elif metadata is not None:
-                read_response = self.read(
-                    sort_config=metadata.sort_config,
-                    filter_config=metadata.filter_config,
-                    page_number=metadata.page_number,
-                    per_page=metadata.per_page,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.CaseType,
-                    return_type=schemas.CaseTypeResponse,
-                    exclusions=["court_cases", "history_court_cases"],
-                )
-            else:
-                read_response = self.read()
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.CaseType,
-                    return_type=schemas.CaseTypeResponse,
-                    exclusions=["court_cases", "history_court_cases"],
-                )
+            return get_ref_types_response(
+                self.read(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.CaseType,
+                schemas.CaseTypeResponse,
+                exclusions=["court_cases", "history_court_cases"],
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg("Error Retrieving CaseType. Please Try Again!!!", str(ex)),
+                exc_info=sys.exc_info(),
+            )
+
+    @check_permissions("REF_TYPES_READ")
+    async def read_case_type_async(
+        self, request: Request, metadata: schemas.RequestMetadata = None
+    ) -> schemas.CaseTypeResponse:
+        try:
+            return get_ref_types_response(
+                await self.read_async(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.CaseType,
+                schemas.CaseTypeResponse,
+                exclusions=["court_cases", "history_court_cases"],
+            )
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -468,11 +533,11 @@ class CaseTypeService(CrudService):
         self,
         request: Request,
     ) -> list[schemas.CaseType]:
-        case_types = get_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE)
-        if not case_types:
-            case_types = self.read_case_type(request).data or []
-            set_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE, case_types)
-            return case_types
+        case_types = get_ref_types_cache(
+            schemas.RefTypesServiceRegistry.CASE_TYPE,
+            lambda: self.read_case_type(request).data or [],
+        )
+        return list(case_types)
 
     def check_case_type_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -496,7 +561,6 @@ class CaseTypeService(CrudService):
         request_object: schemas.CaseTypeRequest,
         is_restore: bool = False,
     ) -> schemas.CaseTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE, [])
         self.check_case_type_exists(model_id, request, is_restore)
 
         try:
@@ -504,6 +568,7 @@ class CaseTypeService(CrudService):
                 request_object, models.CaseType
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.CaseType,
@@ -525,11 +590,11 @@ class CaseTypeService(CrudService):
     def delete_case_type(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.CaseTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE, [])
         self.check_case_type_exists(model_id, request)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.CASE_TYPE)
             return schemas.CaseTypeResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -551,12 +616,12 @@ class FilingTypeService(CrudService):
     def create_filing_type(
         self, request: Request, request_object: schemas.FilingTypeRequest
     ) -> schemas.FilingTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE, [])
         try:
             data_model: models.FilingType = convert_schema_to_model(
                 request_object, models.FilingType
             )
             data_model = self.create(data_model)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.FilingType,
@@ -576,42 +641,39 @@ class FilingTypeService(CrudService):
         self, request: Request, metadata: schemas.RequestMetadata = None
     ) -> schemas.FilingTypeResponse:
         try:
-            if metadata is not None and metadata.schema_model_id is not None:
-                read_response = self.read(
-                    model_id=metadata.schema_model_id,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    True,
-                    request,
-                    metadata.schema_model_id,
-                    schemas.FilingType,
-                    schemas.FilingTypeResponse,
-                    exclusions=["filings", "history_filings"],
-                )
-            elif metadata is not None:
-                read_response = self.read(
-                    sort_config=metadata.sort_config,
-                    filter_config=metadata.filter_config,
-                    page_number=metadata.page_number,
-                    per_page=metadata.per_page,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.FilingType,
-                    return_type=schemas.FilingTypeResponse,
-                    exclusions=["filings", "history_filings"],
-                )
-            else:
-                read_response = self.read()
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.FilingType,
-                    return_type=schemas.FilingTypeResponse,
-                    exclusions=["filings", "history_filings"],
-                )
+            return get_ref_types_response(
+                self.read(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.FilingType,
+                schemas.FilingTypeResponse,
+                exclusions=["filings", "history_filings"],
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving FilingType. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    @check_permissions("REF_TYPES_READ")
+    async def read_filing_type_async(
+        self, request: Request, metadata: schemas.RequestMetadata = None
+    ) -> schemas.FilingTypeResponse:
+        try:
+            return get_ref_types_response(
+                await self.read_async(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.FilingType,
+                schemas.FilingTypeResponse,
+                exclusions=["filings", "history_filings"],
+            )
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -628,13 +690,11 @@ class FilingTypeService(CrudService):
         self,
         request: Request,
     ) -> list[schemas.FilingType]:
-        filing_types = get_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE)
-        if not filing_types:
-            filing_types = self.read_filing_type(request).data or []
-            set_ref_types_cache(
-                schemas.RefTypesServiceRegistry.FILING_TYPE, filing_types
-            )
-            return filing_types
+        filing_types = get_ref_types_cache(
+            schemas.RefTypesServiceRegistry.FILING_TYPE,
+            lambda: self.read_filing_type(request).data or [],
+        )
+        return list(filing_types)
 
     def check_filing_type_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -658,7 +718,6 @@ class FilingTypeService(CrudService):
         request_object: schemas.FilingTypeRequest,
         is_restore: bool = False,
     ) -> schemas.FilingTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE, [])
         self.check_filing_type_exists(model_id, request, is_restore)
 
         try:
@@ -666,6 +725,7 @@ class FilingTypeService(CrudService):
                 request_object, models.FilingType
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.FilingType,
@@ -687,11 +747,11 @@ class FilingTypeService(CrudService):
     def delete_filing_type(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.FilingTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE, [])
         self.check_filing_type_exists(model_id, request, is_hard_delete)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.FILING_TYPE)
             return schemas.FilingTypeResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -713,12 +773,12 @@ class HearingTypeService(CrudService):
     def create_hearing_type(
         self, request: Request, request_object: schemas.HearingTypeRequest
     ) -> schemas.HearingTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.HEARING_TYPE, [])
         try:
             data_model: models.HearingType = convert_schema_to_model(
                 request_object, models.HearingType
             )
             data_model = self.create(data_model)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.HEARING_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.HearingType,
@@ -740,42 +800,39 @@ class HearingTypeService(CrudService):
         self, request: Request, metadata: schemas.RequestMetadata = None
     ) -> schemas.HearingTypeResponse:
         try:
-            if metadata is not None and metadata.schema_model_id is not None:
-                read_response = self.read(
-                    model_id=metadata.schema_model_id,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    True,
-                    request,
-                    metadata.schema_model_id,
-                    schemas.HearingType,
-                    schemas.HearingTypeResponse,
-                    exclusions=["hearing_calendars", "history_hearing_calendars"],
-                )
-            elif metadata is not None:
-                read_response = self.read(
-                    sort_config=metadata.sort_config,
-                    filter_config=metadata.filter_config,
-                    page_number=metadata.page_number,
-                    per_page=metadata.per_page,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.HearingType,
-                    return_type=schemas.HearingTypeResponse,
-                    exclusions=["hearing_calendars", "history_hearing_calendars"],
-                )
-            else:
-                read_response = self.read()
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.HearingType,
-                    return_type=schemas.HearingTypeResponse,
-                    exclusions=["hearing_calendars", "history_hearing_calendars"],
-                )
+            return get_ref_types_response(
+                self.read(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.HearingType,
+                schemas.HearingTypeResponse,
+                exclusions=["hearing_calendars", "history_hearing_calendars"],
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg(
+                    "Error Retrieving HearingType. Please Try Again!!!", str(ex)
+                ),
+                exc_info=sys.exc_info(),
+            )
+
+    @check_permissions("REF_TYPES_READ")
+    async def read_hearing_type_async(
+        self, request: Request, metadata: schemas.RequestMetadata = None
+    ) -> schemas.HearingTypeResponse:
+        try:
+            return get_ref_types_response(
+                await self.read_async(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.HearingType,
+                schemas.HearingTypeResponse,
+                exclusions=["hearing_calendars", "history_hearing_calendars"],
+            )
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -793,14 +850,10 @@ class HearingTypeService(CrudService):
         request: Request,
     ) -> list[schemas.HearingType]:
         hearing_types = get_ref_types_cache(
-            schemas.RefTypesServiceRegistry.HEARING_TYPE
+            schemas.RefTypesServiceRegistry.HEARING_TYPE,
+            lambda: self.read_hearing_type(request).data or [],
         )
-        if not hearing_types:
-            hearing_types = self.read_hearing_type(request).data or []
-            set_ref_types_cache(
-                schemas.RefTypesServiceRegistry.HEARING_TYPE, hearing_types
-            )
-            return hearing_types
+        return list(hearing_types)
 
     def check_hearing_type_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -824,7 +877,6 @@ class HearingTypeService(CrudService):
         request_object: schemas.HearingTypeRequest,
         is_restore: bool = False,
     ) -> schemas.HearingTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.HEARING_TYPE, [])
         self.check_hearing_type_exists(model_id, request, is_restore)
 
         try:
@@ -832,6 +884,7 @@ class HearingTypeService(CrudService):
                 request_object, models.HearingType
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.HEARING_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.HearingType,
@@ -853,11 +906,11 @@ class HearingTypeService(CrudService):
     def delete_hearing_type(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.HearingTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.HEARING_TYPE, [])
         self.check_hearing_type_exists(model_id, request)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.HEARING_TYPE)
             return schemas.HearingTypeResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -879,12 +932,12 @@ class TaskTypeService(CrudService):
     def create_task_type(
         self, request: Request, request_object: schemas.TaskTypeRequest
     ) -> schemas.TaskTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE, [])
         try:
             data_model: models.TaskType = convert_schema_to_model(
                 request_object, models.TaskType
             )
             data_model = self.create(data_model)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.TaskType,
@@ -904,42 +957,37 @@ class TaskTypeService(CrudService):
         self, request: Request, metadata: schemas.RequestMetadata = None
     ) -> schemas.TaskTypeResponse:
         try:
-            if metadata is not None and metadata.schema_model_id is not None:
-                read_response = self.read(
-                    model_id=metadata.schema_model_id,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    True,
-                    request,
-                    metadata.schema_model_id,
-                    schemas.TaskType,
-                    schemas.TaskTypeResponse,
-                    exclusions=["task_calendars", "history_task_calendars"],
-                )
-            elif metadata is not None:
-                read_response = self.read(
-                    sort_config=metadata.sort_config,
-                    filter_config=metadata.filter_config,
-                    page_number=metadata.page_number,
-                    per_page=metadata.per_page,
-                    is_include_soft_deleted=metadata.is_include_deleted,
-                )
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.TaskType,
-                    return_type=schemas.TaskTypeResponse,
-                    exclusions=["task_calendars", "history_task_calendars"],
-                )
-            else:
-                read_response = self.read()
-                return get_ref_types_response(
-                    read_response,
-                    schema_type=schemas.TaskType,
-                    return_type=schemas.TaskTypeResponse,
-                    exclusions=["task_calendars", "history_task_calendars"],
-                )
+            return get_ref_types_response(
+                self.read(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.TaskType,
+                schemas.TaskTypeResponse,
+                exclusions=["task_calendars", "history_task_calendars"],
+            )
+        except Exception as ex:
+            if isinstance(ex, HTTPException):
+                raise
+            raise_http_exception(
+                request,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                get_err_msg("Error Retrieving TaskType. Please Try Again!!!", str(ex)),
+                exc_info=sys.exc_info(),
+            )
+
+    @check_permissions("REF_TYPES_READ")
+    async def read_task_type_async(
+        self, request: Request, metadata: schemas.RequestMetadata = None
+    ) -> schemas.TaskTypeResponse:
+        try:
+            return get_ref_types_response(
+                await self.read_async(**get_read_kwargs(metadata)),
+                request,
+                metadata,
+                schemas.TaskType,
+                schemas.TaskTypeResponse,
+                exclusions=["task_calendars", "history_task_calendars"],
+            )
         except Exception as ex:
             if isinstance(ex, HTTPException):
                 raise
@@ -954,11 +1002,11 @@ class TaskTypeService(CrudService):
         self,
         request: Request,
     ) -> list[schemas.TaskType]:
-        task_types = get_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE)
-        if not task_types:
-            task_types = self.read_task_type(request).data or []
-            set_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE, task_types)
-            return task_types
+        task_types = get_ref_types_cache(
+            schemas.RefTypesServiceRegistry.TASK_TYPE,
+            lambda: self.read_task_type(request).data or [],
+        )
+        return list(task_types)
 
     def check_task_type_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -982,7 +1030,6 @@ class TaskTypeService(CrudService):
         request_object: schemas.TaskTypeRequest,
         is_restore: bool = False,
     ) -> schemas.TaskTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE, [])
         self.check_task_type_exists(model_id, request, is_restore)
 
         try:
@@ -990,6 +1037,7 @@ class TaskTypeService(CrudService):
                 request_object, models.TaskType
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.TaskType,
@@ -1011,11 +1059,11 @@ class TaskTypeService(CrudService):
     def delete_task_type(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.TaskTypeResponse:
-        set_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE, [])
         self.check_task_type_exists(model_id, request)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_ref_types_cache(schemas.RefTypesServiceRegistry.TASK_TYPE)
             return schemas.TaskTypeResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -1052,9 +1100,8 @@ def get_ref_types_service(
 
 def get_ref_types_response(
     read_response,
-    is_single=False,
-    request: Request = None,
-    model_id: int = None,
+    request: Request,
+    metadata: schemas.RequestMetadata = None,
     schema_type: Union[
         Type[schemas.ComponentStatus],
         Type[schemas.CollectionMethod],
@@ -1082,13 +1129,13 @@ def get_ref_types_response(
 ]:
     if exclusions is None:
         exclusions = []
-    if is_single and not read_response.get(DataKeys.data):
+    data_models = read_response.get(DataKeys.data)
+    if metadata is not None and metadata.schema_model_id and not data_models:
         raise_http_exception(
             request,
             HTTPStatus.NOT_FOUND,
-            f"{schema_type.__name__} Not Found By Id: {model_id}!!!",
+            f"{schema_type.__name__} Not Found By Id: {metadata.schema_model_id}!!!",
         )
-    data_models = read_response.get(DataKeys.data)
     metadata = read_response.get(DataKeys.metadata)
     schema_models = [
         convert_model_to_schema(
@@ -33,16 +33,20 @@ class RequestMetadata(BaseSchema):
     filter_config: list[FilterConfig] = []
     page_number: Optional[int] = 1
     per_page: Optional[int] = 100
+    cursor: Optional[str] = None
+    is_skip_count: Optional[bool] = False
+    count_strategy: Optional["CountStrategy"] = None
     is_include_deleted: Optional[bool] = False
     is_include_extra: Optional[bool] = False
     is_include_history: Optional[bool] = False
 
 
 class ResponseMetadata(BaseSchema):
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
     page_number: int
     per_page: int
+    next_cursor: Optional[str] = None
 
 
 class ErrorDetail(BaseSchema):
@@ -758,6 +762,27 @@ class CashCollectionResponse(ResponseBase):
     data: list[CashCollection] = []
 
 
+# data import
+class ImportSummary(BaseSchema):
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+
+class ImportJob(BaseSchema):
+    job_id: str
+    job_type: "ImportJobTypes"
+    status: "ImportJobStatus"
+    app_user_id: int
+    created: datetime
+    started: Optional[datetime] = None
+    finished: Optional[datetime] = None
+    summary: Optional[ImportSummary] = None
+    error: Optional[str] = None
+    reports: list[str] = []
+
+
 # enums
 class LogLevelOptions(str, Enum):
     DEBUG = "DEBUG"
@@ -775,6 +800,12 @@ class SortDirection(str, Enum):
     DESC = "DESC"
 
 
+class CountStrategy(str, Enum):
+    EXACT = "EXACT"
+    ESTIMATED = "ESTIMATED"
+    CACHED = "CACHED"
+
+
 class FilterOperation(str, Enum):
     EQUAL_TO = "eq"
     GREATER_THAN = "gt"
@@ -804,6 +835,7 @@ class RefTypesServiceRegistry(str, Enum):
 class CalendarServiceRegistry(str, Enum):
     HEARING_CALENDAR = "HEARING_CALENDAR"
     TASK_CALENDAR = "TASK_CALENDAR"
+    CALENDAR_EVENT = "CALENDAR_EVENT"
 
 
 class CollectionServiceRegistry(str, Enum):
@@ -826,3 +858,15 @@ class ComponentStatusTypes(str, Enum):
     ACTIVE = "ACTIVE"
     INACTIVE = "INACTIVE"
     ALL = "ALL"
+
+
+class ImportJobTypes(str, Enum):
+    COURTS = "COURTS"
+    JUDGES = "JUDGES"
+
+
+class ImportJobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
@@ -4,18 +4,23 @@ import sys
 from http import HTTPStatus
 from typing import Type, Union
 
-import bcrypt
-from fastapi import HTTPException, Request
-from sqlalchemy.orm import Session
+from fastapi import BackgroundTasks, HTTPException, Request
+from sqlalchemy import Engine, select, update
+from sqlalchemy.orm import Session, joinedload
 
 from src.trackcase_service.db import models
-from src.trackcase_service.db.crud import CrudService, CrudServiceRaw, DataKeys
+from src.trackcase_service.db.crud import (
+    CrudService,
+    CrudServiceRaw,
+    DataKeys,
+    LoadingProfile,
+)
 from src.trackcase_service.service import schemas
 from src.trackcase_service.utils.cache import (
+    clear_app_permissions_cache,
+    clear_app_roles_cache,
     get_app_permissions_cache,
     get_app_roles_cache,
-    set_app_permissions_cache,
-    set_app_roles_cache,
 )
 from src.trackcase_service.utils.commons import (
     check_permissions,
@@ -36,6 +41,10 @@ from src.trackcase_service.utils.convert import (
 )
 from src.trackcase_service.utils.email import get_email_service
 from src.trackcase_service.utils.logger import Logger
+from src.trackcase_service.utils.password import (
+    PasswordHashOverloadError,
+    get_password_hash_executor,
+)
 
 log = Logger(logging.getLogger(__name__))
 
@@ -46,21 +55,32 @@ class AppUserPasswordService:
         self.user_name = user_name
 
     def login_user(
-        self, request: Request, db_session: Session
+        self,
+        request: Request,
+        db_session: Session,
+        background_tasks: BackgroundTasks = None,
     ) -> schemas.AppUserLoginResponse:
-        crud_service = CrudService(db_session, models.AppUser)
         app_user_data_models = []
         try:
-            read_response = crud_service.read(
-                filter_config=[
-                    schemas.FilterConfig(
-                        column="email",
-                        value=self.user_name.upper(),
-                        operation=schemas.FilterOperation.EQUAL_TO,
+            # user, status, roles and permissions in one statement
+            app_user_data_models = (
+                db_session.execute(
+                    select(models.AppUser)
+                    .options(
+                        joinedload(models.AppUser.component_status),
+                        joinedload(models.AppUser.app_roles).joinedload(
+                            models.AppRole.app_permissions
+                        ),
+                    )
+                    .where(
+                        models.AppUser.email == self.user_name.upper(),
+                        models.AppUser.is_deleted.is_(False),
                     )
-                ]
+                )
+                .unique()
+                .scalars()
+                .all()
             )
-            app_user_data_models = read_response.get(DataKeys.data)
         except Exception as ex:
             raise_http_exception(
                 request,
@@ -73,44 +93,33 @@ class AppUserPasswordService:
             app_user_data_model: models.AppUser = app_user_data_models[0]
 
             if app_user_data_model.is_validated:
-                is_login_success = self.verify_password(app_user_data_model.password)
+                is_login_success = self.verify_password(
+                    request, app_user_data_model.password
+                )
 
                 if is_login_success:
-                    try:
-                        # this should not prevent users from logging in
-                        app_user_data_model.last_login = datetime.datetime.now()
-                        crud_service.update(app_user_data_model.id, app_user_data_model)
-                    except Exception as ex:
-                        log.error(
-                            "Logging successful, but last_login not updated for email: [ {} ]".format(  # noqa: E501
-                                self.user_name
-                            ),
-                            extra=ex,
-                            exc_info=sys.exc_info(),
-                        )
+                    # recorded after the response is sent, when run by the api
+                    last_login = datetime.datetime.now()
+                    last_login_args = (
+                        db_session.get_bind(),
+                        app_user_data_model.id,
+                        last_login,
+                        self.user_name,
+                    )
+                    if background_tasks is None:
+                        _update_last_login(*last_login_args)
+                    else:
+                        background_tasks.add_task(_update_last_login, *last_login_args)
 
                     app_user_schema_model = convert_model_to_schema(
                         data_model=app_user_data_model,
                         schema_class=schemas.AppUser,
                     )
-
-                    role_ids = [
-                        app_role.id for app_role in app_user_schema_model.app_roles
-                    ]
-                    app_role_models = (
-                        CrudService(db_session, models.AppRole)
-                        .read(model_ids=role_ids)
-                        .get(DataKeys.data)
-                    )
-                    app_role_schemas = [
-                        convert_model_to_schema(
-                            data_model=app_role_model,
-                            schema_class=schemas.AppRole,
-                            exclusions=["app_users"],
-                        )
-                        for app_role_model in app_role_models
+                    app_user_schema_model.last_login = last_login
+                    app_user_schema_model.app_roles = [
+                        _convert_login_app_role(app_role_model)
+                        for app_role_model in app_user_data_model.app_roles
                     ]
-                    app_user_schema_model.app_roles = app_role_schemas
                     token_claim = encode_auth_credentials(app_user_schema_model)
                     return schemas.AppUserLoginResponse(
                         token=token_claim, app_user_details=app_user_schema_model
@@ -204,7 +213,7 @@ class AppUserPasswordService:
 
             if app_user_data_models and len(app_user_data_models) == 1:
                 app_user_data_model: models.AppUser = app_user_data_models[0]
-                app_user_data_model.password = self.hash_password()
+                app_user_data_model.password = self.hash_password(request)
                 crud_service.update(app_user_data_model.id, app_user_data_model)
             else:
                 raise_http_exception(
@@ -220,18 +229,64 @@ class AppUserPasswordService:
                 sys.exc_info(),
             )
 
-    def hash_password(self) -> str:
-        salt = bcrypt.gensalt(rounds=12)
-        encoded = self.plain_password.encode("utf-8")
-        return bcrypt.hashpw(encoded, salt).decode("utf-8")
+    def hash_password(self, request: Request) -> str:
+        try:
+            return get_password_hash_executor().hash_password(self.plain_password)
+        except PasswordHashOverloadError as ex:
+            raise_http_exception(request, HTTPStatus.SERVICE_UNAVAILABLE, str(ex))
+
+    def verify_password(self, request: Request, hashed_password: str) -> bool:
+        try:
+            return get_password_hash_executor().verify_password(
+                self.plain_password, hashed_password
+            )
+        except PasswordHashOverloadError as ex:
+            raise_http_exception(request, HTTPStatus.SERVICE_UNAVAILABLE, str(ex))
+
 
-    def verify_password(self, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            self.plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+# single update in its own session, this should not prevent users from logging in
+def _update_last_login(
+    bind: Engine, app_user_id: int, last_login: datetime.datetime, user_name: str
+):
+    try:
+        with Session(bind=bind) as db_session:
+            db_session.execute(
+                update(models.AppUser)
+                .where(models.AppUser.id == app_user_id)
+                .values(last_login=last_login)
+            )
+            db_session.commit()
+    except Exception as ex:
+        log.error(
+            "Logging successful, but last_login not updated for email: [ {} ]".format(
+                user_name
+            ),
+            extra=ex,
+            exc_info=sys.exc_info(),
         )
 
 
+# roles and permissions are already loaded, permissions without their roles
+def _convert_login_app_role(app_role_model: models.AppRole) -> schemas.AppRole:
+    app_role_schema = convert_model_to_schema(
+        data_model=app_role_model,
+        schema_class=schemas.AppRole,
+        exclusions=["app_users", "app_permissions"],
+    )
+    app_role_schema.app_permissions = [
+        convert_model_to_schema(
+            data_model=app_permission_model,
+            schema_class=schemas.AppPermission,
+            exclusions=["app_roles"],
+        )
+        for app_permission_model in app_role_model.app_permissions
+    ]
+    return app_role_schema
+
+
 class AppUserService(CrudService):
+    loading_profile = LoadingProfile(default=("component_status", "app_roles"))
+
     def __init__(self, db_session: Session):
         super(AppUserService, self).__init__(db_session, models.AppUser)
 
@@ -252,7 +307,7 @@ class AppUserService(CrudService):
             )
             data_model.password = get_user_password_service(
                 request_object.password
-            ).hash_password()
+            ).hash_password(request)
             data_model.is_validated = False
             data_model = self.create(data_model)
             schema_model = convert_model_to_schema(
@@ -307,6 +362,9 @@ class AppUserService(CrudService):
                     filter_config=metadata.filter_config,
                     page_number=metadata.page_number,
                     per_page=metadata.per_page,
+                    cursor=metadata.cursor,
+                    is_skip_count=metadata.is_skip_count,
+                    count_strategy=metadata.count_strategy,
                     is_include_soft_deleted=metadata.is_include_deleted,
                 )
                 return get_user_management_response(
@@ -362,7 +420,7 @@ class AppUserService(CrudService):
             if request_object.password:
                 data_model.password = get_user_password_service(
                     request_object.password
-                ).hash_password()
+                ).hash_password(request)
             data_model = self.update(model_id, data_model, is_restore)
             schema_model = convert_model_to_schema(
                 data_model=data_model,
@@ -402,6 +460,8 @@ class AppUserService(CrudService):
 
 
 class AppRoleService(CrudService):
+    loading_profile = LoadingProfile(default=("app_users", "app_permissions"))
+
     def __init__(self, db_session: Session):
         super(AppRoleService, self).__init__(db_session, models.AppRole)
 
@@ -409,12 +469,12 @@ class AppRoleService(CrudService):
     def create_app_role(
         self, request: Request, request_object: schemas.AppRoleRequest
     ) -> schemas.AppRoleResponse:
-        set_app_roles_cache([])
         try:
             data_model: models.AppRole = convert_schema_to_model(
                 request_object, models.AppRole
             )
             data_model = self.create(data_model)
+            clear_app_roles_cache()
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.AppRole,
@@ -452,6 +512,9 @@ class AppRoleService(CrudService):
                     filter_config=metadata.filter_config,
                     page_number=metadata.page_number,
                     per_page=metadata.per_page,
+                    cursor=metadata.cursor,
+                    is_skip_count=metadata.is_skip_count,
+                    count_strategy=metadata.count_strategy,
                     is_include_soft_deleted=metadata.is_include_deleted,
                 )
                 return get_user_management_response(
@@ -480,11 +543,8 @@ class AppRoleService(CrudService):
         self,
         request: Request,
     ) -> list[schemas.AppRole]:
-        app_roles = get_app_roles_cache()
-        if not app_roles:
-            app_roles = self.read_app_role(request).data or []
-            set_app_roles_cache(app_roles)
-        return app_roles
+        app_roles = get_app_roles_cache(lambda: self.read_app_role(request).data or [])
+        return list(app_roles)
 
     def check_app_role_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -508,7 +568,6 @@ class AppRoleService(CrudService):
         request_object: schemas.AppRoleRequest,
         is_restore: bool = False,
     ) -> schemas.AppRoleResponse:
-        set_app_roles_cache([])
         self.check_app_role_exists(model_id, request, is_restore)
 
         try:
@@ -516,6 +575,7 @@ class AppRoleService(CrudService):
                 request_object, models.AppRole
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_app_roles_cache()
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.AppRole,
@@ -536,11 +596,11 @@ class AppRoleService(CrudService):
     def delete_app_role(
         self, model_id: int, is_hard_delete: bool, request: Request
     ) -> schemas.AppRoleResponse:
-        set_app_roles_cache([])
         self.check_app_role_exists(model_id, request, is_hard_delete)
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_app_roles_cache()
             return schemas.AppRoleResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -555,6 +615,8 @@ class AppRoleService(CrudService):
 
 
 class AppPermissionService(CrudService):
+    loading_profile = LoadingProfile(default=("app_roles",))
+
     def __init__(self, db_session: Session):
         super(AppPermissionService, self).__init__(db_session, models.AppPermission)
 
@@ -562,12 +624,12 @@ class AppPermissionService(CrudService):
     def create_app_permission(
         self, request: Request, request_object: schemas.AppPermissionRequest
     ) -> schemas.AppPermissionResponse:
-        set_app_permissions_cache([])
         try:
             data_model: models.AppPermission = convert_schema_to_model(
                 request_object, models.AppPermission
             )
             data_model = self.create(data_model)
+            clear_app_permissions_cache()
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.AppPermission,
@@ -607,6 +669,9 @@ class AppPermissionService(CrudService):
                     filter_config=metadata.filter_config,
                     page_number=metadata.page_number,
                     per_page=metadata.per_page,
+                    cursor=metadata.cursor,
+                    is_skip_count=metadata.is_skip_count,
+                    count_strategy=metadata.count_strategy,
                     is_include_soft_deleted=metadata.is_include_deleted,
                 )
                 return get_user_management_response(
@@ -637,11 +702,10 @@ class AppPermissionService(CrudService):
         self,
         request: Request,
     ) -> list[schemas.AppPermission]:
-        app_permissions = get_app_permissions_cache()
-        if not app_permissions:
-            app_permissions = self.read_app_permission(request).data or []
-            set_app_permissions_cache(app_permissions)
-        return app_permissions
+        app_permissions = get_app_permissions_cache(
+            lambda: self.read_app_permission(request).data or []
+        )
+        return list(app_permissions)
 
     def check_app_permission_exists(
         self, model_id: int, request: Request, is_include_deleted: bool = False
@@ -672,6 +736,7 @@ class AppPermissionService(CrudService):
                 request_object, models.AppPermission
             )
             data_model = self.update(model_id, data_model, is_restore)
+            clear_app_permissions_cache()
             schema_model = convert_model_to_schema(
                 data_model=data_model,
                 schema_class=schemas.AppPermission,
@@ -696,6 +761,7 @@ class AppPermissionService(CrudService):
 
         try:
             self.delete(model_id, is_hard_delete)
+            clear_app_permissions_cache()
             return schemas.AppPermissionResponse(delete_count=1)
         except Exception as ex:
             raise_http_exception(
@@ -761,6 +827,9 @@ class AppUserRoleService(CrudService):
                     filter_config=metadata.filter_config,
                     page_number=metadata.page_number,
                     per_page=metadata.per_page,
+                    cursor=metadata.cursor,
+                    is_skip_count=metadata.is_skip_count,
+                    count_strategy=metadata.count_strategy,
                     is_include_soft_deleted=metadata.is_include_deleted,
                 )
                 return get_user_management_response(
@@ -909,6 +978,9 @@ class AppRolePermissionService(CrudService):
                     filter_config=metadata.filter_config,
                     page_number=metadata.page_number,
                     per_page=metadata.per_page,
+                    cursor=metadata.cursor,
+                    is_skip_count=metadata.is_skip_count,
+                    count_strategy=metadata.count_strategy,
                     is_include_soft_deleted=metadata.is_include_deleted,
                 )
                 return get_user_management_response(
@@ -1044,12 +1116,24 @@ class AppUserRolePermissionService(CrudServiceRaw):
                     else:
                         sql_query += " WHERE app_user_role.is_deleted = false"
 
-                sort_config = get_sort_config_raw(metadata.sort_config)
+                sort_config = get_sort_config_raw(
+                    metadata.sort_config, "app_user_role.id"
+                )
                 if sort_config:
                     sql_query += sort_config
 
+                page_number = metadata.page_number or page_number
+                per_page = metadata.per_page or per_page
+
             read_response = self.read(
-                schemas.AppUserRole, sql_query, page_number, per_page
+                schemas.AppUserRole,
+                sql_query,
+                page_number,
+                per_page,
+                sort_config=metadata.sort_config if metadata else None,
+                cursor=metadata.cursor if metadata else None,
+                is_skip_count=metadata.is_skip_count if metadata else False,
+                count_strategy=metadata.count_strategy if metadata else None,
             )
             return schemas.AppUserRoleResponse(
                 **{
@@ -1104,12 +1188,24 @@ class AppUserRolePermissionService(CrudServiceRaw):
                     else:
                         sql_query += " WHERE app_role_permission.is_deleted = false"
 
-                sort_config = get_sort_config_raw(metadata.sort_config)
+                sort_config = get_sort_config_raw(
+                    metadata.sort_config, "app_role_permission.id"
+                )
                 if sort_config:
                     sql_query += sort_config
 
+                page_number = metadata.page_number or page_number
+                per_page = metadata.per_page or per_page
+
             read_response = self.read(
-                schemas.AppRolePermission, sql_query, page_number, per_page
+                schemas.AppRolePermission,
+                sql_query,
+                page_number,
+                per_page,
+                sort_config=metadata.sort_config if metadata else None,
+                cursor=metadata.cursor if metadata else None,
+                is_skip_count=metadata.is_skip_count if metadata else False,
+                count_strategy=metadata.count_strategy if metadata else None,
             )
             return schemas.AppRolePermissionResponse(
                 **{
@@ -1,34 +1,295 @@
 # do not use lru-cache because the result differs per param
 # and `request` param will be different
 # this should suffice for now
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Awaitable, Callable
+
+import anyio
+from sqlalchemy import DateTime, String, text
+from sqlalchemy.exc import IntegrityError
+
+import src.trackcase_service.utils.logger as logger
 from src.trackcase_service.service import schemas
+from src.trackcase_service.utils.constants import (
+    AUTH_TOKEN_CACHE_MAX_SIZE,
+    CALENDAR_EVENTS_CACHE_MAX_SIZE,
+    CALENDAR_EVENTS_CACHE_TTL_SECONDS,
+    REF_TYPES_CACHE_TTL_SECONDS,
+    TOTAL_ITEMS_CACHE_TTL_SECONDS,
+)
+
+log = logger.Logger(logging.getLogger(__name__))
+
+RAW_SQL_CACHE_KEY = "raw_sql"
+
+
+# each process keeps its own cache, writes only clear this process's cache
+class LocalCacheBackend:
+    poll_interval_seconds = None
+
+    def get_versions(self) -> dict[str, int]:
+        return {}
+
+    def publish(self, key: str) -> int | None:
+        return None
+
+
+# writes bump the key's row in cache_version, every process polls that table
+# at most once per poll interval and clears the keys whose version changed
+class SharedCacheBackend:
+    def __init__(self, session_factory: Callable, poll_interval_seconds: int):
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+
+    def get_versions(self) -> dict[str, int]:
+        try:
+            with self.session_factory() as db_session:
+                result = db_session.execute(
+                    text("SELECT cache_key, version FROM cache_version")
+                )
+                return {cache_key: version for cache_key, version in result}
+        except Exception as ex:
+            log.error("Error Getting Cache Versions", extra=str(ex))
+            return {}
+
+    def publish(self, key: str) -> int | None:
+        cache_key = key.value if isinstance(key, Enum) else key
+        try:
+            with self.session_factory() as db_session:
+                version = self._update_version(db_session, cache_key)
+                if version is None:
+                    try:
+                        db_session.execute(
+                            text(
+                                "INSERT INTO cache_version (cache_key, version, modified) "  # noqa: E501
+                                "VALUES (:cache_key, 1, :modified)"
+                            ),
+                            {"cache_key": cache_key, "modified": datetime.now()},
+                        )
+                        version = 1
+                    except IntegrityError:
+                        # another process inserted the row first
+                        db_session.rollback()
+                        version = self._update_version(db_session, cache_key)
+                db_session.commit()
+                return version
+        except Exception as ex:
+            log.error("Error Publishing Cache Version", extra=str(ex))
+            return None
+
+    @staticmethod
+    def _update_version(db_session, cache_key: str) -> int | None:
+        return db_session.execute(
+            text(
+                "UPDATE cache_version SET version = version + 1, modified = :modified "
+                "WHERE cache_key = :cache_key RETURNING version"
+            ),
+            {"cache_key": cache_key, "modified": datetime.now()},
+        ).scalar()
+
+
+# ref types, app roles and app permissions are cached as immutable snapshots
+# writes bump the key's generation, so a refill started before a write is dropped
+# only one thread refills a key at a time, others wait and use its snapshot
+# async callers refill through an async loader under a per key asyncio lock
+# instead, so a refill never blocks the event loop on another thread's lock
+class RefTypeCache:
+    def __init__(self, ttl_seconds: int = None, backend=None):
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend or LocalCacheBackend()
+        self.remote_versions = {}
+        self.next_sync_at = 0
+        self.sync_lock = threading.Lock()
+        self.snapshots = {}
+        self.generations = {}
+        self.metrics = {}
+        self.indexes = {}
+        self.lock = threading.Lock()
+        self.refill_locks = {}
+        # asyncio locks belong to one event loop, so they are kept per loop
+        self.async_refill_locks = weakref.WeakKeyDictionary()
+
+    def get_generation(self, key: str) -> int:
+        return self.generations.get(key, 0)
+
+    # with the shared backend, includes writes made by other processes
+    def get_synced_generation(self, key: str) -> int:
+        self._sync()
+        return self.get_generation(key)
+
+    async def get_synced_generation_async(self, key: str) -> int:
+        await self._sync_async()
+        return self.get_generation(key)
+
+    def get(self, key: str, loader: Callable[[], list] = None) -> tuple:
+        self._sync()
+        snapshot = self._get_snapshot(key)
+        if snapshot is not None:
+            self._add_metric(key, "hits")
+            return snapshot
+        self._add_metric(key, "misses")
+        if loader is None:
+            return ()
+        with self._get_refill_lock(key):
+            # another thread may have refilled while this one waited
+            snapshot = self._get_snapshot(key)
+            if snapshot is not None:
+                return snapshot
+            generation = self.get_generation(key)
+            snapshot = tuple(loader())
+            self._add_metric(key, "refills")
+            self.set(key, snapshot, generation)
+            return snapshot
+
+    async def get_async(
+        self, key: str, loader: Callable[[], Awaitable[list]] = None
+    ) -> tuple:
+        await self._sync_async()
+        snapshot = self._get_snapshot(key)
+        if snapshot is not None:
+            self._add_metric(key, "hits")
+            return snapshot
+        self._add_metric(key, "misses")
+        if loader is None:
+            return ()
+        async with self._get_async_refill_lock(key):
+            # another request may have refilled while this one waited
+            snapshot = self._get_snapshot(key)
+            if snapshot is not None:
+                return snapshot
+            generation = self.get_generation(key)
+            snapshot = tuple(await loader())
+            self._add_metric(key, "refills")
+            self.set(key, snapshot, generation)
+            return snapshot
+
+    # index derived from the snapshot, built once per snapshot and reused
+    def get_index(
+        self,
+        key: str,
+        builder: Callable[[tuple], object],
+        loader: Callable[[], list] = None,
+    ):
+        return self._get_index(key, builder, self.get(key, loader))
+
+    async def get_index_async(
+        self,
+        key: str,
+        builder: Callable[[tuple], object],
+        loader: Callable[[], Awaitable[list]] = None,
+    ):
+        return self._get_index(key, builder, await self.get_async(key, loader))
+
+    def _get_index(self, key: str, builder: Callable[[tuple], object], snapshot):
+        index_entry = self.indexes.get(key)
+        if index_entry is not None and index_entry[0] is snapshot:
+            return index_entry[1]
+        index = builder(snapshot)
+        self.indexes[key] = (snapshot, index)
+        return index
+
+    def set(self, key: str, values: list | tuple, generation: int = None):
+        with self.lock:
+            if generation is None:
+                generation = self.get_generation(key)
+            elif generation != self.get_generation(key):
+                return
+            expires_at = (
+                time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+            )
+            self.snapshots[key] = (generation, expires_at, tuple(values))
+
+    def clear(self, key: str):
+        self._clear_local(key)
+        version = self.backend.publish(key)
+        if version is not None:
+            # this process is already cleared, so don't clear again on next sync
+            self.remote_versions[key] = version
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            return {key: dict(metrics) for key, metrics in self.metrics.items()}
 
-COMPONENT_STATUSES_CACHE = []
-COLLECTION_METHODS_CACHE = []
-CASE_TYPES_CACHE = []
-FILING_TYPES_CACHE = []
-HEARING_TYPES_CACHE = []
-TASK_TYPES_CACHE = []
-APP_ROLES_CACHE = []
-APP_PERMISSIONS_CACHE = []
-
-
-def get_ref_types_cache(ref_type: schemas.RefTypesServiceRegistry):
-    match ref_type:
-        case schemas.RefTypesServiceRegistry.COMPONENT_STATUS:
-            return COMPONENT_STATUSES_CACHE
-        case schemas.RefTypesServiceRegistry.COLLECTION_METHOD:
-            return COLLECTION_METHODS_CACHE
-        case schemas.RefTypesServiceRegistry.CASE_TYPE:
-            return CASE_TYPES_CACHE
-        case schemas.RefTypesServiceRegistry.FILING_TYPE:
-            return FILING_TYPES_CACHE
-        case schemas.RefTypesServiceRegistry.HEARING_TYPE:
-            return HEARING_TYPES_CACHE
-        case schemas.RefTypesServiceRegistry.TASK_TYPE:
-            return TASK_TYPES_CACHE
-        case _:
-            return []
+    def _clear_local(self, key: str):
+        with self.lock:
+            self.generations[key] = self.get_generation(key) + 1
+            self.snapshots.pop(key, None)
+
+    def _is_sync_due(self) -> bool:
+        return (
+            self.backend.poll_interval_seconds is not None
+            and time.monotonic() >= self.next_sync_at
+        )
+
+    def _sync(self):
+        if not self._is_sync_due():
+            return
+        # one thread syncs, the others use the current snapshots meanwhile
+        if not self.sync_lock.acquire(blocking=False):
+            return
+        try:
+            self.next_sync_at = time.monotonic() + self.backend.poll_interval_seconds
+            for key, version in self.backend.get_versions().items():
+                if self.remote_versions.get(key) != version:
+                    self.remote_versions[key] = version
+                    self._clear_local(key)
+        finally:
+            self.sync_lock.release()
+
+    # the poll is a blocking query, so it runs in a worker thread and only when due
+    async def _sync_async(self):
+        if self._is_sync_due():
+            await anyio.to_thread.run_sync(self._sync)
+
+    def _get_snapshot(self, key: str) -> tuple | None:
+        cache_entry = self.snapshots.get(key)
+        if cache_entry is None:
+            return None
+        generation, expires_at, snapshot = cache_entry
+        if generation != self.get_generation(key):
+            return None
+        if expires_at is not None and expires_at < time.monotonic():
+            return None
+        return snapshot
+
+    def _get_refill_lock(self, key: str) -> threading.Lock:
+        with self.lock:
+            return self.refill_locks.setdefault(key, threading.Lock())
+
+    def _get_async_refill_lock(self, key: str) -> asyncio.Lock:
+        with self.lock:
+            loop_refill_locks = self.async_refill_locks.setdefault(
+                asyncio.get_running_loop(), {}
+            )
+            return loop_refill_locks.setdefault(key, asyncio.Lock())
+
+    def _add_metric(self, key: str, metric: str):
+        with self.lock:
+            metrics = self.metrics.setdefault(
+                key, {"hits": 0, "misses": 0, "refills": 0}
+            )
+            metrics[metric] += 1
+
+
+REF_TYPES_CACHE = RefTypeCache(REF_TYPES_CACHE_TTL_SECONDS)
+
+
+def set_ref_types_cache_backend(backend: LocalCacheBackend | SharedCacheBackend):
+    REF_TYPES_CACHE.backend = backend
+
+
+def get_ref_types_cache(
+    ref_type: schemas.RefTypesServiceRegistry, loader: Callable[[], list] = None
+) -> tuple:
+    return REF_TYPES_CACHE.get(ref_type, loader)
 
 
 def set_ref_types_cache(
@@ -42,42 +303,315 @@ def set_ref_types_cache(
         | list[schemas.TaskType]
     ),
 ):
-    match ref_type:
-        case schemas.RefTypesServiceRegistry.COMPONENT_STATUS:
-            COMPONENT_STATUSES_CACHE.clear()
-            COMPONENT_STATUSES_CACHE.extend(ref_types)
-        case schemas.RefTypesServiceRegistry.COLLECTION_METHOD:
-            COLLECTION_METHODS_CACHE.clear()
-            COLLECTION_METHODS_CACHE.extend(ref_types)
-        case schemas.RefTypesServiceRegistry.CASE_TYPE:
-            CASE_TYPES_CACHE.clear()
-            CASE_TYPES_CACHE.extend(ref_types)
-        case schemas.RefTypesServiceRegistry.FILING_TYPE:
-            FILING_TYPES_CACHE.clear()
-            FILING_TYPES_CACHE.extend(ref_types)
-        case schemas.RefTypesServiceRegistry.HEARING_TYPE:
-            HEARING_TYPES_CACHE.clear()
-            HEARING_TYPES_CACHE.extend(ref_types)
-        case schemas.RefTypesServiceRegistry.TASK_TYPE:
-            TASK_TYPES_CACHE.clear()
-            TASK_TYPES_CACHE.extend(ref_types)
-        case _:
-            return []
-
-
-def get_app_roles_cache():
-    return APP_ROLES_CACHE
+    REF_TYPES_CACHE.set(ref_type, ref_types)
+
+
+def get_ref_types_index(
+    ref_type: schemas.RefTypesServiceRegistry,
+    builder: Callable[[tuple], object],
+    loader: Callable[[], list] = None,
+):
+    return REF_TYPES_CACHE.get_index(ref_type, builder, loader)
+
+
+async def get_ref_types_index_async(
+    ref_type: schemas.RefTypesServiceRegistry,
+    builder: Callable[[tuple], object],
+    loader: Callable[[], Awaitable[list]] = None,
+):
+    return await REF_TYPES_CACHE.get_index_async(ref_type, builder, loader)
+
+
+def clear_ref_types_cache(ref_type: schemas.RefTypesServiceRegistry):
+    REF_TYPES_CACHE.clear(ref_type)
+
+
+def get_app_roles_cache(loader: Callable[[], list] = None) -> tuple:
+    return REF_TYPES_CACHE.get(schemas.UserManagementServiceRegistry.APP_ROLE, loader)
 
 
 def set_app_roles_cache(app_roles: list[schemas.AppRole]):
-    APP_ROLES_CACHE.clear()
-    APP_ROLES_CACHE.extend(app_roles)
+    REF_TYPES_CACHE.set(schemas.UserManagementServiceRegistry.APP_ROLE, app_roles)
 
 
-def get_app_permissions_cache():
-    return APP_PERMISSIONS_CACHE
+def clear_app_roles_cache():
+    REF_TYPES_CACHE.clear(schemas.UserManagementServiceRegistry.APP_ROLE)
+
+
+def get_app_permissions_cache(loader: Callable[[], list] = None) -> tuple:
+    return REF_TYPES_CACHE.get(
+        schemas.UserManagementServiceRegistry.APP_PERMISSION, loader
+    )
 
 
 def set_app_permissions_cache(app_permissions: list[schemas.AppPermission]):
-    APP_PERMISSIONS_CACHE.clear()
-    APP_PERMISSIONS_CACHE.extend(app_permissions)
+    REF_TYPES_CACHE.set(
+        schemas.UserManagementServiceRegistry.APP_PERMISSION, app_permissions
+    )
+
+
+def clear_app_permissions_cache():
+    REF_TYPES_CACHE.clear(schemas.UserManagementServiceRegistry.APP_PERMISSION)
+
+
+# total items (count) cache for paginated reads, keyed by table and filter hash
+# entries expire after a ttl, and writes to a table clear that table's entries
+# generation per table guards against a count started before a write being set
+TOTAL_ITEMS_CACHE = {}
+TOTAL_ITEMS_CACHE_GENERATIONS = {}
+TOTAL_ITEMS_CACHE_LOCK = threading.Lock()
+
+
+def get_total_items_cache_generation(table_name: str) -> int:
+    return TOTAL_ITEMS_CACHE_GENERATIONS.get(table_name, 0)
+
+
+def get_total_items_cache(cache_key: tuple) -> int | None:
+    cache_entry = TOTAL_ITEMS_CACHE.get(cache_key)
+    if cache_entry is None:
+        return None
+    total_items, expires_at = cache_entry
+    if expires_at < time.monotonic():
+        TOTAL_ITEMS_CACHE.pop(cache_key, None)
+        return None
+    return total_items
+
+
+def set_total_items_cache(
+    cache_key: tuple, table_name: str, generation: int, total_items: int
+):
+    with TOTAL_ITEMS_CACHE_LOCK:
+        if generation == get_total_items_cache_generation(table_name):
+            TOTAL_ITEMS_CACHE[cache_key] = (
+                total_items,
+                time.monotonic() + TOTAL_ITEMS_CACHE_TTL_SECONDS,
+            )
+
+
+def clear_total_items_cache(table_name: str):
+    with TOTAL_ITEMS_CACHE_LOCK:
+        for generation_key in (table_name, RAW_SQL_CACHE_KEY):
+            TOTAL_ITEMS_CACHE_GENERATIONS[generation_key] = (
+                get_total_items_cache_generation(generation_key) + 1
+            )
+        for cache_key in list(TOTAL_ITEMS_CACHE.keys()):
+            # raw sql counts can span any table, so clear them on every write
+            if cache_key[0] in (table_name, RAW_SQL_CACHE_KEY):
+                TOTAL_ITEMS_CACHE.pop(cache_key, None)
+    if table_name in SHARED_GENERATION_TABLES:
+        REF_TYPES_CACHE.clear(_get_table_generation_key(table_name))
+
+
+# tables whose writes are published to every process through the ref types
+# cache backend (cache_version when shared), for caches read from them
+SHARED_GENERATION_TABLES = set()
+
+
+def share_table_generations(table_names: tuple[str, ...]):
+    SHARED_GENERATION_TABLES.update(table_names)
+
+
+# generations are bumped on every write to a shared table, in any process once
+# it has polled, so caches read from the tables can include them in their keys
+def get_table_generations(table_names: tuple[str, ...]) -> tuple[int, ...]:
+    return tuple(
+        REF_TYPES_CACHE.get_synced_generation(_get_table_generation_key(table_name))
+        for table_name in table_names
+    )
+
+
+async def get_table_generations_async(
+    table_names: tuple[str, ...],
+) -> tuple[int, ...]:
+    return tuple(
+        [
+            await REF_TYPES_CACHE.get_synced_generation_async(
+                _get_table_generation_key(table_name)
+            )
+            for table_name in table_names
+        ]
+    )
+
+
+def _get_table_generation_key(table_name: str) -> str:
+    return f"table_{table_name}"
+
+
+# calendar event rows per date window, keys include the generations of the
+# tables the rows are read from, so a write to any of them is a cache miss
+CALENDAR_EVENTS_CACHE = {}
+CALENDAR_EVENTS_CACHE_LOCK = threading.Lock()
+
+
+def get_calendar_events_cache(cache_key: tuple) -> list | None:
+    cache_entry = CALENDAR_EVENTS_CACHE.get(cache_key)
+    if cache_entry is None:
+        return None
+    calendar_event_rows, expires_at = cache_entry
+    if expires_at < time.monotonic():
+        CALENDAR_EVENTS_CACHE.pop(cache_key, None)
+        return None
+    return calendar_event_rows
+
+
+def set_calendar_events_cache(cache_key: tuple, calendar_event_rows: list):
+    with CALENDAR_EVENTS_CACHE_LOCK:
+        # entries of old generations are never hit again, drop the oldest ones
+        while len(CALENDAR_EVENTS_CACHE) >= CALENDAR_EVENTS_CACHE_MAX_SIZE:
+            CALENDAR_EVENTS_CACHE.pop(next(iter(CALENDAR_EVENTS_CACHE)), None)
+        CALENDAR_EVENTS_CACHE[cache_key] = (
+            calendar_event_rows,
+            time.monotonic() + CALENDAR_EVENTS_CACHE_TTL_SECONDS,
+        )
+
+
+# logouts are written to revoked_token, so every worker denies the token
+# each worker reads the unexpired ones at most once per poll interval
+class RevokedTokenBackend:
+    def __init__(self, session_factory: Callable, poll_interval_seconds: int):
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+
+    # raises, a logout must not look successful if other workers won't know
+    def revoke(self, digest: str, expires_at: float):
+        with self.session_factory() as db_session:
+            now = datetime.now()
+            # expired tokens are rejected by jwt anyway
+            db_session.execute(
+                text("DELETE FROM revoked_token WHERE expires <= :now"), {"now": now}
+            )
+            try:
+                db_session.execute(
+                    text(
+                        "INSERT INTO revoked_token (token_digest, expires, created) "
+                        "VALUES (:token_digest, :expires, :created)"
+                    ),
+                    {
+                        "token_digest": digest,
+                        "expires": datetime.fromtimestamp(expires_at),
+                        "created": now,
+                    },
+                )
+                db_session.commit()
+            except IntegrityError:
+                # already revoked
+                db_session.rollback()
+
+    def get_revoked(self) -> dict[str, float] | None:
+        try:
+            with self.session_factory() as db_session:
+                result = db_session.execute(
+                    text(
+                        "SELECT token_digest, expires FROM revoked_token "
+                        "WHERE expires > :now"
+                    ).columns(token_digest=String, expires=DateTime),
+                    {"now": datetime.now()},
+                )
+                return {
+                    token_digest: expires.timestamp()
+                    for token_digest, expires in result
+                }
+        except Exception as ex:
+            log.error("Error Getting Revoked Tokens", extra=str(ex))
+            return None
+
+
+# decoded auth token claims keyed by token digest, kept until the token's exp
+# least recently used entries are dropped once the cache is full
+# revoked tokens are denied until their exp, cached or not
+class AuthTokenCache:
+    def __init__(self, max_size: int, backend: RevokedTokenBackend = None):
+        self.max_size = max_size
+        self.backend = backend
+        self.next_sync_at = 0
+        self.sync_lock = threading.Lock()
+        self.entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self.denied: dict[str, float] = {}
+        self.metrics = {"hits": 0, "misses": 0}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def set_backend(self, backend: RevokedTokenBackend | None):
+        with self.lock:
+            self.backend = backend
+            self.next_sync_at = 0
+
+    def get(self, digest: str) -> dict | None:
+        with self.lock:
+            cache_entry = self.entries.get(digest)
+            if cache_entry is None or cache_entry[1] <= time.time():
+                self.entries.pop(digest, None)
+                self.metrics["misses"] += 1
+                return None
+            self.entries.move_to_end(digest)
+            self.metrics["hits"] += 1
+            return cache_entry[0]
+
+    def set(self, digest: str, app_user_token: dict, expires_at: float):
+        with self.lock:
+            if digest in self.denied:
+                return
+            self.entries[digest] = (app_user_token, expires_at)
+            self.entries.move_to_end(digest)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    # denied here right away, by the other workers after their next poll
+    def revoke(self, digest: str, expires_at: float):
+        if self.backend is not None:
+            self.backend.revoke(digest, expires_at)
+        self.deny({digest: expires_at})
+
+    def deny(self, denied: dict[str, float]):
+        with self.lock:
+            now = time.time()
+            for denied_digest, denied_until in list(self.denied.items()):
+                if denied_until <= now:
+                    self.denied.pop(denied_digest, None)
+            self.denied.update(denied)
+            for digest in denied:
+                self.entries.pop(digest, None)
+
+    def is_denied(self, digest: str) -> bool:
+        self._sync()
+        denied_until = self.denied.get(digest)
+        return denied_until is not None and denied_until > time.time()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.denied.clear()
+            self.next_sync_at = 0
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            return {
+                **self.metrics,
+                "size": len(self.entries),
+                "denied": len(self.denied),
+            }
+
+    def _sync(self):
+        backend = self.backend
+        if backend is None or time.monotonic() < self.next_sync_at:
+            return
+        # one thread polls, the others go on with the deny list they have
+        if not self.sync_lock.acquire(blocking=False):
+            return
+        try:
+            self.next_sync_at = time.monotonic() + backend.poll_interval_seconds
+            revoked = backend.get_revoked()
+            if revoked:
+                self.deny(revoked)
+        finally:
+            self.sync_lock.release()
+
+
+AUTH_TOKEN_CACHE = AuthTokenCache(AUTH_TOKEN_CACHE_MAX_SIZE)
+
+
+def get_auth_token_cache() -> AuthTokenCache:
+    return AUTH_TOKEN_CACHE
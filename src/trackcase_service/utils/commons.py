@@ -1,15 +1,19 @@
 import datetime
 import http
+import inspect
 import json
 import logging
 import os
+import secrets
 import sys
+import time
 from functools import wraps
 from typing import List, Optional
 
+import anyio
 import jwt
 from fastapi import HTTPException, Query, Request
-from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBasicCredentials
 from jwt import PyJWTError
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
@@ -18,7 +22,13 @@ import src.trackcase_service.service.schemas as schemas
 import src.trackcase_service.utils.constants as constants
 import src.trackcase_service.utils.logger as logger
 from src.trackcase_service.db.crud import DataKeys
-from src.trackcase_service.db.session import SessionLocal
+from src.trackcase_service.db.session import SessionLocal, async_engine, engine
+from src.trackcase_service.utils.cache import (
+    RevokedTokenBackend,
+    SharedCacheBackend,
+    get_auth_token_cache,
+    set_ref_types_cache_backend,
+)
 
 log = logger.Logger(logging.getLogger(__name__))
 
@@ -62,13 +72,44 @@ def validate_input():
 
 
 async def startup_app():
+    logger.get_logging_backend().start()
     log.info("App Starting...")
+    # sync endpoints each hold a thread while they wait on the database
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        constants.THREADPOOL_SIZE
+    )
     # initialize caches
+    if constants.REF_TYPES_CACHE_BACKEND == "shared":
+        set_ref_types_cache_backend(
+            SharedCacheBackend(SessionLocal, constants.REF_TYPES_CACHE_POLL_SECONDS)
+        )
+    get_auth_token_cache().set_backend(
+        RevokedTokenBackend(SessionLocal, constants.AUTH_REVOKED_TOKENS_POLL_SECONDS)
+    )
     await initialize_caches()
+    if constants.HISTORY_WRITE_BEHIND:
+        from src.trackcase_service.service.history_service import get_history_writer
 
+        get_history_writer().start()
+
+
+async def shutdown_app():
+    from src.trackcase_service.service.data_import import get_import_job_runner
+    from src.trackcase_service.service.history_service import get_history_writer
+    from src.trackcase_service.utils.email import get_email_sender
+    from src.trackcase_service.utils.password import get_password_hash_executor
 
-def shutdown_app():
     log.info("App Shutting Down...")
+    get_import_job_runner().shutdown()
+    get_password_hash_executor().shutdown()
+    # queued emails are sent before the app exits
+    get_email_sender().shutdown()
+    # queued history and the outbox are written before the engines are disposed
+    get_history_writer().shutdown()
+    engine.dispose()
+    await async_engine.dispose()
+    # last, so the shutdown logs above are written too
+    logger.get_logging_backend().stop()
 
 
 async def initialize_caches():
@@ -113,14 +154,10 @@ async def initialize_caches():
 
 # def reset_caches():
 #     from src.trackcase_service.utils import cache
-#     cache.COMPONENT_STATUSES_CACHE.clear()
-#     cache.COLLECTION_METHODS_CACHE.clear()
-#     cache.CASE_TYPES_CACHE.clear()
-#     cache.FILING_TYPES_CACHE.clear()
-#     cache.HEARING_TYPES_CACHE.clear()
-#     cache.TASK_TYPES_CACHE.clear()
-#     cache.APP_ROLES_CACHE.clear()
-#     cache.APP_PERMISSIONS_CACHE.clear()
+#     for ref_type in schemas.RefTypesServiceRegistry:
+#         cache.clear_ref_types_cache(ref_type)
+#     cache.clear_app_roles_cache()
+#     cache.clear_app_permissions_cache()
 
 
 def get_err_msg(msg: str, err_msg: str = ""):
@@ -133,6 +170,7 @@ def get_auth_user_token(request: Request) -> dict:
 
 def set_auth_user_token(request: Request, app_user_token: dict):
     request.state.user_details = app_user_token
+    request.state.user_permissions = None
 
 
 def raise_http_exception(
@@ -170,6 +208,9 @@ def request_metadata_example() -> str:
     ],
     "page_number": 1,
     "per_page": 100,
+    "cursor": "next_cursor from previous page, seeks instead of page_number",
+    "is_skip_count": false,
+    "count_strategy": "EXACT | ESTIMATED | CACHED",
     "is_include_deleted": false,
     "is_include_extra": false,
     "is_include_history": false
@@ -196,6 +237,19 @@ def parse_request_metadata(
         )
 
 
+def validate_basic_credentials(http_basic_credentials: HTTPBasicCredentials) -> bool:
+    # both compared, in constant time
+    is_username_valid = secrets.compare_digest(
+        http_basic_credentials.username.encode("utf-8"),
+        str(constants.BASIC_AUTH_USR).encode("utf-8"),
+    )
+    is_password_valid = secrets.compare_digest(
+        http_basic_credentials.password.encode("utf-8"),
+        str(constants.BASIC_AUTH_PWD).encode("utf-8"),
+    )
+    return is_username_valid and is_password_valid
+
+
 def encode_auth_credentials(app_user: schemas.AppUser):
     token_claim = {
         "app_user_token": app_user.to_token(),
@@ -246,6 +300,20 @@ def decode_auth_credentials(
     request: Request,
     http_auth_credentials: HTTPAuthorizationCredentials,
 ):
+    # verified tokens are cached until exp, a cache hit skips the hmac and parse
+    auth_token_cache = get_auth_token_cache()
+    digest = auth_token_cache.get_digest(http_auth_credentials.credentials)
+    if auth_token_cache.is_denied(digest):
+        raise_http_exception(
+            request,
+            http.HTTPStatus.UNAUTHORIZED,
+            error="Revoked Credentials",
+        )
+    app_user_token = auth_token_cache.get(digest)
+    if app_user_token:
+        set_auth_user_token(request, app_user_token)
+        return
+
     try:
         token_claims = jwt.decode(
             jwt=http_auth_credentials.credentials,
@@ -256,6 +324,8 @@ def decode_auth_credentials(
         app_user_token = token_claims.get("app_user_token")
 
         if app_user_token:
+            if token_claims.get("exp"):
+                auth_token_cache.set(digest, app_user_token, token_claims.get("exp"))
             set_auth_user_token(request, app_user_token)
         else:
             raise_http_exception(
@@ -272,32 +342,85 @@ def decode_auth_credentials(
         )
 
 
-def has_permission(permission_name: str, request: Request):
+# denied until the token's exp, an expired token is rejected by jwt anyway
+def revoke_auth_credentials(
+    request: Request, http_auth_credentials: HTTPAuthorizationCredentials
+):
+    try:
+        token_claims = jwt.decode(
+            jwt=http_auth_credentials.credentials,
+            key=constants.SECRET_KEY,
+            algorithms=["HS256"],
+        )
+    except PyJWTError as ex:
+        log.info("Revoke Skipped, Invalid Credentials", extra=str(ex))
+        return
+    auth_token_cache = get_auth_token_cache()
+    try:
+        auth_token_cache.revoke(
+            auth_token_cache.get_digest(http_auth_credentials.credentials),
+            token_claims.get("exp") or time.time() + 24 * 60 * 60,
+        )
+    except Exception as ex:
+        raise_http_exception(
+            request,
+            http.HTTPStatus.INTERNAL_SERVER_ERROR,
+            get_err_msg("Error Revoking Credentials. Please Try Again!!!", str(ex)),
+            exc_info=sys.exc_info(),
+        )
+
+
+# (is superuser, permission names) of the token, compiled once per request
+def get_user_permissions(request: Request) -> tuple[bool, frozenset[str]] | None:
+    user_permissions = getattr(request.state, "user_permissions", None)
+    if user_permissions is not None:
+        return user_permissions
     user_details = getattr(request.state, "user_details", None)
     if user_details is None:
-        return False
+        return None
 
+    is_superuser = False
+    permission_names = set()
     for role in user_details.get("roles", []):
         if role.get("name") == "SUPERUSER":
-            return True
-        else:
-            permissions = role.get("permissions", [])
-            for permission in permissions:
-                if permission.get("name") == permission_name:
-                    return True
+            is_superuser = True
+        for permission in role.get("permissions", []):
+            permission_names.add(permission.get("name"))
+    user_permissions = (is_superuser, frozenset(permission_names))
+    request.state.user_permissions = user_permissions
+    return user_permissions
 
-    return False
+
+def has_permission(permission_name: str, request: Request):
+    user_permissions = get_user_permissions(request)
+    if user_permissions is None:
+        return False
+    is_superuser, permission_names = user_permissions
+    return is_superuser or permission_name in permission_names
+
+
+# position in args (after self) and name of the request parameter
+def _get_request_parameter(func) -> tuple[int | None, str | None]:
+    parameters = list(inspect.signature(func).parameters.values())[1:]
+    for position, parameter in enumerate(parameters):
+        if parameter.annotation is Request or parameter.name == "request":
+            return position, parameter.name
+    return None, None
 
 
 def check_permissions(permission_name: str):
     def decorator(func):
+        # resolved once here instead of scanning args on every call
+        request_position, request_name = _get_request_parameter(func)
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            request = None
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                    break
+            if request_position is not None and request_position < len(args):
+                request = args[request_position]
+            else:
+                request = kwargs.get(request_name) if request_name else None
+            if not isinstance(request, Request):
+                request = next((arg for arg in args if isinstance(arg, Request)), None)
             if not request:
                 raise_http_exception(
                     request=Request(scope={"type": "http"}),
@@ -325,6 +448,31 @@ def read_file(file_name):
     return content
 
 
+# read arguments by id or paginated, None reads the first page with defaults
+def get_read_kwargs(request_metadata: schemas.RequestMetadata = None) -> dict:
+    if request_metadata is None:
+        return {}
+    if request_metadata.schema_model_id:
+        return {
+            "model_id": request_metadata.schema_model_id,
+            "is_include_extra": request_metadata.is_include_extra,
+            "is_include_history": request_metadata.is_include_history,
+            "is_include_soft_deleted": request_metadata.is_include_deleted,
+        }
+    return {
+        "sort_config": request_metadata.sort_config,
+        "filter_config": request_metadata.filter_config,
+        "page_number": request_metadata.page_number,
+        "per_page": request_metadata.per_page,
+        "cursor": request_metadata.cursor,
+        "is_skip_count": request_metadata.is_skip_count,
+        "count_strategy": request_metadata.count_strategy,
+        "is_include_extra": request_metadata.is_include_extra,
+        "is_include_history": request_metadata.is_include_history,
+        "is_include_soft_deleted": request_metadata.is_include_deleted is True,
+    }
+
+
 def get_read_response_data_metadata(read_response):
     if read_response:
         return read_response.get(DataKeys.data) or [], read_response.get(
@@ -333,22 +481,30 @@ def get_read_response_data_metadata(read_response):
     return [], None
 
 
-def check_active_component_status(components: list, active_statuses: list[int]) -> bool:
+def check_active_component_status(
+    components: list, active_statuses: frozenset[int]
+) -> bool:
     for component in components:
         if component.component_status_id in active_statuses:
             return True
     return False
 
 
-def get_sort_config_raw(sort_config: schemas.SortConfig = None) -> str:
+def get_sort_config_raw(
+    sort_config: schemas.SortConfig = None, id_column: str = None
+) -> str:
+    # id_column breaks ties, so that pages match the cursor seek order
     if sort_config and sort_config.column and sort_config.direction:
         sort_table = sort_config.table
         sort_column = sort_config.column
         sort_direction = sort_config.direction.value
+        id_order_by = f", {id_column} {sort_direction}" if id_column else ""
         if sort_table:
-            return f" ORDER BY {sort_table}.{sort_column} {sort_direction}"
+            return f" ORDER BY {sort_table}.{sort_column} {sort_direction}{id_order_by}"
         else:
-            return f" ORDER BY {sort_column} {sort_direction}"
+            return f" ORDER BY {sort_column} {sort_direction}{id_order_by}"
+    elif id_column:
+        return f" ORDER BY {id_column} ASC"
     return ""
 
 
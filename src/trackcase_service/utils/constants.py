@@ -1,5 +1,6 @@
 import os
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,6 +16,41 @@ HEARING_TO_TASK_CALENDAR_DATE: dict[str, int] = {
     "MASTER": 30,
     "MERIT": 15,
 }
+# estimated counts below this are re-counted exactly, cheap for small tables
+ESTIMATED_COUNT_EXACT_THRESHOLD = 10000
+TOTAL_ITEMS_CACHE_TTL_SECONDS = 300
+REF_TYPES_CACHE_TTL_SECONDS = 3600
+# shared ref types cache checks the cache_version table at most this often
+REF_TYPES_CACHE_POLL_SECONDS = 5
+CALENDAR_EVENTS_CACHE_TTL_SECONDS = 300
+CALENDAR_EVENTS_CACHE_MAX_SIZE = 100
+SCRAPE_TIMEOUT_SECONDS = 30
+# import jobs run in the background, finished ones kept for status and downloads
+IMPORT_JOBS_MAX_WORKERS = 2
+IMPORT_JOBS_MAX_KEPT = 20
+# pending jobs left by a stopped worker are failed after this, so imports can run
+IMPORT_JOBS_STALE_SECONDS = 3600
+# decoded bearer tokens kept until exp, per process
+AUTH_TOKEN_CACHE_MAX_SIZE = 10000
+# logouts in other workers are denied here after at most this long
+AUTH_REVOKED_TOKENS_POLL_SECONDS = 5
+# bcrypt cost, about 250ms per hash or verify
+PASSWORD_HASH_ROUNDS = 12
+# password hashes waiting for a worker process, more are rejected with 503
+PASSWORD_HASH_MAX_PENDING = 16
+# outbound emails, queued and sent in batches (mailjet allows 50 per call)
+MJ_SEND_URL = "https://api.mailjet.com/v3.1/send"
+EMAIL_QUEUE_MAX_SIZE = 1000
+EMAIL_BATCH_SIZE = 50
+EMAIL_MAX_RETRIES = 3
+EMAIL_RETRY_BACKOFF_SECONDS = 1
+EMAIL_TIMEOUT_SECONDS = 10
+# write behind history, committed records are queued and batch inserted by a worker
+# the outbox row committed with the entity is replayed if the queue does not write it
+HISTORY_QUEUE_MAX_SIZE = 10000
+HISTORY_BATCH_SIZE = 500
+HISTORY_FLUSH_SECONDS = 1
+HISTORY_OUTBOX_REPLAY_SECONDS = 60
 TRACKCASE_UI_HOME_PROD = "https://trackcase.appspot.com"
 TRACKCASE_UI_HOME_DEV = "http://10.0.0.73:9191"
 
@@ -26,6 +62,25 @@ class Settings(BaseSettings):
     else:
         model_config = SettingsConfigDict(env_file=".env", extra="allow")
 
+    # connection pool, per engine and per worker process
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # threads running sync endpoints, per worker process
+    threadpool_size: int = 40
+    # password hash worker processes, defaults to cpu count (at most 4), 0 inline
+    password_hash_max_workers: int | None = None
+    # DEBUG, INFO or ERROR, can be changed at runtime
+    log_level: str = "INFO"
+    # share of requests written to the access log, errors are always written
+    access_log_sample_rate: float = 1.0
+    # history inserted after the request instead of in its transaction
+    history_write_behind: bool = False
+    # local: per process ref types cache, shared: invalidated across workers
+    ref_types_cache_backend: Literal["local", "shared"] = "local"
+
 
 @lru_cache()
 def get_settings():
@@ -38,9 +93,26 @@ BASIC_AUTH_PWD = get_settings().basic_auth_pwd
 DB_USERNAME = get_settings().db_username
 DB_PASSWORD = get_settings().db_password
 DB_NAME = get_settings().db_name
+DB_POOL_SIZE = get_settings().db_pool_size
+DB_MAX_OVERFLOW = get_settings().db_max_overflow
+DB_POOL_TIMEOUT = get_settings().db_pool_timeout
+DB_POOL_RECYCLE = get_settings().db_pool_recycle
+DB_POOL_PRE_PING = get_settings().db_pool_pre_ping
+THREADPOOL_SIZE = get_settings().threadpool_size
+LOG_LEVEL = get_settings().log_level
+ACCESS_LOG_SAMPLE_RATE = get_settings().access_log_sample_rate
+PASSWORD_HASH_MAX_WORKERS = get_settings().password_hash_max_workers
+HISTORY_WRITE_BEHIND = get_settings().history_write_behind
 REPO_HOME = get_settings().repo_home
 SECRET_KEY = get_settings().secret_key
 CORS_ORIGINS = get_settings().cors_origins
 MJ_PUBLIC = get_settings().mj_public
 MJ_PRIVATE = get_settings().mj_private
 MJ_EMAIL = get_settings().mj_email
+# etag, last modified and content hash per scraped url
+SCRAPE_CACHE_DIR = (
+    REPO_HOME + "/cache/trackcase-service/scrape"
+    if REPO_HOME is not None and str(REPO_HOME).strip() != ""
+    else None
+)
+REF_TYPES_CACHE_BACKEND = get_settings().ref_types_cache_backend
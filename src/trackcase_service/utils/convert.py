@@ -1,7 +1,10 @@
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
+from pydantic import BaseModel, TypeAdapter
 from pydantic.fields import FieldInfo
+from sqlalchemy import inspect
 
 
 def _get_default_value(field: FieldInfo):
@@ -22,17 +25,54 @@ def _get_default_value(field: FieldInfo):
     return field.default
 
 
+@lru_cache(maxsize=None)
+def _get_schema_fields(destination_class) -> tuple:
+    fields = destination_class.model_fields
+    required_fields = tuple(
+        (name, field) for name, field in fields.items() if field.is_required()
+    )
+    return required_fields, frozenset(fields.keys())
+
+
 # this is required because Pydantic doesn't allow creating empty instance
 # so create an instance with default empty values according to type
+# defaults are valid by construction, so skip validating them for every row
 def create_default_schema_instance(destination_class):
-    fields = destination_class.__fields__
-    required_fields = {
-        name: _get_default_value(field) for name, field in fields.items()
+    required_fields, field_names = _get_schema_fields(destination_class)
+    required_values = {
+        name: _get_default_value(field) for name, field in required_fields
     }
-    destination_object = destination_class(**required_fields)
+    destination_object = destination_class.model_construct(
+        _fields_set=set(field_names), **required_values
+    )
     return destination_object
 
 
+def _get_attribute_names(object_class) -> frozenset | None:
+    if isinstance(object_class, type) and issubclass(object_class, BaseModel):
+        return frozenset(object_class.model_fields.keys())
+    if hasattr(object_class, "__mapper__"):
+        return frozenset(inspect(object_class).attrs.keys())
+    return None
+
+
+# common attributes computed once per (source, destination, exclusions)
+# instead of dir() on both objects for every row
+@lru_cache(maxsize=None)
+def _get_common_attributes(
+    source_class, destination_class, exclusions: frozenset
+) -> tuple | None:
+    source_attributes = _get_attribute_names(source_class)
+    destination_attributes = _get_attribute_names(destination_class)
+    if source_attributes is None or destination_attributes is None:
+        return None
+    return tuple(
+        attr
+        for attr in source_attributes & destination_attributes
+        if not attr.startswith("_") and attr not in exclusions
+    )
+
+
 def _copy_objects(
     source_object,
     destination_class,
@@ -46,15 +86,20 @@ def _copy_objects(
         return None
     if destination_object is None:
         destination_object = create_default_schema_instance(destination_class)
-    common_attributes = set(dir(source_object)) & set(dir(destination_object))
+    common_attributes = _get_common_attributes(
+        type(source_object), type(destination_object), frozenset(exclusions)
+    )
+    if common_attributes is None:
+        common_attributes = [
+            attr
+            for attr in set(dir(source_object)) & set(dir(destination_object))
+            if not attr.startswith("_") and attr not in exclusions
+        ]
     for attr in common_attributes:
-        if (
-            not callable(getattr(source_object, attr))
-            and not attr.startswith("_")
-            and attr not in exclusions
-            and (is_copy_all or not getattr(destination_object, attr))
+        value = getattr(source_object, attr)
+        if not callable(value) and (
+            is_copy_all or not getattr(destination_object, attr)
         ):
-            value = getattr(source_object, attr)
             if value and isinstance(value, str):
                 setattr(destination_object, attr, value.strip().upper())
             elif isinstance(value, bool) and value is not None:
@@ -112,3 +157,26 @@ def convert_data_model_to_schema(data_model, schema_class, exclusions=None):
     return _copy_objects(
         data_model, schema_class, is_copy_all=True, exclusions=exclusions
     )
+
+
+@lru_cache(maxsize=None)
+def _get_schema_list_adapter(schema_class) -> TypeAdapter:
+    return TypeAdapter(list[schema_class])
+
+
+# raw sql rows are converted in one pass, columns not in schema are ignored
+# rows are trusted db values, so only validate them when asked to
+def convert_raw_data_to_schema(data: list[dict], schema_class, is_validate=False):
+    if is_validate:
+        return _get_schema_list_adapter(schema_class).validate_python(data)
+    required_fields, field_names = _get_schema_fields(schema_class)
+    data_schemas = []
+    for row in data:
+        values = {name: _get_default_value(field) for name, field in required_fields}
+        values.update(
+            {column: value for column, value in row.items() if column in field_names}
+        )
+        data_schemas.append(
+            schema_class.model_construct(_fields_set=set(field_names), **values)
+        )
+    return data_schemas
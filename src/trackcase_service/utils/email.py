@@ -1,50 +1,182 @@
+import logging
+import queue
+import threading
+import time
+from functools import lru_cache
 from http import HTTPStatus
 
+import requests
 from fastapi import Request
-from mailjet_rest import Client
 
+from src.trackcase_service.utils import logger
 from src.trackcase_service.utils.commons import (
     encode_email_address,
     raise_http_exception,
     read_file,
 )
-from src.trackcase_service.utils.constants import MJ_EMAIL, MJ_PRIVATE, MJ_PUBLIC
+from src.trackcase_service.utils.constants import (
+    EMAIL_BATCH_SIZE,
+    EMAIL_MAX_RETRIES,
+    EMAIL_QUEUE_MAX_SIZE,
+    EMAIL_RETRY_BACKOFF_SECONDS,
+    EMAIL_TIMEOUT_SECONDS,
+    MJ_EMAIL,
+    MJ_PRIVATE,
+    MJ_PUBLIC,
+    MJ_SEND_URL,
+)
+
+log = logger.Logger(logging.getLogger(__name__))
+
+
+# read from disk once, the templates do not change while the app runs
+@lru_cache(maxsize=None)
+def get_email_template(file_name: str) -> str:
+    return read_file(file_name)
+
+
+# messages are sent by a background thread, the request only queues them
+# each send posts what is queued (up to batch size) as one Messages call
+# failed sends are retried with exponential backoff, except client errors
+class EmailSender:
+    def __init__(
+        self,
+        send_url: str,
+        auth: tuple[str, str],
+        max_queue_size: int,
+        batch_size: int,
+        max_retries: int,
+        retry_backoff_seconds: float,
+        timeout_seconds: float,
+    ):
+        self.send_url = send_url
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.timeout_seconds = timeout_seconds
+        # long lived, connections are reused across sends
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+        self.lock = threading.Lock()
+        self.metrics = {"sent": 0, "failed": 0, "retried": 0, "batches": 0}
+
+    def enqueue(self, message: dict) -> bool:
+        self._start()
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except queue.Full:
+            return False
+
+    def flush(self):
+        batch = self._drain([])
+        while batch:
+            self._send(batch)
+            batch = self._drain([])
+
+    def shutdown(self):
+        self.stop_event.set()
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread:
+            thread.join(timeout=self.timeout_seconds)
+        self.flush()
+        self.session.close()
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            return {**self.metrics, "queued": self.queue.qsize()}
+
+    def _start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.stop_event.clear()
+            self.thread = threading.Thread(
+                target=self._run, name="email-sender", daemon=True
+            )
+            self.thread.start()
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                message = self.queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            self._send(self._drain([message]))
+
+    def _drain(self, batch: list[dict]) -> list[dict]:
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _send(self, batch: list[dict]):
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self._add_metric("retried", 1)
+                time.sleep(self.retry_backoff_seconds * 2 ** (attempt - 1))
+            try:
+                response = self.session.post(
+                    self.send_url,
+                    json={"Messages": batch},
+                    timeout=self.timeout_seconds,
+                )
+            except requests.RequestException as ex:
+                log.error("Error Sending Emails...", extra=str(ex))
+                continue
+            if response.status_code == HTTPStatus.OK:
+                self._add_metric("sent", len(batch))
+                self._add_metric("batches", 1)
+                return
+            log.error(
+                f"Error Sending Emails, Status: [ {response.status_code} ]",
+                extra=response.text,
+            )
+            # bad messages stay bad, only rate limits and server errors are retried
+            if (
+                response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+                and response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+            ):
+                break
+        self._add_metric("failed", len(batch))
+
+    def _add_metric(self, metric: str, count: int):
+        with self.lock:
+            self.metrics[metric] += count
 
 
 class Email:
-    def __init__(self):
-        self.api_key = MJ_PUBLIC
-        self.api_secret = MJ_PRIVATE
+    def __init__(self, email_sender: EmailSender):
         self.api_email = MJ_EMAIL
-
-        self.mailjet = Client(auth=(self.api_key, self.api_secret), version="v3.1")
+        self.email_sender = email_sender
 
     def app_user_validation_email(self, request: Request, user_name: str):
-        email_html_content = read_file("email_validate_user.html")
+        email_html_content = get_email_template("email_validate_user.html")
         activation_link = "{}users/na/app_users/validate_exit/?to_validate={}".format(
             request.base_url, encode_email_address(user_name, 15)
         )
         email_html_content = email_html_content.format(activation_link=activation_link)
-        data = {
-            "Messages": [
+        message = {
+            "From": {
+                "Email": self.api_email,
+                "Name": f"[TrackCase Service] {self.api_email}",
+            },
+            "To": [
                 {
-                    "From": {
-                        "Email": self.api_email,
-                        "Name": f"[TrackCase Service] {self.api_email}",
-                    },
-                    "To": [
-                        {
-                            "Email": user_name,
-                            "Name": f"[TrackCase Service] {user_name}",
-                        }
-                    ],
-                    "Subject": "TrackCase Service (Activate)",
-                    "HTMLPart": email_html_content,
+                    "Email": user_name,
+                    "Name": f"[TrackCase Service] {user_name}",
                 }
-            ]
+            ],
+            "Subject": "TrackCase Service (Activate)",
+            "HTMLPart": email_html_content,
         }
-        result = self.mailjet.send.create(data=data)
-        if result.status_code != HTTPStatus.OK:
+        if not self.email_sender.enqueue(message):
             raise_http_exception(
                 request=request,
                 sts_code=HTTPStatus.UNPROCESSABLE_ENTITY,
@@ -52,31 +184,26 @@ class Email:
             )
 
     def app_user_reset_email(self, request: Request, user_name: str):
-        email_html_content = read_file("email_reset_user.html")
+        email_html_content = get_email_template("email_reset_user.html")
         reset_link = "{}users/na/app_users/reset_mid/?to_reset={}".format(
             request.base_url, encode_email_address(user_name, 15)
         )
         email_html_content = email_html_content.format(reset_link=reset_link)
-        data = {
-            "Messages": [
+        message = {
+            "From": {
+                "Email": self.api_email,
+                "Name": f"TrackCase Service {self.api_email}",
+            },
+            "To": [
                 {
-                    "From": {
-                        "Email": self.api_email,
-                        "Name": f"TrackCase Service {self.api_email}",
-                    },
-                    "To": [
-                        {
-                            "Email": user_name,
-                            "Name": f"TrackCase Service {user_name}",
-                        }
-                    ],
-                    "Subject": "TrackCase Service (Reset)",
-                    "HTMLPart": email_html_content,
+                    "Email": user_name,
+                    "Name": f"TrackCase Service {user_name}",
                 }
-            ]
+            ],
+            "Subject": "TrackCase Service (Reset)",
+            "HTMLPart": email_html_content,
         }
-        result = self.mailjet.send.create(data=data)
-        if result.status_code != HTTPStatus.OK:
+        if not self.email_sender.enqueue(message):
             raise_http_exception(
                 request=request,
                 sts_code=HTTPStatus.UNPROCESSABLE_ENTITY,
@@ -84,5 +211,21 @@ class Email:
             )
 
 
+EMAIL_SENDER = EmailSender(
+    MJ_SEND_URL,
+    (MJ_PUBLIC, MJ_PRIVATE),
+    EMAIL_QUEUE_MAX_SIZE,
+    EMAIL_BATCH_SIZE,
+    EMAIL_MAX_RETRIES,
+    EMAIL_RETRY_BACKOFF_SECONDS,
+    EMAIL_TIMEOUT_SECONDS,
+)
+EMAIL = Email(EMAIL_SENDER)
+
+
+def get_email_sender() -> EmailSender:
+    return EMAIL_SENDER
+
+
 def get_email_service() -> Email:
-    return Email()
+    return EMAIL
@@ -1,58 +1,156 @@
+import atexit
 import datetime
+import json
 import logging
 import os
+import queue
+import random
 import sys
-from logging.handlers import TimedRotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 import pytz
 
-from src.trackcase_service.utils.constants import REPO_HOME
+from src.trackcase_service.utils.constants import LOG_LEVEL, REPO_HOME
 
+TIMEZONE = pytz.timezone("America/Denver")
+JSON_TYPES = (str, int, float, bool, dict, list, type(None))
 
-class Logger:
-    def __init__(self, logger: logging.Logger):
-        self.logger = logger
-        self.logger.setLevel(logging.INFO)
 
-        # console logger
-        self.stream_handler = logging.StreamHandler(sys.stdout)
-        self.stream_handler.setLevel(logging.INFO)
+# one json object per line
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry = {
+            "time": datetime.datetime.fromtimestamp(record.created, TIMEZONE).isoformat(
+                timespec="milliseconds"
+            ),
+            "service": "trackcase-service",
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        extra = getattr(record, "extra", None)
+        if extra is not None:
+            log_entry["extra"] = extra
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_entry["exception"] = record.exc_text
+        return json.dumps(log_entry, default=str)
+
+
+# records are formatted by the listener thread, only what can't wait is done here
+# the message, exception and extra are resolved now, they may change later
+class PreparedQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        extra = getattr(record, "extra", None)
+        if isinstance(extra, (dict, list)):
+            record.extra = type(extra)(extra)
+        elif not isinstance(extra, JSON_TYPES):
+            record.extra = str(extra)
+        return record
+
 
-        self.formatter = logging.Formatter(
-            "[%(asctime)s][trackcase-service][%(name)s]"
-            "[%(levelname)s] [MESSAGE: %(message)s] | [EXTRA: %(extra)s] "
-            "| [EXCEPTION: %(exc_info)s]"
+def _create_handlers() -> list[logging.Handler]:
+    formatter = JsonFormatter()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setLevel(logging.DEBUG)
+    stream_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [stream_handler]
+
+    if REPO_HOME is not None and str(REPO_HOME).strip() != "":
+        log_file_location = REPO_HOME + "/logs/trackcase-service/trackcase-service.log"
+        os.makedirs(os.path.dirname(log_file_location), exist_ok=True)
+        file_handler = TimedRotatingFileHandler(
+            log_file_location,
+            when="midnight",
+            interval=1,  # Daily rotation
+            backupCount=14,  # Keep logs for 14 days
+            encoding="utf-8",
+            delay=True,
         )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+        # if file logger is present, set console logger level at ERROR
+        stream_handler.setLevel(logging.ERROR)
+    return handlers
 
-        def converter(timestamp):
-            dt = datetime.datetime.fromtimestamp(timestamp)
-            return pytz.timezone("America/Denver").localize(dt).timetuple()
 
-        self.formatter.converter = converter
-        self.stream_handler.setFormatter(self.formatter)
+# configured once per process: loggers put records on a queue, a listener
+# thread formats and writes them to the console and file handlers
+class LoggingBackend:
+    def __init__(self, log_level: str):
+        self.log_level = logging.getLevelName(log_level)
+        self.loggers: dict[str, logging.Logger] = {}
+        self.lock = threading.Lock()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.queue_handler = PreparedQueueHandler(self.queue)
+        self.handlers: list[logging.Handler] | None = None
+        self.listener: QueueListener | None = None
+        atexit.register(self.stop)
 
-        self.logger.addHandler(self.stream_handler)
+    def add_logger(self, logger: logging.Logger):
+        self.start()
+        with self.lock:
+            logger.setLevel(self.log_level)
+            if self.queue_handler not in logger.handlers:
+                logger.addHandler(self.queue_handler)
+            # a registered parent has the same handler, the record would be queued twice
+            logger.propagate = False
+            self.loggers[logger.name] = logger
 
-        # file logger
-        if REPO_HOME is not None and str(REPO_HOME).strip() != "":
-            log_file_location = (
-                REPO_HOME + "/logs/trackcase-service/trackcase-service.log"
-            )
-            log_dir = os.path.dirname(log_file_location)
-            os.makedirs(log_dir, exist_ok=True)
-            self.file_handler = TimedRotatingFileHandler(
-                log_file_location,
-                when="midnight",
-                interval=1,  # Daily rotation
-                backupCount=14,  # Keep logs for 14 days
-                encoding="utf-8",
-                delay=True,
+    def set_log_level(self, log_level: str):
+        with self.lock:
+            self.log_level = logging.getLevelName(log_level)
+            for logger in self.loggers.values():
+                logger.setLevel(self.log_level)
+
+    def get_log_level(self) -> str:
+        return logging.getLevelName(self.log_level)
+
+    # records queued while stopped are written once started again
+    def start(self):
+        with self.lock:
+            if self.listener is not None:
+                return
+            if self.handlers is None:
+                self.handlers = _create_handlers()
+            self.listener = QueueListener(
+                self.queue, *self.handlers, respect_handler_level=True
             )
-            self.file_handler.setLevel(logging.INFO)
-            # if file logger is present, set console logger level at ERROR
-            self.stream_handler.setLevel(logging.ERROR)
-            self.file_handler.setFormatter(self.formatter)
-            self.logger.addHandler(self.file_handler)
+            self.listener.start()
+
+    def stop(self):
+        with self.lock:
+            listener, self.listener = self.listener, None
+        if listener:
+            # writes what is still queued before returning
+            listener.stop()
+
+
+LOGGING_BACKEND = LoggingBackend(LOG_LEVEL)
+
+
+def get_logging_backend() -> LoggingBackend:
+    return LOGGING_BACKEND
+
+
+class Logger:
+    # sample_rate is the share of requests is_sampled lets through, for busy logs
+    def __init__(self, logger: logging.Logger, sample_rate: float = 1.0):
+        self.logger = logger
+        self.sample_rate = sample_rate
+        get_logging_backend().add_logger(self.logger)
+
+    def is_sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
 
     def debug(self, msg, extra=None):
         self.logger.debug(msg, extra={"extra": extra})
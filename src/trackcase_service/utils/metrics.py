@@ -0,0 +1,122 @@
+from bisect import bisect_left
+
+# upper bounds in seconds, the last one catches everything slower
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+# requests that did not match a route share one series, keeps labels bounded
+UNMATCHED_ROUTE = "UNMATCHED"
+
+
+class RouteStats:
+    __slots__ = ("bucket_counts", "sum", "count", "status_counts")
+
+    def __init__(self, number_of_buckets: int):
+        self.bucket_counts = [0] * number_of_buckets
+        self.sum = 0.0
+        self.count = 0
+        self.status_counts: dict[int, int] = {}
+
+
+# updated by the http middleware, which runs on the event loop thread only,
+# so the hot path is a dict lookup, a bisect and a few increments, no locks
+# labels and text are only built when the metrics are scraped
+class MetricsRegistry:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.routes: dict[tuple[str, str], RouteStats] = {}
+        self.in_flight = 0
+
+    def request_started(self):
+        self.in_flight += 1
+
+    def request_finished(self, method: str, route, status_code: int, seconds: float):
+        self.in_flight -= 1
+        key = (method, route.path if route is not None else UNMATCHED_ROUTE)
+        route_stats = self.routes.get(key)
+        if route_stats is None:
+            route_stats = self.routes[key] = RouteStats(len(self.buckets))
+        route_stats.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        route_stats.sum += seconds
+        route_stats.count += 1
+        route_stats.status_counts[status_code] = (
+            route_stats.status_counts.get(status_code, 0) + 1
+        )
+
+    def clear(self):
+        self.routes.clear()
+
+    # prometheus text exposition format 0.0.4
+    def render(self, threads_busy: int = None, threads_total: int = None) -> str:
+        lines = [
+            "# HELP trackcase_http_request_duration_seconds Request latency by route.",
+            "# TYPE trackcase_http_request_duration_seconds histogram",
+        ]
+        routes = sorted(self.routes.items())
+        for (method, route), route_stats in routes:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative_count = 0
+            for bucket, bucket_count in zip(self.buckets, route_stats.bucket_counts):
+                cumulative_count += bucket_count
+                le = "+Inf" if bucket == float("inf") else repr(bucket)
+                lines.append(
+                    f"trackcase_http_request_duration_seconds_bucket"
+                    f'{{{labels},le="{le}"}} {cumulative_count}'
+                )
+            lines.append(
+                f"trackcase_http_request_duration_seconds_sum{{{labels}}} "
+                f"{route_stats.sum}"
+            )
+            lines.append(
+                f"trackcase_http_request_duration_seconds_count{{{labels}}} "
+                f"{route_stats.count}"
+            )
+
+        lines.append(
+            "# HELP trackcase_http_requests_total Requests by route and status."
+        )
+        lines.append("# TYPE trackcase_http_requests_total counter")
+        for (method, route), route_stats in routes:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            for status_code, count in sorted(route_stats.status_counts.items()):
+                lines.append(
+                    f'trackcase_http_requests_total{{{labels},status="{status_code}"}} '
+                    f"{count}"
+                )
+
+        lines.append("# HELP trackcase_http_requests_in_flight Requests in progress.")
+        lines.append("# TYPE trackcase_http_requests_in_flight gauge")
+        lines.append(f"trackcase_http_requests_in_flight {self.in_flight}")
+        if threads_busy is not None and threads_total is not None:
+            lines.append(
+                "# HELP trackcase_threadpool_threads_busy Threads running sync "
+                "endpoints and dependencies."
+            )
+            lines.append("# TYPE trackcase_threadpool_threads_busy gauge")
+            lines.append(f"trackcase_threadpool_threads_busy {threads_busy}")
+            lines.append("# HELP trackcase_threadpool_threads_total Threadpool size.")
+            lines.append("# TYPE trackcase_threadpool_threads_total gauge")
+            lines.append(f"trackcase_threadpool_threads_total {threads_total}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+METRICS_REGISTRY = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return METRICS_REGISTRY
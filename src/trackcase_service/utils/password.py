@@ -0,0 +1,97 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+import bcrypt
+
+from src.trackcase_service.utils.constants import (
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_MAX_WORKERS,
+    PASSWORD_HASH_ROUNDS,
+)
+
+
+class PasswordHashOverloadError(Exception):
+    pass
+
+
+def hash_password(plain_password: str, rounds: int = PASSWORD_HASH_ROUNDS) -> str:
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(plain_password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+
+
+# bcrypt is pure cpu, run it in worker processes instead of the request threads
+# calls over workers + max pending are rejected right away instead of queued
+# with no workers, calls run inline on the calling thread
+class PasswordHashExecutor:
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self.executor: ProcessPoolExecutor | None = None
+        self.lock = threading.Lock()
+        self.metrics = {"completed": 0, "rejected": 0}
+
+    def run(self, func: Callable, *args):
+        if not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.metrics["rejected"] += 1
+            raise PasswordHashOverloadError("Too many password hash requests")
+        try:
+            if self.max_workers <= 0:
+                result = func(*args)
+            else:
+                result = self._get_executor().submit(func, *args).result()
+        finally:
+            self.slots.release()
+        with self.lock:
+            self.metrics["completed"] += 1
+        return result
+
+    def hash_password(self, plain_password: str) -> str:
+        return self.run(hash_password, plain_password)
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return self.run(verify_password, plain_password, hashed_password)
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            return {
+                **self.metrics,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+            }
+
+    def shutdown(self):
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # started on first use, not when the module is imported
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self.executor
+
+
+PASSWORD_HASH_EXECUTOR = PasswordHashExecutor(
+    (
+        PASSWORD_HASH_MAX_WORKERS
+        if PASSWORD_HASH_MAX_WORKERS is not None
+        else min(os.cpu_count() or 1, 4)
+    ),
+    PASSWORD_HASH_MAX_PENDING,
+)
+
+
+def get_password_hash_executor() -> PasswordHashExecutor:
+    return PASSWORD_HASH_EXECUTOR
@@ -0,0 +1,58 @@
+# login throughput (bcrypt verify) against the number of password hash workers
+# run as: python -m tests.benchmarks.password_benchmark [logins] [concurrency]
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.trackcase_service.utils.password import (
+    PasswordHashExecutor,
+    PasswordHashOverloadError,
+    hash_password,
+)
+
+
+def run_logins(
+    password_hash_executor: PasswordHashExecutor,
+    hashed_password: str,
+    logins: int,
+    concurrency: int,
+) -> tuple[float, int]:
+    def login():
+        try:
+            return password_hash_executor.verify_password("password", hashed_password)
+        except PasswordHashOverloadError:
+            return None
+
+    # request threads, like the threadpool serving sync endpoints
+    with ThreadPoolExecutor(max_workers=concurrency) as request_threads:
+        # warm up, worker processes start on first use
+        list(request_threads.map(lambda _: login(), range(concurrency)))
+        start = time.perf_counter()
+        results = list(request_threads.map(lambda _: login(), range(logins)))
+        elapsed = time.perf_counter() - start
+    return elapsed, results.count(None)
+
+
+def main():
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    cpu_count = os.cpu_count() or 1
+    hashed_password = hash_password("password")
+    print(f"cpus: {cpu_count}, logins: {logins}, concurrency: {concurrency}")
+    print("workers | logins/sec | rejected")
+
+    # 0 workers verifies inline on the request threads
+    for max_workers in [0] + list(range(1, cpu_count + 1)):
+        password_hash_executor = PasswordHashExecutor(max_workers, concurrency)
+        try:
+            elapsed, rejected = run_logins(
+                password_hash_executor, hashed_password, logins, concurrency
+            )
+        finally:
+            password_hash_executor.shutdown()
+        print(f"{max_workers:7} | {logins / elapsed:10.1f} | {rejected:8}")
+
+
+if __name__ == "__main__":
+    main()
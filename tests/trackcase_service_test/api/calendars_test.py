@@ -0,0 +1,228 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.trackcase_service.db import models
+from src.trackcase_service.db.crud import CrudService
+from src.trackcase_service.db.session import get_async_db_session
+from src.trackcase_service.main import app, validate_credentials
+from src.trackcase_service.service import schemas
+from src.trackcase_service.utils.cache import (
+    CALENDAR_EVENTS_CACHE,
+    clear_ref_types_cache,
+)
+
+# statements per request must not grow with the number of calendars
+MAX_STATEMENTS_PER_REQUEST = 8
+
+
+class CalendarsApiTest(unittest.TestCase):
+
+    def setUp(self):
+        # file database, seeded with the sync engine and read by the async routes
+        # no pooling, each test client request runs in its own event loop
+        db_file, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_file)
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        self.async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}", poolclass=NullPool
+        )
+        models.Base.metadata.create_all(self.engine)
+        self.session_local = sessionmaker(bind=self.engine)
+        self.async_session_local = async_sessionmaker(
+            bind=self.async_engine, expire_on_commit=False
+        )
+        self.now = datetime.now()
+        self._insert_calendars(20)
+        clear_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS)
+        CALENDAR_EVENTS_CACHE.clear()
+
+        self.statement_count = 0
+        event.listen(
+            self.async_engine.sync_engine,
+            "before_cursor_execute",
+            self._count_statement,
+        )
+        app.dependency_overrides[get_async_db_session] = self._get_async_db_session
+        app.dependency_overrides[validate_credentials] = self._validate_credentials
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+        self.engine.dispose()
+        os.remove(self.db_path)
+        clear_ref_types_cache(schemas.RefTypesServiceRegistry.COMPONENT_STATUS)
+
+    def _count_statement(self, *args):
+        self.statement_count += 1
+
+    async def _get_async_db_session(self):
+        async with self.async_session_local() as db_session:
+            yield db_session
+
+    @staticmethod
+    def _validate_credentials(request: Request):
+        request.state.user_details = {"roles": [{"name": "SUPERUSER"}]}
+
+    def _insert_calendars(self, number_of_court_cases):
+        now = self.now
+        table_base = {"created": now, "modified": now, "is_deleted": False}
+        db_session = self.session_local()
+        db_session.add_all(
+            [
+                models.ComponentStatus(
+                    id=1,
+                    component_name="CALENDARS",
+                    status_name="OPEN",
+                    is_active=True,
+                    **table_base,
+                ),
+                models.ComponentStatus(
+                    id=2,
+                    component_name="CALENDARS",
+                    status_name="CLOSED",
+                    is_active=False,
+                    **table_base,
+                ),
+                models.CaseType(id=1, name="CASE", description="CASE", **table_base),
+                models.FilingType(
+                    id=1, name="FILING", description="FILING", **table_base
+                ),
+                models.HearingType(
+                    id=1, name="MASTER", description="MASTER", **table_base
+                ),
+                models.TaskType(id=1, name="TASK", description="TASK", **table_base),
+                models.Court(
+                    id=1,
+                    name="COURT",
+                    court_url="URL",
+                    component_status_id=1,
+                    **table_base,
+                ),
+                models.Judge(
+                    id=1, name="JUDGE", court_id=1, component_status_id=1, **table_base
+                ),
+            ]
+        )
+        for i in range(1, number_of_court_cases + 1):
+            # past and future dates, open and closed statuses
+            calendar_date = now + timedelta(days=i - number_of_court_cases // 2)
+            component_status_id = i % 2 + 1
+            db_session.add_all(
+                [
+                    models.Client(
+                        id=i,
+                        name=f"CLIENT_{i}",
+                        judge_id=1,
+                        component_status_id=1,
+                        **table_base,
+                    ),
+                    models.CourtCase(
+                        id=i,
+                        case_type_id=1,
+                        client_id=i,
+                        component_status_id=1,
+                        **table_base,
+                    ),
+                    models.Filing(
+                        id=i,
+                        filing_type_id=1,
+                        court_case_id=i,
+                        component_status_id=1,
+                        **table_base,
+                    ),
+                    models.HearingCalendar(
+                        id=i,
+                        hearing_date=calendar_date,
+                        hearing_type_id=1,
+                        court_case_id=i,
+                        component_status_id=component_status_id,
+                        **table_base,
+                    ),
+                    models.TaskCalendar(
+                        id=i * 2 - 1,
+                        task_date=calendar_date,
+                        due_date=calendar_date,
+                        task_type_id=1,
+                        hearing_calendar_id=i,
+                        component_status_id=component_status_id,
+                        **table_base,
+                    ),
+                    models.TaskCalendar(
+                        id=i * 2,
+                        task_date=calendar_date,
+                        due_date=calendar_date,
+                        task_type_id=1,
+                        filing_id=i,
+                        component_status_id=component_status_id,
+                        **table_base,
+                    ),
+                ]
+            )
+        db_session.commit()
+        db_session.close()
+
+    def test_get_calendars(self):
+        self.statement_count = 0
+        response = self.client.get("/calendars/all/")
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(self.statement_count, MAX_STATEMENTS_PER_REQUEST)
+
+        response_data = response.json().get("data")
+        self.assertEqual(len(response_data.get("hearingCalendars")), 20)
+        self.assertEqual(len(response_data.get("taskCalendars")), 40)
+        calendar_events = response_data.get("calendarEvents")
+        self.assertEqual(len(calendar_events), 60)
+
+        hearing_event = calendar_events[0]
+        self.assertEqual(hearing_event.get("calendar"), "HEARING_CALENDAR")
+        self.assertEqual(hearing_event.get("type"), "MASTER")
+        self.assertEqual(hearing_event.get("title"), "CLIENT_1")
+        self.assertEqual(hearing_event.get("courtCaseId"), 1)
+        self.assertEqual(hearing_event.get("status"), "PAST_DONE")
+        self.assertEqual(calendar_events[19].get("status"), "DUE")
+
+        task_events = {event.get("id"): event for event in calendar_events[20:]}
+        self.assertEqual(task_events.get(3).get("title"), "CLIENT_2")
+        self.assertEqual(task_events.get(4).get("title"), "CLIENT_2")
+        self.assertEqual(task_events.get(4).get("courtCaseId"), 2)
+        self.assertEqual(task_events.get(4).get("status"), "PAST_DUE")
+
+    def test_get_calendars_window(self):
+        # calendars from 2 days before to 2 days after now
+        window = {
+            "start": (self.now - timedelta(days=2, hours=12)).isoformat(),
+            "end": (self.now + timedelta(days=2, hours=12)).isoformat(),
+        }
+        response = self.client.get("/calendars/all/", params=window)
+        self.assertEqual(response.status_code, 200)
+        response_data = response.json().get("data")
+        self.assertEqual(len(response_data.get("hearingCalendars")), 5)
+        self.assertEqual(len(response_data.get("taskCalendars")), 10)
+        calendar_events = response_data.get("calendarEvents")
+        self.assertEqual(len(calendar_events), 15)
+        self.assertEqual(
+            [calendar_event.get("id") for calendar_event in calendar_events[:5]],
+            [8, 9, 10, 11, 12],
+        )
+
+        # same window again reads events from the cache
+        statement_count = self.statement_count
+        self.client.get("/calendars/all/", params=window)
+        statement_count_cached = self.statement_count - statement_count
+        self.assertLess(statement_count_cached, statement_count)
+
+        db_session = self.session_local()
+        CrudService(db_session, models.HearingCalendar).delete(8, False)
+        db_session.close()
+        response = self.client.get("/calendars/all/", params=window)
+        calendar_events = response.json().get("data").get("calendarEvents")
+        self.assertEqual(len(calendar_events), 14)
@@ -0,0 +1,192 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.trackcase_service.db import models
+from src.trackcase_service.db.session import get_async_db_session
+from src.trackcase_service.main import app, validate_credentials
+
+# statements per request must not grow with the number of clients on the page
+MAX_STATEMENTS_PER_REQUEST = 6
+
+
+class ClientApiTest(unittest.TestCase):
+
+    def setUp(self):
+        # file database, seeded with the sync engine and read by the async routes
+        # no pooling, each test client request runs in its own event loop
+        db_file, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_file)
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        self.async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}", poolclass=NullPool
+        )
+        models.Base.metadata.create_all(self.engine)
+        self.session_local = sessionmaker(bind=self.engine)
+        self.async_session_local = async_sessionmaker(
+            bind=self.async_engine, expire_on_commit=False
+        )
+        self._insert_clients(50)
+
+        self.statement_count = 0
+        event.listen(
+            self.async_engine.sync_engine,
+            "before_cursor_execute",
+            self._count_statement,
+        )
+        app.dependency_overrides[get_async_db_session] = self._get_async_db_session
+        app.dependency_overrides[validate_credentials] = self._validate_credentials
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def _count_statement(self, *args):
+        self.statement_count += 1
+
+    async def _get_async_db_session(self):
+        async with self.async_session_local() as db_session:
+            yield db_session
+
+    @staticmethod
+    def _validate_credentials(request: Request):
+        request.state.user_details = {"roles": [{"name": "SUPERUSER"}]}
+
+    def _insert_clients(self, number_of_clients):
+        now = datetime.now()
+        table_base = {"created": now, "modified": now, "is_deleted": False}
+        db_session = self.session_local()
+        db_session.add_all(
+            [
+                models.ComponentStatus(
+                    id=1,
+                    component_name="CLIENTS",
+                    status_name="ACTIVE",
+                    is_active=True,
+                    **table_base,
+                ),
+                models.CaseType(id=1, name="CASE", description="CASE", **table_base),
+                models.Court(
+                    id=1,
+                    name="COURT",
+                    court_url="URL",
+                    component_status_id=1,
+                    **table_base,
+                ),
+                models.AppUser(
+                    id=1,
+                    email="EMAIL",
+                    password="PASSWORD",
+                    full_name="NAME",
+                    is_validated=True,
+                    component_status_id=1,
+                    **table_base,
+                ),
+            ]
+        )
+        for i in range(1, number_of_clients + 1):
+            # every client has its own judge, so to-one loads are not cached
+            db_session.add_all(
+                [
+                    models.Judge(
+                        id=i,
+                        name=f"JUDGE_{i}",
+                        court_id=1,
+                        component_status_id=1,
+                        **table_base,
+                    ),
+                    models.Client(
+                        id=i,
+                        name=f"CLIENT_{i}",
+                        judge_id=i,
+                        component_status_id=1,
+                        **table_base,
+                    ),
+                    models.CourtCase(
+                        id=i,
+                        case_type_id=1,
+                        client_id=i,
+                        component_status_id=1,
+                        **table_base,
+                    ),
+                    models.HistoryClient(
+                        app_user_id=1, client_id=i, name=f"CLIENT_{i}", **table_base
+                    ),
+                ]
+            )
+        db_session.commit()
+        db_session.close()
+
+    def test_find_client_statement_count(self):
+        for request_metadata in [
+            None,
+            {"per_page": 100},
+            {"per_page": 100, "is_include_extra": True, "is_include_history": True},
+        ]:
+            with self.subTest(request_metadata=request_metadata):
+                self.statement_count = 0
+                response = self.client.get(
+                    "/clients/",
+                    params=(
+                        {"metadata": json.dumps(request_metadata)}
+                        if request_metadata
+                        else None
+                    ),
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.json().get("data")), 50)
+                self.assertLessEqual(self.statement_count, MAX_STATEMENTS_PER_REQUEST)
+
+    def test_find_client_include_extra_and_history(self):
+        response = self.client.get(
+            "/clients/",
+            params={
+                "metadata": json.dumps(
+                    {"is_include_extra": True, "is_include_history": True}
+                )
+            },
+        )
+        client = response.json().get("data")[0]
+        self.assertEqual(client.get("judge").get("name"), "JUDGE_1")
+        self.assertEqual(len(client.get("courtCases")), 1)
+        self.assertEqual(len(client.get("historyClients")), 1)
+
+    def test_find_client_by_id(self):
+        response = self.client.get(
+            "/clients/", params={"metadata": json.dumps({"schema_model_id": 2})}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("data")[0].get("name"), "CLIENT_2")
+
+        response = self.client.get(
+            "/clients/", params={"metadata": json.dumps({"schema_model_id": 99})}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_find_court_case(self):
+        self.statement_count = 0
+        response = self.client.get(
+            "/court_cases/",
+            params={
+                "metadata": json.dumps(
+                    {"is_include_extra": True, "is_include_history": True}
+                )
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(self.statement_count, MAX_STATEMENTS_PER_REQUEST)
+        court_cases = response.json().get("data")
+        self.assertEqual(len(court_cases), 50)
+        self.assertEqual(court_cases[0].get("client").get("name"), "CLIENT_1")
+        self.assertEqual(response.json().get("metadata").get("totalItems"), 50)
@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from src.trackcase_service.api import data_import
+from src.trackcase_service.main import app, validate_credentials
+from src.trackcase_service.service import schemas
+
+
+class DataImportApiTest(unittest.TestCase):
+
+    def setUp(self):
+        self.permission_names = []
+        self.import_job_runner = MagicMock()
+        self.import_job_runner.get_job.return_value = schemas.ImportJob(
+            job_id="JOB",
+            job_type=schemas.ImportJobTypes.COURTS,
+            status=schemas.ImportJobStatus.COMPLETED,
+            app_user_id=1,
+            created=datetime.now(),
+            reports=["successes"],
+        )
+        self.import_job_runner.get_csv_report.return_value = "name\nCOURT ONE\n"
+        patcher = patch.object(
+            data_import,
+            "get_import_job_runner",
+            return_value=self.import_job_runner,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        app.dependency_overrides[validate_credentials] = self._validate_credentials
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def _validate_credentials(self, request: Request):
+        request.state.user_details = {
+            "id": 1,
+            "roles": [
+                {
+                    "name": "ROLE",
+                    "permissions": [{"name": name} for name in self.permission_names],
+                }
+            ],
+        }
+
+    def test_import_permission_checked_before_submit(self):
+        self.permission_names = ["JUDGES_CREATE"]
+        response = self.client.get("/import/courts")
+        self.assertEqual(response.status_code, 403)
+        self.import_job_runner.submit.assert_not_called()
+
+        self.import_job_runner.submit.return_value = (
+            self.import_job_runner.get_job.return_value
+        )
+        response = self.client.get("/import/judges")
+        self.assertEqual(response.status_code, 202)
+        self.import_job_runner.submit.assert_called_once()
+
+    def test_import_job_permission(self):
+        self.permission_names = ["JUDGES_CREATE"]
+        for url in [
+            "/import/jobs/JOB/",
+            "/import/jobs/JOB/successes/",
+        ]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.permission_names = ["COURTS_CREATE"]
+        response = self.client.get("/import/jobs/JOB/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["appUserId"], 1)
+        response = self.client.get("/import/jobs/JOB/successes/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "name\nCOURT ONE\n")
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.trackcase_service.db import models
+from src.trackcase_service.db.session import get_async_db_session
+from src.trackcase_service.main import app, validate_credentials
+
+# a count and a select per ref type
+MAX_STATEMENTS_PER_REQUEST = 12
+
+
+class RefTypesApiTest(unittest.TestCase):
+
+    def setUp(self):
+        # file database, seeded with the sync engine and read by the async routes
+        # no pooling, each test client request runs in its own event loop
+        db_file, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_file)
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        self.async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{self.db_path}", poolclass=NullPool
+        )
+        models.Base.metadata.create_all(self.engine)
+        self.session_local = sessionmaker(bind=self.engine)
+        self.async_session_local = async_sessionmaker(
+            bind=self.async_engine, expire_on_commit=False
+        )
+        self._insert_ref_types()
+
+        self.statement_count = 0
+        event.listen(
+            self.async_engine.sync_engine,
+            "before_cursor_execute",
+            self._count_statement,
+        )
+        app.dependency_overrides[get_async_db_session] = self._get_async_db_session
+        app.dependency_overrides[validate_credentials] = self._validate_credentials
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def _count_statement(self, *args):
+        self.statement_count += 1
+
+    async def _get_async_db_session(self):
+        async with self.async_session_local() as db_session:
+            yield db_session
+
+    @staticmethod
+    def _validate_credentials(request: Request):
+        request.state.user_details = {"roles": [{"name": "SUPERUSER"}]}
+
+    def _insert_ref_types(self):
+        now = datetime.now()
+        table_base = {"created": now, "modified": now, "is_deleted": False}
+        db_session = self.session_local()
+        db_session.add_all(
+            [
+                models.ComponentStatus(
+                    id=1,
+                    component_name="CLIENTS",
+                    status_name="ACTIVE",
+                    is_active=True,
+                    **table_base,
+                ),
+                models.CollectionMethod(
+                    id=1, name="CASH", description="CASH", **table_base
+                ),
+                models.CaseType(id=1, name="CASE_B", description="B", **table_base),
+                models.CaseType(id=2, name="CASE_A", description="A", **table_base),
+                models.FilingType(
+                    id=1, name="FILING", description="FILING", **table_base
+                ),
+                models.HearingType(
+                    id=1, name="MASTER", description="MASTER", **table_base
+                ),
+                models.TaskType(id=1, name="TASK", description="TASK", **table_base),
+            ]
+        )
+        db_session.commit()
+        db_session.close()
+
+    def test_get_all_ref_types(self):
+        response = self.client.get("/types/ref_types/")
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(self.statement_count, MAX_STATEMENTS_PER_REQUEST)
+        response_data = response.json().get("data")
+        for ref_types, number_of_ref_types in [
+            ("componentStatuses", 1),
+            ("collectionMethods", 1),
+            ("caseTypes", 2),
+            ("filingTypes", 1),
+            ("hearingTypes", 1),
+            ("taskTypes", 1),
+        ]:
+            with self.subTest(ref_types=ref_types):
+                self.assertEqual(
+                    len(response_data.get(ref_types).get("data")), number_of_ref_types
+                )
+        case_types = response_data.get("caseTypes").get("data")
+        self.assertEqual(
+            [case_type.get("name") for case_type in case_types], ["CASE_A", "CASE_B"]
+        )
+
+    def test_find_case_type_by_id(self):
+        response = self.client.get(
+            "/types/case_type/", params={"metadata": json.dumps({"schema_model_id": 1})}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json().get("data")[0].get("name"), "CASE_B")
+
+        response = self.client.get(
+            "/types/case_type/", params={"metadata": json.dumps({"schema_model_id": 9})}
+        )
+        self.assertEqual(response.status_code, 404)
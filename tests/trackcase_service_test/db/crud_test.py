@@ -0,0 +1,366 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.trackcase_service.db import models
+from src.trackcase_service.db.crud import (
+    PENDING_CACHE_CLEAR_KEY,
+    CrudService,
+    CrudServiceRaw,
+    DataKeys,
+    unit_of_work,
+)
+from src.trackcase_service.service import schemas
+
+
+class CrudServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        models.Base.metadata.create_all(self.engine)
+        self.db_session = sessionmaker(bind=self.engine)()
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+        for i in range(25):
+            crud_service.create(
+                models.ComponentStatus(
+                    component_name=f"COMPONENT_{i}",
+                    # repeat names so that ties are broken by id
+                    status_name=f"STATUS_{i % 7}",
+                    is_active=i % 2 == 0,
+                )
+            )
+
+    def tearDown(self):
+        self.db_session.close()
+        self.engine.dispose()
+
+    def _read_all_with_cursor(self, sort_config):
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+        ids, cursor = [], None
+        for _ in range(5):
+            read_response = crud_service.read(
+                sort_config=sort_config, per_page=10, cursor=cursor
+            )
+            ids.extend(data.id for data in read_response.get(DataKeys.data))
+            cursor = read_response.get(DataKeys.metadata).next_cursor
+            if cursor is None:
+                break
+        return ids
+
+    def _read_all_with_offset(self, sort_config):
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+        ids = []
+        for page_number in range(1, 4):
+            read_response = crud_service.read(
+                sort_config=sort_config, per_page=10, page_number=page_number
+            )
+            ids.extend(data.id for data in read_response.get(DataKeys.data))
+        return ids
+
+    def test_read_cursor_matches_offset(self):
+        for sort_config in [
+            None,
+            schemas.SortConfig(column="status_name", direction="ASC"),
+            schemas.SortConfig(column="status_name", direction="DESC"),
+            schemas.SortConfig(column="component_name", direction="DESC"),
+        ]:
+            with self.subTest(sort_config=sort_config):
+                cursor_ids = self._read_all_with_cursor(sort_config)
+                self.assertEqual(len(cursor_ids), 25)
+                self.assertEqual(cursor_ids, self._read_all_with_offset(sort_config))
+
+    def test_read_skip_count(self):
+        read_response = CrudService(self.db_session, models.ComponentStatus).read(
+            per_page=10, is_skip_count=True
+        )
+        metadata = read_response.get(DataKeys.metadata)
+        self.assertIsNone(metadata.total_items)
+        self.assertIsNone(metadata.total_pages)
+        self.assertIsNotNone(metadata.next_cursor)
+
+    def test_read_cursor_sort_mismatch(self):
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+        cursor = crud_service.read(per_page=10).get(DataKeys.metadata).next_cursor
+        with self.assertRaises(ValueError):
+            crud_service.read(
+                sort_config=schemas.SortConfig(column="status_name", direction="ASC"),
+                per_page=10,
+                cursor=cursor,
+            )
+
+    def test_read_cached_count(self):
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+
+        def read_total_items():
+            return (
+                crud_service.read(count_strategy=schemas.CountStrategy.CACHED)
+                .get(DataKeys.metadata)
+                .total_items
+            )
+
+        self.assertEqual(read_total_items(), 25)
+        # write outside of CrudService is not seen until the cache is cleared
+        self.db_session.add(
+            models.ComponentStatus(
+                component_name="OTHER",
+                status_name="OTHER",
+                is_active=True,
+                created=datetime.now(),
+                modified=datetime.now(),
+            )
+        )
+        self.db_session.commit()
+        self.assertEqual(read_total_items(), 25)
+        crud_service.create(
+            models.ComponentStatus(
+                component_name="ANOTHER", status_name="ANOTHER", is_active=True
+            )
+        )
+        self.assertEqual(read_total_items(), 27)
+
+    def test_bulk_write_clears_cached_count_after_commit(self):
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+
+        def read_total_items():
+            return (
+                crud_service.read(count_strategy=schemas.CountStrategy.CACHED)
+                .get(DataKeys.metadata)
+                .total_items
+            )
+
+        self.assertEqual(read_total_items(), 25)
+        crud_service.create_bulk(
+            [
+                models.ComponentStatus(
+                    component_name="BULK", status_name="BULK", is_active=True
+                )
+            ]
+        )
+        self.db_session.rollback()
+        self.assertNotIn(PENDING_CACHE_CLEAR_KEY, self.db_session.info)
+        self.assertEqual(read_total_items(), 25)
+
+        crud_service.create_bulk(
+            [
+                models.ComponentStatus(
+                    component_name="BULK", status_name="BULK", is_active=True
+                )
+            ]
+        )
+        crud_service.update_bulk([{"id": 1, "status_name": "BULK"}])
+        self.assertEqual(read_total_items(), 25)
+        self.db_session.commit()
+        self.assertEqual(read_total_items(), 26)
+
+    def test_read_estimated_count_fallback(self):
+        read_response = CrudService(self.db_session, models.ComponentStatus).read(
+            count_strategy=schemas.CountStrategy.ESTIMATED
+        )
+        self.assertEqual(read_response.get(DataKeys.metadata).total_items, 25)
+
+    def test_read_raw(self):
+        sql_query = (
+            "SELECT id, component_name, status_name, is_active, created, other_column "
+            "FROM (SELECT *, 'OTHER' AS other_column FROM component_status) "
+            "ORDER BY id ASC"
+        )
+        crud_service_raw = CrudServiceRaw(self.db_session)
+        for is_validate in [False, True]:
+            read_response = crud_service_raw.read(
+                schemas.ComponentStatus, sql_query, per_page=10, is_validate=is_validate
+            )
+            data = read_response.get(DataKeys.data)
+            self.assertEqual(len(data), 10)
+            self.assertEqual(read_response.get(DataKeys.metadata).total_items, 25)
+            self.assertEqual(data[1].id, 2)
+            self.assertEqual(data[1].component_name, "COMPONENT_1")
+            self.assertFalse(data[1].is_active)
+            self.assertIsNone(data[1].modified)
+            self.assertFalse(hasattr(data[1], "other_column"))
+        self.assertIsInstance(data[1].is_active, bool)
+        self.assertIsInstance(data[1].created, datetime)
+
+    def test_read_raw_cursor(self):
+        crud_service_raw = CrudServiceRaw(self.db_session)
+        for direction in ["ASC", "DESC"]:
+            sort_config = schemas.SortConfig(column="status_name", direction=direction)
+            # first page is sorted by the query itself, later ones by the seek
+            sql_query = (
+                "SELECT id, component_name, status_name, is_active "
+                f"FROM component_status ORDER BY status_name {direction}, "
+                f"id {direction}"
+            )
+            with self.subTest(direction=direction):
+                ids, cursor = [], None
+                for _ in range(5):
+                    read_response = crud_service_raw.read(
+                        schemas.ComponentStatus,
+                        sql_query,
+                        per_page=10,
+                        sort_config=sort_config,
+                        cursor=cursor,
+                    )
+                    ids.extend(data.id for data in read_response.get(DataKeys.data))
+                    cursor = read_response.get(DataKeys.metadata).next_cursor
+                    if cursor is None:
+                        break
+                expected_ids = [
+                    component_status.id
+                    for component_status in sorted(
+                        self.db_session.query(models.ComponentStatus).all(),
+                        key=lambda row: (row.status_name, row.id),
+                        reverse=direction == "DESC",
+                    )
+                ]
+                self.assertEqual(ids, expected_ids)
+
+    def test_unit_of_work(self):
+        statements = []
+        event.listen(
+            self.engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2].split()[0]),
+        )
+        component_status = CrudService(self.db_session, models.ComponentStatus)
+        with unit_of_work(self.db_session):
+            data_model = component_status.create(
+                models.ComponentStatus(
+                    component_name="COMPONENT_25", status_name="NEW", is_active=True
+                )
+            )
+            self.assertIsInstance(data_model.created, datetime)
+        # created and modified come back with returning, no refresh select
+        self.assertEqual(statements, ["INSERT"])
+
+        with unit_of_work(self.db_session):
+            data_model = component_status.update(
+                data_model.id,
+                models.ComponentStatus(
+                    component_name="COMPONENT_25", status_name="UPDATED", is_active=True
+                ),
+            )
+            self.assertIsInstance(data_model.modified, datetime)
+        self.assertEqual(statements[-1], "UPDATE")
+        self.assertEqual(
+            self.db_session.get(models.ComponentStatus, 26).status_name, "UPDATED"
+        )
+
+        with self.assertRaises(RuntimeError):
+            with unit_of_work(self.db_session):
+                component_status.create(
+                    models.ComponentStatus(
+                        component_name="COMPONENT_26", status_name="NEW", is_active=True
+                    )
+                )
+                raise RuntimeError("History Error")
+        self.assertEqual(self.db_session.query(models.ComponentStatus).count(), 26)
+
+
+class CrudServiceAsyncTest(unittest.TestCase):
+
+    def setUp(self):
+        # file database, seeded with the sync session and read by both
+        db_file, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_file)
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        models.Base.metadata.create_all(self.engine)
+        self.db_session = sessionmaker(bind=self.engine)()
+        crud_service = CrudService(self.db_session, models.ComponentStatus)
+        for i in range(25):
+            crud_service.create(
+                models.ComponentStatus(
+                    component_name=f"COMPONENT_{i}",
+                    status_name=f"STATUS_{i % 7}",
+                    is_active=i % 2 == 0,
+                )
+            )
+        crud_service.delete(25, False)
+
+    def tearDown(self):
+        self.db_session.close()
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def _read_async(self, read):
+        async def read_with_session():
+            async_engine = create_async_engine(f"sqlite+aiosqlite:///{self.db_path}")
+            try:
+                async with async_sessionmaker(bind=async_engine)() as db_session:
+                    return await read(db_session)
+            finally:
+                await async_engine.dispose()
+
+        return asyncio.run(read_with_session())
+
+    def test_read_async_matches_read(self):
+        cursor = (
+            CrudService(self.db_session, models.ComponentStatus)
+            .read(per_page=10)
+            .get(DataKeys.metadata)
+            .next_cursor
+        )
+        for read_kwargs in [
+            {},
+            {"model_id": 3},
+            {"model_id": 25},
+            {"model_id": 25, "is_include_soft_deleted": True},
+            {"model_ids": [2, 4, 25]},
+            {"per_page": 10, "page_number": 2},
+            {"per_page": 10, "cursor": cursor},
+            {"per_page": 10, "count_strategy": schemas.CountStrategy.CACHED},
+            {"per_page": 10, "count_strategy": schemas.CountStrategy.ESTIMATED},
+            {"per_page": 10, "is_skip_count": True},
+            {
+                "sort_config": schemas.SortConfig(
+                    column="status_name", direction="DESC"
+                ),
+                "filter_config": [
+                    schemas.FilterConfig(column="is_active", value=True, operation="eq")
+                ],
+            },
+        ]:
+            with self.subTest(read_kwargs=read_kwargs):
+                read_response = CrudService(
+                    self.db_session, models.ComponentStatus
+                ).read(**read_kwargs)
+                read_response_async = self._read_async(
+                    lambda db_session: CrudService(
+                        db_session, models.ComponentStatus
+                    ).read_async(**read_kwargs)
+                )
+                self.assertEqual(
+                    [data.id for data in read_response_async.get(DataKeys.data)],
+                    [data.id for data in read_response.get(DataKeys.data)],
+                )
+                self.assertEqual(
+                    read_response_async.get(DataKeys.metadata),
+                    read_response.get(DataKeys.metadata),
+                )
+
+    def test_read_raw_async_matches_read_raw(self):
+        sql_query = (
+            "SELECT id, component_name, status_name, is_active "
+            "FROM component_status ORDER BY id ASC"
+        )
+        read_response = CrudServiceRaw(self.db_session).read(
+            schemas.ComponentStatus, sql_query, per_page=10, page_number=2
+        )
+        read_response_async = self._read_async(
+            lambda db_session: CrudServiceRaw(db_session).read_async(
+                schemas.ComponentStatus, sql_query, per_page=10, page_number=2
+            )
+        )
+        self.assertEqual(
+            [data.id for data in read_response_async.get(DataKeys.data)],
+            list(range(11, 21)),
+        )
+        self.assertEqual(
+            read_response_async.get(DataKeys.metadata),
+            read_response.get(DataKeys.metadata),
+        )
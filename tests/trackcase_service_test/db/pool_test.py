@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, text
+
+from src.trackcase_service.db.pool import InstrumentedQueuePool, PoolMetrics
+
+
+class PoolMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        db_file, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_file)
+        self.engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_pre_ping=True,
+        )
+        self.pool_metrics = PoolMetrics(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def test_get_metrics(self):
+        connection_one = self.engine.connect()
+        connection_two = self.engine.connect()
+        connection_one.execute(text("SELECT 1"))
+        metrics = self.pool_metrics.get_metrics()
+        self.assertEqual(metrics.get("checked_out"), 2)
+        self.assertEqual(metrics.get("overflow"), 1)
+        self.assertEqual(metrics.get("checkouts"), 2)
+        self.assertGreaterEqual(metrics.get("checkout_wait_max_ms"), 0)
+
+        connection_one.close()
+        connection_two.close()
+        metrics = self.pool_metrics.get_metrics()
+        self.assertEqual(metrics.get("checked_out"), 0)
+        self.assertEqual(metrics.get("max_checked_out"), 2)
+
+    def test_get_metrics_after_dispose(self):
+        self.engine.connect().close()
+        self.engine.dispose()
+        self.engine.connect().close()
+        metrics = self.pool_metrics.get_metrics()
+        self.assertEqual(metrics.get("checkouts"), 2)
+        self.assertEqual(metrics.get("connects"), 2)
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 from fastapi.testclient import TestClient
 
 from src.trackcase_service.main import app, get_db_session
+from src.trackcase_service.utils import constants
 
 
 class MainTest(unittest.TestCase):
@@ -21,3 +22,21 @@ class MainTest(unittest.TestCase):
         mock_session.assert_called_once()
 
         app.dependency_overrides.clear()
+
+    def test_prometheus_metrics(self):
+        client = TestClient(app)
+        auth = (constants.BASIC_AUTH_USR, constants.BASIC_AUTH_PWD)
+        client.get("/trackcase-service/admin/metrics/", auth=auth)
+        response = client.get("/trackcase-service/admin/metrics/", auth=auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'trackcase_http_requests_total{method="GET",'
+            'route="/trackcase-service/admin/metrics/",status="200"}',
+            response.text,
+        )
+        self.assertIn("trackcase_threadpool_threads_total", response.text)
+
+        response = client.get(
+            "/trackcase-service/admin/metrics/", auth=(auth[0], "wrong")
+        )
+        self.assertEqual(response.status_code, 401)
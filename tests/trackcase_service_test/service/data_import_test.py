@@ -0,0 +1,377 @@
+import hashlib
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup, SoupStrainer
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.trackcase_service.db import models
+from src.trackcase_service.service import schemas
+from src.trackcase_service.service.data_import import (
+    CourtsImport,
+    ImportJobRunner,
+    WebScraper,
+    extract_court_details,
+    extract_judges_details,
+    get_courts_import_service,
+    get_judges_import_service,
+)
+
+COURTS_HTML = """<html><body><div><p>page header</p>
+<table class="usa-table"><tr><th>Court</th><th>Status</th></tr>
+<tr><td class="views-field-nothing"><a href="/court-one">Court One</a>
+<p class="address"><span class="address-line1">1 Main St</span>
+<span class="locality">Denver</span><span class="administrative-area">CO</span>
+<span class="postal-code">80202</span></p></td>
+<td class="views-field-field-eoir-court-status">OPEN</td></tr></table>
+</div></body></html>"""
+JUDGES_HTML = """<html><body><div><h3>Court One Immigration Court</h3>
+<table><tr><th>Judge</th><th>Webex</th></tr>
+<tr><td>Judge One</td><td><a href="https://webex/one">webex</a></td></tr></table>
+</div></body></html>"""
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        content = self.server.pages.get(self.path).encode("utf-8")
+        self.server.request_headers.append(dict(self.headers))
+        etag = f'"{hashlib.sha256(content).hexdigest()}"' if self.server.etag else None
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class DataImportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        models.Base.metadata.create_all(self.engine)
+        self.db_session = sessionmaker(bind=self.engine)()
+        now = datetime.now()
+        self.db_session.add_all(
+            [
+                models.ComponentStatus(
+                    id=1,
+                    component_name="COURTS",
+                    status_name="OPEN",
+                    is_active=True,
+                    created=now,
+                    modified=now,
+                    is_deleted=False,
+                ),
+                models.Court(
+                    id=1,
+                    name="EXISTING COURT",
+                    court_url="URL",
+                    component_status_id=1,
+                    created=now,
+                    modified=now,
+                    is_deleted=False,
+                ),
+            ]
+        )
+        self.db_session.commit()
+
+        self.request = Request(scope={"type": "http"})
+        self.request.state.user_details = {"id": 1, "roles": [{"name": "SUPERUSER"}]}
+        self.statement_count = 0
+        event.listen(self.engine, "before_cursor_execute", self._count_statement)
+
+    def tearDown(self):
+        self.db_session.close()
+        self.engine.dispose()
+
+    def _count_statement(self, *args):
+        self.statement_count += 1
+
+    def test_insert_court_data(self):
+        court_requests = [
+            schemas.CourtRequest(
+                name=f"court {i}", court_url="URL", component_status_id=1
+            )
+            for i in range(100)
+        ]
+        court_requests.append(
+            schemas.CourtRequest(
+                name="existing court", court_url="NEW URL", component_status_id=1
+            )
+        )
+        courts_import = get_courts_import_service(self.db_session, self.request)
+        import_summary = courts_import.insert_court_data(court_requests)
+        self.assertEqual(
+            import_summary,
+            schemas.ImportSummary(created=100, updated=1, unchanged=0, failed=0),
+        )
+        # existing courts, then courts and history inserts and updates
+        self.assertLessEqual(self.statement_count, 5)
+        self.assertEqual(self.db_session.query(models.Court).count(), 101)
+        self.assertEqual(self.db_session.get(models.Court, 1).court_url, "NEW URL")
+        history_courts = self.db_session.query(models.HistoryCourt).all()
+        self.assertEqual(len(history_courts), 101)
+        self.assertEqual(history_courts[0].app_user_id, 1)
+        self.assertEqual(
+            len(courts_import.csv_reports.get("successes").splitlines()), 102
+        )
+
+        # nothing changed, only existing courts are read
+        self.statement_count = 0
+        import_summary = courts_import.insert_court_data(court_requests)
+        self.assertEqual(import_summary.unchanged, 101)
+        self.assertEqual(self.statement_count, 1)
+        self.assertEqual(self.db_session.query(models.HistoryCourt).count(), 101)
+
+    def test_insert_judge_data(self):
+        judge_requests = [
+            schemas.JudgeRequest(
+                name=f"judge {i}", webex=f"webex {i}", court_id=1, component_status_id=1
+            )
+            for i in range(10)
+        ]
+        judges_import = get_judges_import_service(self.db_session, self.request)
+        judges_import.insert_judge_data(judge_requests)
+        history_judges = self.db_session.query(models.HistoryJudge).all()
+        self.assertEqual(len(history_judges), 10)
+        self.assertEqual(
+            {history_judge.judge_id for history_judge in history_judges},
+            {judge.id for judge in self.db_session.query(models.Judge).all()},
+        )
+        self.assertNotIn("failures", judges_import.csv_reports)
+
+        # renamed judge is matched by webex
+        judge_requests[0] = schemas.JudgeRequest(
+            name="judge renamed", webex="webex 0", court_id=1, component_status_id=1
+        )
+        import_summary = judges_import.insert_judge_data(judge_requests)
+        self.assertEqual(
+            import_summary,
+            schemas.ImportSummary(created=0, updated=1, unchanged=9, failed=0),
+        )
+        self.assertEqual(self.db_session.query(models.Judge).count(), 10)
+
+    def test_import_courts_cache_entry(self):
+        soup = BeautifulSoup(COURTS_HTML, "html.parser")
+        courts_import = get_courts_import_service(self.db_session, self.request)
+        with (
+            patch.object(
+                WebScraper, "scrape", return_value=(soup, {"content_hash": "HASH"})
+            ),
+            patch.object(WebScraper, "write_cache_entry") as write_cache_entry,
+        ):
+            # failed rows, the page is scraped again next time
+            with patch.object(
+                courts_import,
+                "insert_court_data",
+                return_value=schemas.ImportSummary(failed=1),
+            ):
+                courts_import.import_courts()
+            write_cache_entry.assert_not_called()
+
+            import_summary = courts_import.import_courts()
+            self.assertEqual(import_summary.created, 1)
+            write_cache_entry.assert_called_once_with({"content_hash": "HASH"})
+
+
+class ImportJobRunnerTest(unittest.TestCase):
+
+    def setUp(self):
+        # file database, the job thread and the test use their own connections
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{self.temp_dir.name}/import.db")
+        models.Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.import_job_runner = ImportJobRunner(self.session_factory, 1, 1, 3600)
+        self.request = Request(scope={"type": "http"})
+        self.request.state.user_details = {"id": 1, "roles": [{"name": "SUPERUSER"}]}
+        self.import_started = threading.Event()
+        self.import_finish = threading.Event()
+
+    def tearDown(self):
+        self.import_finish.set()
+        self.import_job_runner.executor.shutdown(wait=True)
+        self.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def _import_courts(self, courts_import, is_force):
+        self.import_started.set()
+        self.import_finish.wait(5)
+        courts_import.csv_reports["successes"] = "name\nCOURT ONE\n"
+        return schemas.ImportSummary(created=1)
+
+    def _wait_for_job(self, job_id):
+        for _ in range(100):
+            import_job = self.import_job_runner.get_job(job_id)
+            if import_job.status in (
+                schemas.ImportJobStatus.COMPLETED,
+                schemas.ImportJobStatus.FAILED,
+            ):
+                return import_job
+            time.sleep(0.05)
+        self.fail(f"Import Job {job_id} Not Finished")
+
+    def test_submit(self):
+        with patch.object(
+            CourtsImport,
+            "import_courts",
+            autospec=True,
+            side_effect=self._import_courts,
+        ):
+            import_job = self.import_job_runner.submit(
+                schemas.ImportJobTypes.COURTS, self.request, False
+            )
+            self.assertEqual(import_job.status, schemas.ImportJobStatus.QUEUED)
+            self.import_started.wait(5)
+            # already running, same job is returned
+            import_job_again = self.import_job_runner.submit(
+                schemas.ImportJobTypes.COURTS, self.request, False
+            )
+            self.assertEqual(import_job_again.job_id, import_job.job_id)
+            self.assertEqual(import_job_again.status, schemas.ImportJobStatus.RUNNING)
+            # another worker process sees the same pending job
+            other_import_job_runner = ImportJobRunner(self.session_factory, 1, 1, 3600)
+            import_job_other = other_import_job_runner.submit(
+                schemas.ImportJobTypes.COURTS, self.request, False
+            )
+            self.assertEqual(import_job_other.job_id, import_job.job_id)
+
+            self.import_finish.set()
+            import_job = self._wait_for_job(import_job.job_id)
+        self.assertEqual(import_job.summary.created, 1)
+        self.assertEqual(import_job.reports, ["successes"])
+        self.assertEqual(import_job.app_user_id, 1)
+        self.assertEqual(
+            other_import_job_runner.get_csv_report(import_job.job_id, "successes"),
+            "name\nCOURT ONE\n",
+        )
+
+    def test_submit_failed(self):
+        with patch.object(
+            CourtsImport, "import_courts", side_effect=RuntimeError("Scrape Error")
+        ):
+            import_job = self.import_job_runner.submit(
+                schemas.ImportJobTypes.COURTS, self.request, False
+            )
+            import_job = self._wait_for_job(import_job.job_id)
+        self.assertEqual(import_job.status, schemas.ImportJobStatus.FAILED)
+        self.assertEqual(import_job.error, "Scrape Error")
+
+        # finished jobs over the limit are removed
+        with patch.object(
+            CourtsImport,
+            "import_courts",
+            autospec=True,
+            side_effect=self._import_courts,
+        ):
+            self.import_finish.set()
+            import_job_next = self.import_job_runner.submit(
+                schemas.ImportJobTypes.COURTS, self.request, False
+            )
+            self._wait_for_job(import_job_next.job_id)
+        self.assertIsNone(self.import_job_runner.get_job(import_job.job_id))
+
+    def test_submit_after_stale_job(self):
+        db_session = self.session_factory()
+        db_session.add(
+            models.ImportJob(
+                job_id="STALE",
+                job_type=schemas.ImportJobTypes.COURTS,
+                status=schemas.ImportJobStatus.RUNNING,
+                app_user_id=1,
+                created=datetime.now() - timedelta(hours=2),
+            )
+        )
+        db_session.commit()
+        db_session.close()
+
+        with patch.object(
+            CourtsImport, "import_courts", return_value=schemas.ImportSummary()
+        ):
+            import_job = self.import_job_runner.submit(
+                schemas.ImportJobTypes.COURTS, self.request, False
+            )
+            self.assertNotEqual(import_job.job_id, "STALE")
+            stale_job = self.import_job_runner.get_job("STALE")
+            self.assertEqual(stale_job.status, schemas.ImportJobStatus.FAILED)
+            self._wait_for_job(import_job.job_id)
+
+
+class WebScraperTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureRequestHandler)
+        self.server.pages = {"/courts": COURTS_HTML, "/judges": JUDGES_HTML}
+        self.server.request_headers = []
+        self.server.etag = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache_dir.cleanup()
+
+    def _get_web_scraper(self, path, parse_only=None):
+        return WebScraper(
+            self.base_url + path, parse_only=parse_only, cache_dir=self.cache_dir.name
+        )
+
+    def test_scrape_courts(self):
+        web_scraper = self._get_web_scraper(
+            "/courts", SoupStrainer("table", class_="usa-table")
+        )
+        soup, cache_entry = web_scraper.scrape()
+        self.assertIsNone(soup.find("p", string="page header"))
+        court_rows = soup.find("table", class_="usa-table").find_all("tr")[1:]
+        court_request = extract_court_details(court_rows[0], {"OPEN": 1})
+        self.assertEqual(court_request.name, "Court One Immigration Court")
+        self.assertEqual(court_request.zip_code, "80202")
+
+        # not imported yet, nothing is cached
+        self.assertIsNotNone(web_scraper.scrape()[0])
+        self.assertIsNone(self.server.request_headers[-1].get("If-None-Match"))
+
+        # conditional request, not modified
+        web_scraper.write_cache_entry(cache_entry)
+        self.assertIsNone(web_scraper.scrape()[0])
+        self.assertIsNotNone(self.server.request_headers[-1].get("If-None-Match"))
+        self.assertIsNotNone(web_scraper.scrape(is_force=True)[0])
+
+        self.server.pages["/courts"] = COURTS_HTML.replace("OPEN", "CLOSED")
+        self.assertIsNotNone(web_scraper.scrape()[0])
+
+    def test_scrape_judges(self):
+        self.server.etag = False
+        web_scraper = self._get_web_scraper("/judges", SoupStrainer(["h3", "table"]))
+        soup, cache_entry = web_scraper.scrape()
+        web_scraper.write_cache_entry(cache_entry)
+        judge_requests = extract_judges_details(
+            soup.find("h3"), {"COURT ONE IMMIGRATION COURT": 1}, 1
+        )
+        self.assertEqual(len(judge_requests), 1)
+        self.assertEqual(judge_requests[0].webex, "https://webex/one")
+
+        # no etag, same content hash
+        self.assertIsNone(web_scraper.scrape()[0])
@@ -0,0 +1,172 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from fastapi import Request
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.trackcase_service.db import models
+from src.trackcase_service.db.crud import DataKeys, unit_of_work
+from src.trackcase_service.service import history_service, schemas
+from src.trackcase_service.service.history_service import (
+    HistoryWriter,
+    get_history_service,
+)
+from src.trackcase_service.utils import constants
+
+
+class HistoryWriteBehindTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        models.Base.metadata.create_all(self.engine)
+        self.session_local = sessionmaker(bind=self.engine)
+        self.db_session = self.session_local()
+        now = datetime.now()
+        self.db_session.add(
+            models.Court(
+                id=1,
+                name="COURT",
+                court_url="URL",
+                component_status_id=1,
+                created=now,
+                modified=now,
+                is_deleted=False,
+            )
+        )
+        self.db_session.commit()
+
+        # queue of one, so a second record overflows to the outbox replay
+        self.writer = HistoryWriter(self.session_local, 1, 1, 0.1, 60)
+        self.request = Request(scope={"type": "http"})
+        self.request.state.user_details = {"id": 1}
+        patchers = [
+            patch.object(constants, "HISTORY_WRITE_BEHIND", True),
+            patch.object(history_service, "HISTORY_WRITER", self.writer),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.writer.shutdown()
+        self.db_session.close()
+        self.engine.dispose()
+
+    def _add_to_history(self, name: str):
+        get_history_service(self.db_session, models.HistoryCourt).add_to_history(
+            self.request,
+            schemas.CourtRequest(name=name, court_url="URL", component_status_id=1),
+            "court_id",
+            1,
+            "Court",
+            "HistoryCourt",
+        )
+
+    def _count(self, db_model) -> int:
+        db_session = self.session_local()
+        count = db_session.query(db_model).count()
+        db_session.close()
+        return count
+
+    def test_history_outbox_committed_with_entity(self):
+        with self.assertRaises(ValueError):
+            with unit_of_work(self.db_session):
+                self._add_to_history("ROLLED_BACK")
+                raise ValueError("rollback")
+        self.assertEqual(self._count(models.HistoryOutbox), 0)
+        self.assertTrue(self.writer.queue.empty())
+
+        with unit_of_work(self.db_session):
+            self._add_to_history("COMMITTED")
+            self.assertTrue(self.writer.queue.empty())
+        self.assertEqual(self._count(models.HistoryOutbox), 1)
+        self.assertEqual(self._count(models.HistoryCourt), 0)
+        self.assertEqual(self.writer.queue.qsize(), 1)
+
+        self.writer.flush()
+        self.assertEqual(self._count(models.HistoryOutbox), 0)
+        history_courts = self.session_local().query(models.HistoryCourt).all()
+        self.assertEqual(len(history_courts), 1)
+        self.assertEqual(history_courts[0].name, "COMMITTED")
+        self.assertEqual(history_courts[0].app_user_id, 1)
+        self.assertFalse(history_courts[0].is_deleted)
+        self.assertIsInstance(history_courts[0].created, datetime)
+
+    def test_history_outbox_committed_by_caller(self):
+        self._add_to_history("CALLER")
+        # not committed by history, the caller's commit carries it
+        self.assertTrue(self.db_session.in_transaction())
+        self.assertTrue(self.writer.queue.empty())
+        self.db_session.commit()
+        self.assertEqual(self.writer.queue.qsize(), 1)
+
+    def test_history_queue_overflow_replayed(self):
+        with unit_of_work(self.db_session):
+            self._add_to_history("QUEUED")
+            self._add_to_history("OVERFLOW")
+        self.assertEqual(self.writer.queue.qsize(), 1)
+
+        self.writer.flush()
+        self.assertEqual(self._count(models.HistoryCourt), 1)
+        self.assertEqual(self._count(models.HistoryOutbox), 1)
+        self.writer.replay_outbox()
+        self.assertEqual(self._count(models.HistoryCourt), 2)
+        self.assertEqual(self._count(models.HistoryOutbox), 0)
+
+    def test_history_replayed_not_written_again(self):
+        with unit_of_work(self.db_session):
+            self._add_to_history("REPLAYED")
+        self.writer.replay_outbox()
+        self.writer.flush()
+        self.assertEqual(self._count(models.HistoryCourt), 1)
+
+    def test_history_written_by_worker_and_on_shutdown(self):
+        # no replay, the worker and this test share the one sqlite connection
+        with patch.object(self.writer, "replay_outbox"):
+            self.writer.start()
+            with unit_of_work(self.db_session):
+                self._add_to_history("WORKER")
+            self.writer.shutdown()
+        self.assertEqual(self._count(models.HistoryOutbox), 0)
+        self.assertEqual(self._count(models.HistoryCourt), 1)
+        self.assertIsNone(self.writer.thread)
+
+    def test_delete_history_clears_cached_count_after_commit(self):
+        with unit_of_work(self.db_session):
+            self._add_to_history("DELETED")
+        self.writer.flush()
+        history_service = get_history_service(self.db_session, models.HistoryCourt)
+
+        def read_total_items():
+            return (
+                history_service.read(count_strategy=schemas.CountStrategy.CACHED)
+                .get(DataKeys.metadata)
+                .total_items
+            )
+
+        self.assertEqual(read_total_items(), 1)
+        history_service.delete_history_before_delete_object(
+            "history_court", "court_id", 1, "Court", "HistoryCourt"
+        )
+        self.assertEqual(read_total_items(), 1)
+        self.db_session.commit()
+        self.assertEqual(read_total_items(), 0)
+
+    def test_history_error_message(self):
+        with patch.object(
+            history_service.HistoryService,
+            "_add_to_history_outbox",
+            side_effect=RuntimeError("history error"),
+        ):
+            with self.assertRaisesRegex(Exception, "Court Action Successful! BUT!!"):
+                self._add_to_history("OUTSIDE")
+            with self.assertRaisesRegex(Exception, "Court Action Failed!"):
+                with unit_of_work(self.db_session):
+                    self._add_to_history("INSIDE")
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import bcrypt
+from fastapi import BackgroundTasks, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.trackcase_service.db import models
+from src.trackcase_service.service.user_management import get_user_password_service
+
+
+class LoginUserTest(unittest.TestCase):
+
+    def setUp(self):
+        # file database, last_login is updated from its own session
+        db_file, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(db_file)
+        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        models.Base.metadata.create_all(self.engine)
+        self.session_local = sessionmaker(bind=self.engine)
+        now = datetime.now()
+        table_base = {"created": now, "modified": now, "is_deleted": False}
+        password = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)).decode()
+        db_session = self.session_local()
+        db_session.add_all(
+            [
+                models.ComponentStatus(
+                    id=1,
+                    component_name="APP_USERS",
+                    status_name="ACTIVE",
+                    is_active=True,
+                    **table_base,
+                ),
+                models.AppPermission(
+                    id=1, name="COURTS_READ", description="READ", **table_base
+                ),
+                models.AppPermission(
+                    id=2, name="JUDGES_READ", description="READ", **table_base
+                ),
+                models.AppRole(id=1, name="STANDARD", description="ROLE", **table_base),
+                models.AppRole(id=2, name="GUEST", description="ROLE", **table_base),
+                models.AppUser(
+                    id=1,
+                    email="USER@EMAIL.COM",
+                    password=password,
+                    full_name="USER",
+                    is_validated=True,
+                    component_status_id=1,
+                    **table_base,
+                ),
+            ]
+        )
+        db_session.flush()
+        db_session.add_all(
+            [
+                models.AppRolePermission(
+                    app_role_id=1, app_permission_id=1, **table_base
+                ),
+                models.AppRolePermission(
+                    app_role_id=1, app_permission_id=2, **table_base
+                ),
+                models.AppRolePermission(
+                    app_role_id=2, app_permission_id=2, **table_base
+                ),
+                models.AppUserRole(app_user_id=1, app_role_id=1, **table_base),
+                models.AppUserRole(app_user_id=1, app_role_id=2, **table_base),
+            ]
+        )
+        db_session.commit()
+        db_session.close()
+
+        self.statement_count = 0
+        event.listen(self.engine, "before_cursor_execute", self._count_statement)
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def _count_statement(self, *args):
+        self.statement_count += 1
+
+    def test_login_user(self):
+        background_tasks = BackgroundTasks()
+        db_session = self.session_local()
+        login_response = get_user_password_service(
+            "password", "user@email.com"
+        ).login_user(Request(scope={"type": "http"}), db_session, background_tasks)
+        db_session.close()
+        self.assertEqual(self.statement_count, 1)
+
+        app_user_token = login_response.app_user_details.to_token()
+        self.assertEqual(app_user_token.get("status").get("name"), "ACTIVE")
+        self.assertEqual(
+            {
+                role.get("name"): [
+                    permission.get("name") for permission in role.get("permissions")
+                ]
+                for role in app_user_token.get("roles")
+            },
+            {"STANDARD": ["COURTS_READ", "JUDGES_READ"], "GUEST": ["JUDGES_READ"]},
+        )
+        self.assertIsNotNone(login_response.token)
+
+        asyncio.run(background_tasks())
+        db_session = self.session_local()
+        app_user = db_session.get(models.AppUser, 1)
+        self.assertEqual(
+            app_user.last_login, login_response.app_user_details.last_login
+        )
+        db_session.close()
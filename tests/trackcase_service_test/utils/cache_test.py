@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.trackcase_service.db import models
+from src.trackcase_service.utils.cache import (
+    AuthTokenCache,
+    LocalCacheBackend,
+    RefTypeCache,
+    RevokedTokenBackend,
+    SharedCacheBackend,
+    clear_total_items_cache,
+    get_table_generations,
+    set_ref_types_cache_backend,
+    share_table_generations,
+)
+
+
+class RefTypeCacheTest(unittest.TestCase):
+    def test_get_refills_once(self):
+        ref_type_cache = RefTypeCache()
+        loader_calls = []
+
+        def loader():
+            loader_calls.append(1)
+            time.sleep(0.05)
+            return ["ONE", "TWO"]
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(ref_type_cache.get("KEY", loader))
+            )
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(loader_calls), 1)
+        self.assertEqual(results, [("ONE", "TWO")] * 10)
+        self.assertEqual(ref_type_cache.get_metrics()["KEY"]["refills"], 1)
+
+    def test_get_async_refills_once(self):
+        ref_type_cache = RefTypeCache()
+        loader_calls = []
+
+        async def loader():
+            loader_calls.append(1)
+            await asyncio.sleep(0.05)
+            return ["ONE", "TWO"]
+
+        async def get_all():
+            return await asyncio.gather(
+                *(ref_type_cache.get_async("KEY", loader) for _ in range(10))
+            )
+
+        results = asyncio.run(get_all())
+        self.assertEqual(len(loader_calls), 1)
+        self.assertEqual(results, [("ONE", "TWO")] * 10)
+        self.assertEqual(ref_type_cache.get_metrics()["KEY"]["refills"], 1)
+        # the snapshot is shared with sync callers
+        self.assertEqual(ref_type_cache.get("KEY"), ("ONE", "TWO"))
+
+    def test_get_async_polls_off_the_event_loop(self):
+        poll_threads = []
+
+        class Backend(LocalCacheBackend):
+            poll_interval_seconds = 60
+
+            def get_versions(self):
+                poll_threads.append(threading.current_thread())
+                return {"KEY": 2}
+
+        ref_type_cache = RefTypeCache(backend=Backend())
+        ref_type_cache.set("KEY", ["OLD"])
+
+        async def get_twice():
+            # the first get polls, the second one is within the poll interval
+            return [await ref_type_cache.get_async("KEY") for _ in range(2)]
+
+        self.assertEqual(asyncio.run(get_twice()), [(), ()])
+        self.assertEqual(len(poll_threads), 1)
+        self.assertIsNot(poll_threads[0], threading.current_thread())
+
+    def test_clear_drops_refill_started_before(self):
+        ref_type_cache = RefTypeCache()
+
+        def loader():
+            # a write happens while the refill is reading
+            ref_type_cache.clear("KEY")
+            return ["OLD"]
+
+        self.assertEqual(ref_type_cache.get("KEY", loader), ("OLD",))
+        self.assertEqual(ref_type_cache.get("KEY"), ())
+        self.assertEqual(ref_type_cache.get("KEY", lambda: ["NEW"]), ("NEW",))
+        self.assertEqual(ref_type_cache.get("KEY"), ("NEW",))
+
+    def test_get_expired(self):
+        ref_type_cache = RefTypeCache(ttl_seconds=0.01)
+        ref_type_cache.set("KEY", ["ONE"])
+        self.assertEqual(ref_type_cache.get("KEY"), ("ONE",))
+        time.sleep(0.02)
+        self.assertEqual(ref_type_cache.get("KEY"), ())
+
+    def test_get_index_built_once_per_snapshot(self):
+        ref_type_cache = RefTypeCache()
+        builder_calls = []
+
+        def builder(snapshot):
+            builder_calls.append(1)
+            return frozenset(snapshot)
+
+        ref_type_cache.set("KEY", ["ONE", "TWO"])
+        self.assertEqual(ref_type_cache.get_index("KEY", builder), {"ONE", "TWO"})
+        self.assertEqual(ref_type_cache.get_index("KEY", builder), {"ONE", "TWO"})
+        self.assertEqual(len(builder_calls), 1)
+        ref_type_cache.clear("KEY")
+        self.assertEqual(
+            ref_type_cache.get_index("KEY", builder, lambda: ["THREE"]), {"THREE"}
+        )
+        self.assertEqual(len(builder_calls), 2)
+
+
+class SharedCacheBackendTest(unittest.TestCase):
+    def setUp(self):
+        # both caches use the same database, like two workers would
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        models.CacheVersion.__table__.create(self.engine)
+        session_factory = sessionmaker(bind=self.engine)
+        self.ref_type_cache_one = RefTypeCache(
+            backend=SharedCacheBackend(session_factory, 0)
+        )
+        self.ref_type_cache_two = RefTypeCache(
+            backend=SharedCacheBackend(session_factory, 0)
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_clear_clears_other_processes(self):
+        self.assertEqual(self.ref_type_cache_one.get("KEY", lambda: ["ONE"]), ("ONE",))
+        self.assertEqual(self.ref_type_cache_two.get("KEY", lambda: ["ONE"]), ("ONE",))
+
+        self.ref_type_cache_one.clear("KEY")
+
+        self.assertEqual(self.ref_type_cache_two.get("KEY"), ())
+        self.assertEqual(self.ref_type_cache_two.get("KEY", lambda: ["TWO"]), ("TWO",))
+        self.assertEqual(self.ref_type_cache_one.get("KEY", lambda: ["TWO"]), ("TWO",))
+        # the process that cleared doesn't clear again on its next sync
+        self.assertEqual(self.ref_type_cache_one.get("KEY"), ("TWO",))
+        self.assertEqual(self.ref_type_cache_one.get_metrics()["KEY"]["refills"], 2)
+
+        self.ref_type_cache_two.clear("KEY")
+        self.assertEqual(self.ref_type_cache_one.get("KEY"), ())
+
+
+class TableGenerationsTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        models.CacheVersion.__table__.create(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        set_ref_types_cache_backend(SharedCacheBackend(self.session_factory, 0))
+        share_table_generations(("shared_table",))
+
+    def tearDown(self):
+        set_ref_types_cache_backend(LocalCacheBackend())
+        self.engine.dispose()
+
+    def test_generations_changed_by_other_processes(self):
+        generations = get_table_generations(("shared_table", "other_table"))
+        clear_total_items_cache("shared_table")
+        local_generations = get_table_generations(("shared_table", "other_table"))
+        self.assertNotEqual(local_generations[0], generations[0])
+
+        # another process writes to the table, seen on the next poll
+        SharedCacheBackend(self.session_factory, 0).publish("table_shared_table")
+        remote_generations = get_table_generations(("shared_table", "other_table"))
+        self.assertNotEqual(remote_generations[0], local_generations[0])
+        self.assertEqual(remote_generations[1], generations[1])
+
+
+class AuthTokenCacheTest(unittest.TestCase):
+    def test_get_least_recently_used_dropped(self):
+        auth_token_cache = AuthTokenCache(2)
+        expires_at = time.time() + 60
+        auth_token_cache.set("one", {"id": 1}, expires_at)
+        auth_token_cache.set("two", {"id": 2}, expires_at)
+        self.assertEqual(auth_token_cache.get("one"), {"id": 1})
+        auth_token_cache.set("three", {"id": 3}, expires_at)
+        self.assertIsNone(auth_token_cache.get("two"))
+        self.assertEqual(auth_token_cache.get("three"), {"id": 3})
+        self.assertEqual(
+            auth_token_cache.get_metrics(),
+            {"hits": 2, "misses": 1, "size": 2, "denied": 0},
+        )
+
+    def test_get_expired_and_denied(self):
+        auth_token_cache = AuthTokenCache(2)
+        auth_token_cache.set("expired", {"id": 1}, time.time() - 1)
+        self.assertIsNone(auth_token_cache.get("expired"))
+
+        auth_token_cache.set("denied", {"id": 2}, time.time() + 60)
+        auth_token_cache.revoke("denied", time.time() + 60)
+        self.assertTrue(auth_token_cache.is_denied("denied"))
+        self.assertIsNone(auth_token_cache.get("denied"))
+        auth_token_cache.set("denied", {"id": 2}, time.time() + 60)
+        self.assertIsNone(auth_token_cache.get("denied"))
+
+
+class RevokedTokenBackendTest(unittest.TestCase):
+    def setUp(self):
+        # both caches use the same database, like two workers would
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        models.RevokedToken.__table__.create(self.engine)
+        session_factory = sessionmaker(bind=self.engine)
+        self.auth_token_cache_one = AuthTokenCache(
+            2, RevokedTokenBackend(session_factory, 0)
+        )
+        self.auth_token_cache_two = AuthTokenCache(
+            2, RevokedTokenBackend(session_factory, 0)
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_revoke_denied_by_other_processes(self):
+        expires_at = time.time() + 60
+        self.auth_token_cache_two.set("revoked", {"id": 1}, expires_at)
+        self.assertFalse(self.auth_token_cache_two.is_denied("revoked"))
+
+        self.auth_token_cache_one.revoke("revoked", expires_at)
+        # logging out again is not an error
+        self.auth_token_cache_one.revoke("revoked", expires_at)
+        self.auth_token_cache_one.revoke("expired", time.time() - 1)
+
+        self.assertTrue(self.auth_token_cache_two.is_denied("revoked"))
+        self.assertIsNone(self.auth_token_cache_two.get("revoked"))
+        self.assertFalse(self.auth_token_cache_two.is_denied("expired"))
+        self.assertEqual(self.auth_token_cache_two.get_metrics().get("denied"), 1)
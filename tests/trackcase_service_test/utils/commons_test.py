@@ -1,4 +1,96 @@
-from fastapi import FastAPI, Request
+import unittest
+from unittest.mock import patch
+
+import jwt
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.trackcase_service.service import schemas
+from src.trackcase_service.utils import commons
+from src.trackcase_service.utils.cache import get_auth_token_cache
 
 app = FastAPI()
 dummy_request = Request(scope={"type": "http", "app": app})
+
+
+class AuthCredentialsTest(unittest.TestCase):
+    def setUp(self):
+        get_auth_token_cache().clear()
+        app_user = schemas.AppUser.model_construct(
+            id=1, email="user@email.com", full_name="User", app_roles=[]
+        )
+        with patch.object(schemas.AppUser, "to_token", return_value={"id": 1}):
+            token = commons.encode_auth_credentials(app_user)
+        self.http_auth_credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=token
+        )
+
+    def tearDown(self):
+        get_auth_token_cache().clear()
+
+    def _decode(self) -> Request:
+        request = Request(
+            scope={"type": "http", "app": app, "path": "/", "headers": []}
+        )
+        commons.decode_auth_credentials(request, self.http_auth_credentials)
+        return request
+
+    def test_decode_auth_credentials_cached(self):
+        with patch.object(commons.jwt, "decode", wraps=jwt.decode) as jwt_decode:
+            self.assertEqual(commons.get_auth_user_token(self._decode()), {"id": 1})
+            self.assertEqual(commons.get_auth_user_token(self._decode()), {"id": 1})
+        self.assertEqual(jwt_decode.call_count, 1)
+        self.assertEqual(get_auth_token_cache().get_metrics().get("hits"), 1)
+
+    def test_decode_auth_credentials_revoked(self):
+        self._decode()
+        commons.revoke_auth_credentials(dummy_request, self.http_auth_credentials)
+        with self.assertRaises(HTTPException) as context:
+            self._decode()
+        self.assertEqual(context.exception.status_code, 401)
+
+
+class PermissionsService:
+    @commons.check_permissions("COURTS_READ")
+    def read(self, request: Request, court_id: int = None):
+        return court_id
+
+
+class PermissionsTest(unittest.TestCase):
+    @staticmethod
+    def _get_request(roles: list) -> Request:
+        request = Request(
+            scope={"type": "http", "app": app, "path": "/", "headers": []}
+        )
+        commons.set_auth_user_token(request, {"roles": roles})
+        return request
+
+    def test_has_permission_compiled_once(self):
+        request = self._get_request(
+            [
+                {"name": "STANDARD", "permissions": [{"name": "COURTS_READ"}]},
+                {"name": "GUEST", "permissions": [{"name": "JUDGES_READ"}]},
+            ]
+        )
+        self.assertTrue(commons.has_permission("COURTS_READ", request))
+        self.assertTrue(commons.has_permission("JUDGES_READ", request))
+        self.assertFalse(commons.has_permission("COURTS_CREATE", request))
+        self.assertEqual(
+            request.state.user_permissions,
+            (False, frozenset({"COURTS_READ", "JUDGES_READ"})),
+        )
+
+        superuser_request = self._get_request([{"name": "SUPERUSER"}])
+        self.assertTrue(commons.has_permission("COURTS_CREATE", superuser_request))
+
+    def test_check_permissions_request_position(self):
+        permissions_service = PermissionsService()
+        request = self._get_request(
+            [{"name": "STANDARD", "permissions": [{"name": "COURTS_READ"}]}]
+        )
+        self.assertEqual(permissions_service.read(request, 1), 1)
+        self.assertEqual(permissions_service.read(request=request, court_id=2), 2)
+
+        with self.assertRaises(HTTPException) as context:
+            permissions_service.read(self._get_request([]), 3)
+        self.assertEqual(context.exception.status_code, 403)
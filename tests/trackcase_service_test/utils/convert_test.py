@@ -0,0 +1,44 @@
+import unittest
+
+from src.trackcase_service.db import models
+from src.trackcase_service.service import schemas
+from src.trackcase_service.utils.convert import (
+    convert_data_model_to_schema,
+    convert_schema_to_model,
+    create_default_schema_instance,
+)
+
+
+class ConvertTest(unittest.TestCase):
+    def test_convert_data_model_to_schema(self):
+        client = models.Client(
+            id=1, name=" client one ", a_number="", component_status_id=1
+        )
+        client_schema = convert_data_model_to_schema(
+            client, schemas.Client, exclusions=["court_cases", "history_clients"]
+        )
+        self.assertEqual(client_schema.id, 1)
+        self.assertEqual(client_schema.name, "CLIENT ONE")
+        self.assertIsNone(client_schema.a_number)
+        self.assertEqual(client_schema.component_status_id, 1)
+        self.assertEqual(client_schema.court_cases, [])
+
+    def test_convert_schema_to_model(self):
+        client_request = schemas.ClientRequest(
+            name=" client ", component_status_id=1, comments="note"
+        )
+        client = convert_schema_to_model(
+            client_request, models.HistoryClient, 2, "client_id", 3
+        )
+        self.assertEqual(client.name, "CLIENT")
+        self.assertEqual(client.comments, "NOTE")
+        self.assertEqual(client.app_user_id, 2)
+        self.assertEqual(client.client_id, 3)
+
+    def test_create_default_schema_instance(self):
+        client_one = create_default_schema_instance(schemas.Client)
+        client_two = create_default_schema_instance(schemas.Client)
+        self.assertEqual(client_one.name, "")
+        self.assertEqual(client_one.component_status_id, 0)
+        self.assertEqual(client_one.model_fields_set, set(schemas.Client.model_fields))
+        self.assertIsNot(client_one.court_cases, client_two.court_cases)
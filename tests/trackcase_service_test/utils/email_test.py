@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fastapi import Request
+
+from src.trackcase_service.utils.email import Email, EmailSender
+
+
+class FakeMailjetHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        content = self.rfile.read(int(self.headers.get("Content-Length")))
+        self.server.requests.append(json.loads(content))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class EmailSenderTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeMailjetHandler)
+        self.server.requests = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.email_sender = EmailSender(
+            f"http://127.0.0.1:{self.server.server_port}/v3.1/send",
+            ("public", "private"),
+            max_queue_size=3,
+            batch_size=2,
+            max_retries=2,
+            retry_backoff_seconds=0.01,
+            timeout_seconds=5,
+        )
+
+    def tearDown(self):
+        self.email_sender.shutdown()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _wait_for_sent(self, count: int):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            metrics = self.email_sender.get_metrics()
+            if metrics.get("sent") + metrics.get("failed") >= count:
+                return
+            time.sleep(0.01)
+
+    def test_send_batched_and_retried(self):
+        # first send fails with a server error, then succeeds
+        self.server.statuses = [503]
+        # worker not started, the queued messages go as one batch on flush
+        for index in range(2):
+            self.email_sender.queue.put_nowait({"Subject": f"EMAIL_{index}"})
+        self.email_sender.flush()
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(
+            [message.get("Subject") for message in self.server.requests[1]["Messages"]],
+            ["EMAIL_0", "EMAIL_1"],
+        )
+        self.assertEqual(
+            self.email_sender.get_metrics(),
+            {"sent": 2, "failed": 0, "retried": 1, "batches": 1, "queued": 0},
+        )
+
+    def test_send_client_error_not_retried(self):
+        self.server.statuses = [400]
+        self.assertTrue(self.email_sender.enqueue({"Subject": "BAD"}))
+        self._wait_for_sent(1)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.email_sender.get_metrics().get("failed"), 1)
+
+    def test_app_user_reset_email_queued(self):
+        request = Request(
+            scope={
+                "type": "http",
+                "scheme": "http",
+                "server": ("localhost", 80),
+                "path": "/",
+                "headers": [],
+            }
+        )
+        Email(self.email_sender).app_user_reset_email(request, "user@email.com")
+        self._wait_for_sent(1)
+        message = self.server.requests[0]["Messages"][0]
+        self.assertEqual(message.get("To")[0].get("Email"), "user@email.com")
+        self.assertIn("reset_mid/?to_reset=", message.get("HTMLPart"))
@@ -0,0 +1,84 @@
+import io
+import json
+import logging
+import sys
+import unittest
+
+from src.trackcase_service.utils.logger import (
+    JsonFormatter,
+    Logger,
+    LoggingBackend,
+    PreparedQueueHandler,
+)
+
+
+class LoggerTest(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        stream_handler = logging.StreamHandler(self.stream)
+        stream_handler.setFormatter(JsonFormatter())
+        self.logging_backend = LoggingBackend("INFO")
+        self.logging_backend.handlers = [stream_handler]
+        self.logger = logging.getLogger("trackcase_service_test.logger")
+        self.logger.propagate = False
+
+    def tearDown(self):
+        self.logging_backend.stop()
+        self.logger.handlers.clear()
+
+    def _get_log_entries(self) -> list[dict]:
+        # stop drains the queue, the listener writes off the calling thread
+        self.logging_backend.stop()
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_json_lines_and_log_level(self):
+        self.logging_backend.add_logger(self.logger)
+        extra = {"status_code": 200}
+        self.logger.info("INFO %s", "ARG", extra={"extra": extra})
+        extra["status_code"] = 500
+        self.logger.debug("DEBUG", extra={"extra": None})
+        self.logging_backend.set_log_level("DEBUG")
+        self.logger.debug("DEBUG", extra={"extra": None})
+        try:
+            raise ValueError("error")
+        except ValueError as ex:
+            self.logger.error("ERROR", extra={"extra": ex}, exc_info=sys.exc_info())
+
+        log_entries = self._get_log_entries()
+        self.assertEqual(
+            [entry.get("level") for entry in log_entries],
+            [
+                "INFO",
+                "DEBUG",
+                "ERROR",
+            ],
+        )
+        self.assertEqual(log_entries[0].get("extra"), {"status_code": 200})
+        self.assertEqual(log_entries[0].get("message"), "INFO ARG")
+        self.assertEqual(log_entries[0].get("logger"), self.logger.name)
+        self.assertEqual(log_entries[2].get("extra"), "error")
+        self.assertIn("ValueError: error", log_entries[2].get("exception"))
+        self.assertEqual(self.logging_backend.get_log_level(), "DEBUG")
+
+    def test_child_logger_written_once(self):
+        child_logger = logging.getLogger(self.logger.name + ".child")
+        self.addCleanup(child_logger.handlers.clear)
+        self.logging_backend.add_logger(self.logger)
+        self.logging_backend.add_logger(child_logger)
+        child_logger.error("CHILD", extra={"extra": None})
+
+        log_entries = self._get_log_entries()
+        self.assertEqual(len(log_entries), 1)
+        self.assertEqual(log_entries[0].get("logger"), child_logger.name)
+
+    def test_prepare_resolves_message(self):
+        record = logging.makeLogRecord(
+            {"msg": "MESSAGE %s", "args": ("ARG",), "extra": object()}
+        )
+        prepared_record = PreparedQueueHandler(None).prepare(record)
+        self.assertEqual(prepared_record.getMessage(), "MESSAGE ARG")
+        self.assertIsInstance(prepared_record.extra, str)
+
+    def test_is_sampled(self):
+        self.assertTrue(Logger(self.logger).is_sampled())
+        self.assertFalse(Logger(self.logger, 0).is_sampled())
@@ -0,0 +1,34 @@
+import unittest
+from types import SimpleNamespace
+
+from src.trackcase_service.utils.metrics import MetricsRegistry
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_render(self):
+        metrics_registry = MetricsRegistry((0.1, 1.0, float("inf")))
+        route = SimpleNamespace(path="/clients/client/{client_id}/")
+        for seconds, status_code in ((0.05, 200), (0.1, 200), (0.5, 404), (5, 500)):
+            metrics_registry.request_started()
+            metrics_registry.request_finished("GET", route, status_code, seconds)
+        metrics_registry.request_started()
+        metrics_registry.request_finished("GET", None, 404, 0.01)
+        metrics_registry.request_started()
+
+        lines = metrics_registry.render(2, 40).splitlines()
+        labels = 'method="GET",route="/clients/client/{client_id}/"'
+        for line in (
+            f'trackcase_http_request_duration_seconds_bucket{{{labels},le="0.1"}} 2',
+            f'trackcase_http_request_duration_seconds_bucket{{{labels},le="1.0"}} 3',
+            f'trackcase_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 4',
+            f"trackcase_http_request_duration_seconds_sum{{{labels}}} 5.65",
+            f"trackcase_http_request_duration_seconds_count{{{labels}}} 4",
+            f'trackcase_http_requests_total{{{labels},status="200"}} 2',
+            f'trackcase_http_requests_total{{{labels},status="500"}} 1',
+            'trackcase_http_requests_total{method="GET",route="UNMATCHED",'
+            'status="404"} 1',
+            "trackcase_http_requests_in_flight 1",
+            "trackcase_threadpool_threads_busy 2",
+            "trackcase_threadpool_threads_total 40",
+        ):
+            self.assertIn(line, lines)
@@ -0,0 +1,45 @@
+import threading
+import unittest
+
+from src.trackcase_service.utils.password import (
+    PasswordHashExecutor,
+    PasswordHashOverloadError,
+    hash_password,
+    verify_password,
+)
+
+
+class PasswordHashExecutorTest(unittest.TestCase):
+    def test_run_in_worker_process(self):
+        password_hash_executor = PasswordHashExecutor(1, 1)
+        self.addCleanup(password_hash_executor.shutdown)
+        hashed_password = password_hash_executor.run(hash_password, "password", 4)
+        self.assertTrue(
+            password_hash_executor.verify_password("password", hashed_password)
+        )
+        self.assertFalse(verify_password("wrong", hashed_password))
+        self.assertEqual(password_hash_executor.get_metrics().get("completed"), 2)
+
+    def test_run_rejected_when_full(self):
+        password_hash_executor = PasswordHashExecutor(0, 1)
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_hash():
+            started.set()
+            release.wait(5)
+
+        thread = threading.Thread(
+            target=password_hash_executor.run, args=(blocking_hash,)
+        )
+        thread.start()
+        started.wait(5)
+        with self.assertRaises(PasswordHashOverloadError):
+            password_hash_executor.run(hash_password, "password", 4)
+        release.set()
+        thread.join()
+
+        self.assertTrue(password_hash_executor.run(hash_password, "password", 4))
+        self.assertEqual(
+            password_hash_executor.get_metrics(),
+            {"completed": 2, "rejected": 1, "max_workers": 0, "max_pending": 1},
+        )